@@ -94,6 +94,97 @@ class OwnerGroup(commands.Cog):
 
     extract_rarities.extras = {"category": "Owner"}
 
+    # 🟣────────────────────────────────────────────
+    #      💜 /owner perf 💜
+    # 🟣────────────────────────────────────────────
+    @owner_group.command(
+        name="perf",
+        description="Shows call counts, errors and latency of listener handlers and loop checkers",
+    )
+    @app_commands.describe(
+        sort_by="Stat to rank the handlers by",
+        limit="How many handlers to show (max 30)",
+        reset="Reset all stats after showing them",
+    )
+    @khy_only()
+    async def perf_stats(
+        self,
+        interaction: discord.Interaction,
+        sort_by: Literal["p50", "p95", "p99", "max", "mean", "calls", "errors"] = "p99",
+        limit: int = 15,
+        reset: bool = False,
+    ):
+        slash_cmd_name = "owner perf"
+
+        await run_command_safe(
+            bot=self.bot,
+            interaction=interaction,
+            slash_cmd_name=slash_cmd_name,
+            command_func=perf_stats_func,
+            sort_by=sort_by,
+            limit=limit,
+            reset=reset,
+        )
+
+    perf_stats.extras = {"category": "Owner"}
+
+    # 🟣────────────────────────────────────────────
+    #      💜 /owner capture 💜
+    # 🟣────────────────────────────────────────────
+    @owner_group.command(
+        name="capture",
+        description="Records listener traffic for the offline replay benchmark",
+    )
+    @app_commands.describe(
+        action="Start or stop capturing, or show the current status",
+        max_minutes="Stop automatically after this many minutes",
+    )
+    @khy_only()
+    async def listener_capture(
+        self,
+        interaction: discord.Interaction,
+        action: Literal["start", "stop", "status"] = "status",
+        max_minutes: int = 30,
+    ):
+        slash_cmd_name = "owner capture"
+
+        await run_command_safe(
+            bot=self.bot,
+            interaction=interaction,
+            slash_cmd_name=slash_cmd_name,
+            command_func=listener_capture_func,
+            action=action,
+            max_minutes=max_minutes,
+        )
+
+    listener_capture.extras = {"category": "Owner"}
+
+    # 🟣────────────────────────────────────────────
+    #      💜 /owner db-pool 💜
+    # 🟣────────────────────────────────────────────
+    @owner_group.command(
+        name="db-pool",
+        description="Shows Postgres pool waits, connection holds and slow queries",
+    )
+    @app_commands.describe(reset="Reset all pool stats after showing them")
+    @khy_only()
+    async def db_pool_stats(
+        self,
+        interaction: discord.Interaction,
+        reset: bool = False,
+    ):
+        slash_cmd_name = "owner db-pool"
+
+        await run_command_safe(
+            bot=self.bot,
+            interaction=interaction,
+            slash_cmd_name=slash_cmd_name,
+            command_func=db_pool_stats_func,
+            reset=reset,
+        )
+
+    db_pool_stats.extras = {"category": "Owner"}
+
     # 🟣────────────────────────────────────────────
     #     💜 Owner Test Command Group 💜
     # ─────────────────────────────────────────────
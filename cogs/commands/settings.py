@@ -16,41 +16,39 @@ from utils.essentials.role_checks import *
 from utils.loggers.pretty_logs import pretty_log
 
 
-# -------------------- Cache reload helpers --------------------
-async def reload_timer_cache(bot: commands.Bot):
-    from utils.cache.timers_cache import load_timer_cache
-
-    await load_timer_cache(bot=bot)
-
-
-async def reload_ball_reco_cache(bot: commands.Bot):
-    from utils.cache.ball_reco_cache import load_ball_reco_cache
-
-    await load_ball_reco_cache(bot=bot)
-
-
-async def reload_held_item_cache(bot: commands.Bot):
-    from utils.cache.held_item_cache import load_held_item_cache
-
-    await load_held_item_cache(bot=bot)
-
-
-async def reload_reminders_cache(bot: commands.Bot):
-    from utils.cache.reminders_cache import load_user_reminders_cache
-
-    await load_user_reminders_cache(bot=bot)
-
-
-async def reload_captcha_alert_cache(bot: commands.Bot):
-    from utils.cache.user_captcha_alert_cache import load_user_captcha_alert_cache
-
-    await load_user_captcha_alert_cache(bot=bot)
-
-
-async def reload_res_fossil_cache(bot: commands.Bot):
-    from utils.cache.res_fossil_cache import load_res_fossils_alert_cache
-
-    await load_res_fossils_alert_cache(bot=bot)
+# -------------------- Cache refresh helper --------------------
+# Registered names of the caches the settings view reads
+SETTINGS_CACHE_NAMES = [
+    "Timers",
+    "Ball Recon",
+    "Held Items",
+    "Reminders",
+    "Captcha Alerts",
+    "Res Fossils Alerts",
+]
+
+
+async def refresh_user_settings(bot: commands.Bot, user_id: int):
+    """Re-reads this user's rows of every settings cache in one round-trip."""
+    from utils.cache.cache_notify import refresh_user_rows
+
+    await refresh_user_rows(bot, user_id, cache_names=SETTINGS_CACHE_NAMES)
+
+
+def read_user_settings(category: str, user_id: int):
+    if category == "alerts":
+        return {
+            "captcha_alert": user_captcha_alert_cache.get(user_id),
+            "res_fossil_alert": res_fossils_alert_cache.get(user_id),
+        }
+    cache = {
+        "timer": timer_cache,
+        "captcha_alert": user_captcha_alert_cache,
+        "ball_reco": ball_reco_cache,
+        "held_items": held_item_cache,
+        "reminders": user_reminders_cache,
+    }.get(category)
+    return cache.get(user_id) if cache is not None else None
 
 
 # -------------------- Dropdown for settings --------------------
@@ -82,47 +80,11 @@ class SettingsDropdown(discord.ui.Select):
             user_id = self.user_id
             category = self.values[0]
 
-            # --- Fetch cached data & reload if missing ---
-            data = None
-            if category == "timer":
-                data = timer_cache.get(user_id)
-                if not data:
-                    await reload_timer_cache(self.bot)
-                    data = timer_cache.get(user_id)
-            elif category == "captcha_alert":
-                data = user_captcha_alert_cache.get(user_id)
-                if not data:
-                    await reload_captcha_alert_cache(self.bot)
-                    data = user_captcha_alert_cache.get(user_id)
-
-            elif category == "ball_reco":
-                data = ball_reco_cache.get(user_id)
-                if not data:
-                    await reload_ball_reco_cache(self.bot)
-                    data = ball_reco_cache.get(user_id)
-            elif category == "held_items":
-                data = held_item_cache.get(user_id)
-                if not data:
-                    await reload_held_item_cache(self.bot)
-                    data = held_item_cache.get(user_id)
-            elif category == "reminders":
-                data = user_reminders_cache.get(user_id)
-                if not data:
-                    await reload_reminders_cache(self.bot)
-                    data = user_reminders_cache.get(user_id)
-            elif category == "alerts":
-                captcha_data = user_captcha_alert_cache.get(user_id)
-                if not captcha_data:
-                    await reload_captcha_alert_cache(self.bot)
-                    captcha_data = user_captcha_alert_cache.get(user_id)
-                res_fossil_data = res_fossils_alert_cache.get(user_id)
-                if not res_fossil_data:
-                    await reload_res_fossil_cache(self.bot)
-                    res_fossil_data = res_fossils_alert_cache.get(user_id)
-                data = {
-                    "captcha_alert": captcha_data,
-                    "res_fossil_alert": res_fossil_data,
-                }
+            # --- Fetch cached data, refresh this user's rows if missing ---
+            data = read_user_settings(category, user_id)
+            if not data or (category == "alerts" and not all(data.values())):
+                await refresh_user_settings(self.bot, user_id)
+                data = read_user_settings(category, user_id)
 
             if not data:
                 await defer_handle.stop(
@@ -0,0 +1,26 @@
+from discord.ext import commands
+
+from utils.cache.cache_notify import cache_notify_listener
+
+
+# 🍰──────────────────────────────
+#   🎀 Cog: CacheNotifyListener
+#   Applies cache changes made by other processes or manual DB edits
+# 🍰──────────────────────────────
+class CacheNotifyListener(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    async def cog_load(self):
+        # 💠 setup_hook connects bot.pg_pool before cogs are loaded
+        cache_notify_listener.start(self.bot)
+
+    async def cog_unload(self):
+        await cache_notify_listener.stop()
+
+
+# ====================
+# 🔹 Setup
+# ====================
+async def setup(bot: commands.Bot):
+    await bot.add_cog(CacheNotifyListener(bot))
@@ -2,8 +2,20 @@ import asyncio
 
 from discord.ext import commands
 
+from group_func.toggle.reminders.reminders_sched_db_func import (
+    fetch_all_schedule_due_times,
+)
 from utils.background_task.berry_checker import berry_reminder_checker
 from utils.background_task.berry_water_checker import berry_water_reminder
+from utils.background_task.due_scheduler import (
+    BERRY_GROWTH,
+    BERRY_WATER,
+    FEELING_LUCKY,
+    POKEMON_REMINDER,
+    SPECIAL_BATTLE,
+    WORLD_BOSS,
+    due_scheduler,
+)
 from utils.background_task.fl_cd_checker import fl_cd_checker
 
 # 🧹 Import your scheduled tasks
@@ -12,12 +24,43 @@ from utils.background_task.secret_santa_timer_checker import secret_santa_timer_
 from utils.background_task.special_battle_timer_checker import (
     special_battle_timer_checker,
 )
+from utils.background_task.wb_reminders_checker import check_wb_battle_reminders
+from utils.cache.fl_cache import fetch_pending_feeling_lucky_cooldowns
+from utils.database.berry_reminder import (
+    fetch_all_pending_grows_on,
+    fetch_all_pending_moisture_dries_on,
+)
+from utils.database.special_npc_timer_db_func import fetch_all_special_battle_ends_on
+from utils.database.wb_fight_db import fetch_all_wb_remind_on
+from utils.essentials.perf_stats import perf_timer
+from utils.essentials.pool_telemetry import pool_telemetry
 from utils.loggers.pretty_logs import pretty_log
 
+PERF_GROUP = "🧭 CENTRAL LOOP"
+
+
+# 🍀 Reminder checkers run by the due scheduler (no seed = fed by its cache loader)
+due_scheduler.register(
+    FEELING_LUCKY, fl_cd_checker, pending=fetch_pending_feeling_lucky_cooldowns
+)
+due_scheduler.register(BERRY_GROWTH, berry_reminder_checker, seed=fetch_all_pending_grows_on)
+due_scheduler.register(
+    BERRY_WATER, berry_water_reminder, seed=fetch_all_pending_moisture_dries_on
+)
+due_scheduler.register(
+    POKEMON_REMINDER, pokemon_reminder_checker, seed=fetch_all_schedule_due_times
+)
+due_scheduler.register(
+    SPECIAL_BATTLE, special_battle_timer_checker, seed=fetch_all_special_battle_ends_on
+)
+due_scheduler.register(
+    WORLD_BOSS, check_wb_battle_reminders, seed=fetch_all_wb_remind_on
+)
+
 
 # 🍰──────────────────────────────
 #   🎀 Cog: CentralLoop
-#   Handles background tasks every 60 seconds
+#   Flushes weekly goals every 60 seconds and owns the due scheduler
 # 🍰──────────────────────────────
 class CentralLoop(commands.Cog):
     def __init__(self, bot: commands.Bot):
@@ -27,6 +70,7 @@ class CentralLoop(commands.Cog):
     def cog_unload(self):
         if self.loop_task and not self.loop_task.done():
             self.loop_task.cancel()
+            due_scheduler.stop()
             pretty_log(
                 "warn",
                 "Loop task cancelled on cog unload.",
@@ -47,6 +91,7 @@ class CentralLoop(commands.Cog):
             label="🧭 CENTRAL LOOP",
             bot=self.bot,
         )
+        due_scheduler.start(self.bot)
         while not self.bot.is_closed():
             try:
                 """pretty_log(
@@ -56,22 +101,14 @@ class CentralLoop(commands.Cog):
                     bot=self.bot,
                 )"""
                 # 💠 Flush any dirty weekly goal stats to DB
-                await flush_weekly_goal_cache(self.bot)
-
-                # 🍀 Check if any Feeling Lucky cd is due
-                await fl_cd_checker(bot=self.bot)
+                async with perf_timer(PERF_GROUP, "flush_weekly_goal_cache"):
+                    await flush_weekly_goal_cache(self.bot)
 
-                # 🍓 Check if any berry reminder is due
-                await berry_reminder_checker(bot=self.bot)
+                # 🗄️ Pool usage summary line (every few minutes)
+                pool_telemetry.maybe_log_summary(self.bot)
 
-                # 💧 Check if any berry water reminders are due
-                await berry_water_reminder(bot=self.bot)
-
-                # 🦭 Check if any pokemon reminder is due
-                await pokemon_reminder_checker(self.bot)
-
-                # ⏰ Check if any special battle timers are due
-                await special_battle_timer_checker(bot=self.bot)
+                # ⏰ Feeling Lucky, berry, pokemon reminder, special battle and
+                # world boss timers are run by due_scheduler exactly when due
 
                 # 🎅 Check if any Secret Santa reminders are due
                 # await secret_santa_timer_checker(bot=self.bot)
@@ -108,11 +145,13 @@ async def setup(bot: commands.Bot):
     print("\n[📋 CENTRAL LOOP CHECKLIST] Scheduled tasks loaded:")
     print("  ─────────────────────────────────────────────")
     print("  ✅ 💠  flush_weekly_goal_cache")
+    print("  🧭 CentralLoop ticking every 60 seconds!")
+    print("  ⏰ Due scheduler (runs when due):")
     print("  ✅ 🍀  fl_cd_checker")
     print("  ✅ 🦭  pokemon_reminder_checker")
     print("  ✅ 💧  berry_water_reminder")
     print("  ✅ 🍓  berry_reminder_checker")
-    # print("  ✅ ⏰  special_battle_timer_checker")
+    print("  ✅ ⏰  special_battle_timer_checker")
+    print("  ✅ 🐉  check_wb_battle_reminders")
     # print("  ✅ 🎅  secret_santa_timer_checker")
-    print("  🧭 CentralLoop ticking every 60 seconds!")
     print("  ─────────────────────────────────────────────\n")
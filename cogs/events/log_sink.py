@@ -0,0 +1,32 @@
+from discord.ext import commands
+
+from utils.loggers.pretty_logs import discord_log_sink, pretty_log
+
+
+# 🍰──────────────────────────────
+#   🎀 Cog: LogSink
+#   Runs the batched Discord log shipper and flushes it on shutdown
+# 🍰──────────────────────────────
+class LogSink(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    async def cog_load(self):
+        discord_log_sink.start(self.bot)
+
+    async def cog_unload(self):
+        # 💠 Bot.close() unloads cogs before the HTTP session closes,
+        # so queued warn/error lines still make it to the log channel
+        pretty_log(
+            "info",
+            f"Flushing log sink (sent {discord_log_sink.sent_messages} messages this run)",
+            label="🪵 LOG SINK",
+        )
+        await discord_log_sink.close()
+
+
+# ====================
+# 🔹 Setup
+# ====================
+async def setup(bot: commands.Bot):
+    await bot.add_cog(LogSink(bot))
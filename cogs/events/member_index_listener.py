@@ -0,0 +1,59 @@
+import discord
+from discord.ext import commands
+
+from utils.cache.member_name_index import (
+    build_guild_member_index,
+    drop_guild_member_index,
+    index_member,
+    unindex_member,
+)
+
+
+# 🍰──────────────────────────────
+#   🎀 Cog: MemberIndexListener
+#   Keeps the per-guild member name index in sync with member events
+# 🍰──────────────────────────────
+class MemberIndexListener(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        for guild in self.bot.guilds:
+            build_guild_member_index(guild)
+
+    @commands.Cog.listener()
+    async def on_guild_available(self, guild: discord.Guild):
+        build_guild_member_index(guild)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        drop_guild_member_index(guild.id)
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        index_member(member)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        unindex_member(member)
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        # 💠 Nickname changes
+        index_member(after)
+
+    @commands.Cog.listener()
+    async def on_user_update(self, before: discord.User, after: discord.User):
+        # 💠 Username / global display name changes arrive per user, not per guild
+        for guild in after.mutual_guilds:
+            member = guild.get_member(after.id)
+            if member:
+                index_member(member)
+
+
+# ====================
+# 🔹 Setup
+# ====================
+async def setup(bot: commands.Bot):
+    await bot.add_cog(MemberIndexListener(bot))
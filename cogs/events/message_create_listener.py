@@ -19,7 +19,11 @@ from config.current_setup import (
 )
 from config.straymons_constants import STRAYMONS__TEXT_CHANNELS
 from utils.listener_func.ball_reco_ping import recommend_ball
-from utils.listener_func.battle_timer import detect_pokemeow_battle
+from utils.listener_func.battle_timer import (
+    BATTLE_FOLLOWUP_FOOTERS,
+    detect_pokemeow_battle,
+    handle_battle_followup,
+)
 from utils.listener_func.battle_won_listener import battle_won_listener
 from utils.listener_func.boosted_channel_listener import (
     newly_boosted_channel_listener,
@@ -62,6 +66,8 @@ from utils.listener_func.wb_reg_listener import (
     register_wb_battle_reminder,
 )
 from utils.listener_func.weekly_stats_syncer import weekly_stats_syncer
+from utils.essentials.message_router import MessageRouter, Trigger
+from utils.essentials.parsed_message import ParsedPokeMeowMessage
 from utils.loggers.pretty_logs import pretty_log
 from utils.listener_func.berry_listener import berry_listener
 from utils.listener_func.berry_water_listener import (
@@ -108,6 +114,387 @@ triggers = {
 UNOWN_NPC_NA_LINE = ":x: You can only challenge the **Alph Scientist** once every"
 
 
+LISTENED_GUILD_IDS = frozenset(
+    (
+        ACTIVE_GUILD_ID,
+        STAFF_SERVER_GUILD_ID,
+        STRAYMONS_GUILD_ID,
+        1154753039685660793,
+    )
+)
+
+# 💜────────────────────────────────────────────
+# [🟣 ROUTES] Compiled trigger router
+# ─────────────────────────────────────────────
+# Routes are matched in one pass per message. Matched handlers run
+# concurrently, each with its own timeout; `after` keeps ordered pairs in order.
+create_router = MessageRouter(label="💜 CREATE ROUTER", concurrent=True)
+
+
+# ⏲️ Pokemon Timer
+@create_router.route(
+    "detect_pokemeow_reply", all_of=[Trigger("description", "found a wild")]
+)
+async def _route_pokemon_timer(bot, parsed):
+    await detect_pokemeow_reply(parsed.message, parsed=parsed)
+
+
+# 🥎 Recommend ball (after the timer is scheduled)
+@create_router.route(
+    "recommend_ball",
+    all_of=[Trigger("description", "found a wild")],
+    after=("detect_pokemeow_reply",),
+)
+async def _route_recommend_ball(bot, parsed):
+    await recommend_ball(parsed.message, bot, parsed=parsed)
+
+
+# 🛡️ Faction Ball Alert
+@create_router.route(
+    "faction_ball_alert",
+    all_of=[
+        Trigger("description", "<:team_logo:"),
+        Trigger("description", "found a wild"),
+    ],
+)
+async def _route_faction_ball_alert(bot, parsed):
+    await faction_ball_alert(before=parsed.before, after=parsed.message, parsed=parsed)
+
+
+# ⚔️ Held Item Ping
+@create_router.route(
+    "held_item_ping_handler", all_of=[Trigger("description", "<:held_item:")]
+)
+async def _route_held_item_ping(bot, parsed):
+    await held_item_ping_handler(bot, parsed.message, parsed=parsed)
+
+
+# 🎣 Fish Timer
+@create_router.route(
+    "fish_timer_handler",
+    all_of=[
+        Trigger("description", "cast a"),
+        Trigger("description", "into the water"),
+    ],
+)
+async def _route_fish_timer(bot, parsed):
+    await fish_timer_handler(parsed.message)
+
+
+# ⚔️ Battle Timer
+@create_router.route(
+    "detect_pokemeow_battle", all_of=[Trigger("author", "PokeMeow Battles")]
+)
+async def _route_battle_timer(bot, parsed):
+    await detect_pokemeow_battle(bot=bot, message=parsed.message)
+
+
+# ⚔️ Battle Timer follow-up (enemy ID for a pending challenge)
+@create_router.route(
+    "handle_battle_followup",
+    any_of=[Trigger("footer", footer) for footer in BATTLE_FOLLOWUP_FOOTERS],
+    check=lambda m: m.author.id == POKEMEOW_APPLICATION_ID,
+)
+async def _route_battle_followup(bot, parsed):
+    handle_battle_followup(parsed.message)
+
+
+# 🏆 Battle Won
+@create_router.route(
+    "battle_won_listener", all_of=[Trigger("content", battle_won_trigger)]
+)
+async def _route_battle_won(bot, parsed):
+    await battle_won_listener(bot=bot, message=parsed.message)
+
+
+# 🏺 Relics
+@create_router.route(
+    "handle_relics_message",
+    all_of=[Trigger("author", "pokemeow research lab", ignore_case=True)],
+)
+async def _route_relics(bot, parsed):
+    await handle_relics_message(bot=bot, message=parsed.message)
+
+
+# 🧪 Autoupdate catch boost via ;perks
+@create_router.route(
+    "auto_update_catchboost",
+    all_of=[Trigger("author", "perks", ignore_case=True)],
+    none_of=[Trigger("author", phrase) for phrase in BANNED_PERKS_PHRASES],
+)
+async def _route_perks(bot, parsed):
+    await auto_update_catchboost(bot=bot, message=parsed.message)
+
+
+# 🍀 Feeling Lucky Cooldown
+@create_router.route(
+    "feeling_lucky_cd",
+    check=lambda m: m.channel.id == STRAYMONS__TEXT_CHANNELS.feeling_lucky,
+)
+async def _route_feeling_lucky(bot, parsed):
+    await feeling_lucky_cd(bot=bot, message=parsed.message)
+
+
+# 🌟 Newly Channel Boost
+@create_router.route(
+    "newly_boosted_channel_listener",
+    all_of=[Trigger("content", newly_boosted_trigger, ignore_case=True)],
+)
+async def _route_newly_boosted(bot, parsed):
+    await newly_boosted_channel_listener(bot=bot, message=parsed.message)
+
+
+# 😢 Remove Channel Boost
+@create_router.route(
+    "remove_boosted_channel_listener",
+    all_of=[Trigger("content", remove_boosted_trigger, ignore_case=True)],
+)
+async def _route_remove_boosted(bot, parsed):
+    await remove_boosted_channel_listener(bot=bot, message=parsed.message)
+
+
+# ⏰ Weekly Stats Syncer
+@create_router.route(
+    "weekly_stats_syncer",
+    all_of=[Trigger("title", weekly_stats_trigger)],
+    announce="Weekly Stats trigger from created message",
+)
+async def _route_weekly_stats(bot, parsed):
+    await weekly_stats_syncer(
+        bot=bot, before=parsed.before, message=parsed.message, parsed=parsed
+    )
+
+
+# 🎯 Faction Ball Listener from ;fa command
+@create_router.route(
+    "extract_faction_ball_from_fa",
+    any_of=[Trigger("author", faction, ignore_case=True) for faction in FACTIONS],
+)
+async def _route_faction_ball_fa(bot, parsed):
+    await extract_faction_ball_from_fa(bot=bot, message=parsed.message)
+
+
+# 🎯 Daily Faction Ball Listener
+@create_router.route(
+    "extract_faction_ball_from_daily",
+    all_of=[Trigger("title", "daily streak", ignore_case=True)],
+    announce="Daily Faction Ball Listener",
+)
+async def _route_faction_ball_daily(bot, parsed):
+    await extract_faction_ball_from_daily(bot=bot, message=parsed.message)
+
+
+# 👑 World Boss Battle Reminder Registration
+@create_router.route(
+    "register_wb_battle_reminder",
+    all_of=[
+        Trigger(
+            "description",
+            "<:checkedbox:752302633141665812> You are registered for this fight",
+        ),
+        Trigger("description", ";wb fight"),
+    ],
+    announce="World Boss Battle Reminder Registration",
+)
+async def _route_wb_registration(bot, parsed):
+    await register_wb_battle_reminder(bot=bot, message=parsed.message)
+
+
+# 🥚 Egg Ready to Hatch
+@create_router.route(
+    "egg_ready_to_hatch_listener",
+    all_of=[
+        Trigger("content", "your egg is ready to hatch! `/egg hatch` to hatch it.")
+    ],
+    check=lambda m: m.author.id == POKEMEOW_APPLICATION_ID,
+    announce="🔹 Egg Ready to Hatch Listener",
+)
+async def _route_egg_ready(bot, parsed):
+    await egg_ready_to_hatch_listener(bot=bot, message=parsed.message)
+
+
+# 🐣 Egg Hatched
+@create_router.route(
+    "egg_hatched_listener",
+    all_of=[Trigger("footer", "PokeMeow | Egg Hatch")],
+    announce="🔹 Egg Hatched Listener",
+)
+async def _route_egg_hatched(bot, parsed):
+    await egg_hatched_listener(bot=bot, message=parsed.message)
+
+
+# 🧪 Special Battle NPC
+@create_router.route(
+    "special_battle_npc_listener",
+    all_of=[
+        Trigger(
+            "description",
+            "challenged <:alph_scientist:1504637214217470032> **Alph Scientist** to a battle!",
+        )
+    ],
+    announce="🔹 Special Battle NPC Listener",
+)
+async def _route_special_battle_npc(bot, parsed):
+    await special_battle_npc_listener(bot=bot, message=parsed.message)
+
+
+# 🧪 Special Battle NPC Timer
+@create_router.route(
+    "special_battle_npc_timer_listener",
+    all_of=[Trigger("content", UNOWN_NPC_NA_LINE)],
+    announce="🔹 Special Battle NPC Timer Listener",
+)
+async def _route_special_battle_npc_timer(bot, parsed):
+    await special_battle_npc_timer_listener(bot=bot, message=parsed.message)
+
+
+# 🛡️ Captcha Alert
+@create_router.route(
+    "captcha_alert_handler",
+    any_of=[
+        Trigger("title", "captcha", ignore_case=True),
+        Trigger("description", "captcha", ignore_case=True),
+    ],
+    none_of=[
+        Trigger("title", "captcha forgiveness centre", ignore_case=True),
+        Trigger("description", "captcha forgiveness centre", ignore_case=True),
+    ],
+)
+async def _route_captcha_alert(bot, parsed):
+    await captcha_alert_handler(bot=bot, message=parsed.message)
+
+
+# 🤖 CatchBot return text
+@create_router.route(
+    "handle_cb_return_message",
+    all_of=[Trigger("content", cb_return_trigger, ignore_case=True)],
+    announce="CatchBot return trigger",
+)
+async def _route_cb_return(bot, parsed):
+    await handle_cb_return_message(bot=bot, message=parsed.message)
+
+
+# 🤖 CatchBot run message (only when it is not a return message)
+@create_router.route(
+    "handle_cb_run_message",
+    all_of=[Trigger("content", "to run your catch bot", ignore_case=True)],
+    none_of=[Trigger("content", cb_return_trigger, ignore_case=True)],
+    pattern=("content", CATCHBOT_SPENT_PATTERN),
+    announce="CatchBot spent pattern",
+)
+async def _route_cb_run(bot, parsed):
+    await handle_cb_run_message(bot=bot, message=parsed.message)
+
+
+# 🤖 CatchBot command embed
+@create_router.route(
+    "handle_cb_command_embed",
+    all_of=[Trigger("fields", cb_command_embed_trigger, ignore_case=True)],
+    announce="CatchBot command trigger in embed field",
+)
+async def _route_cb_command(bot, parsed):
+    await handle_cb_command_embed(bot=bot, message=parsed.message)
+
+
+# 🤖 CatchBot ;cl checklist footer
+@create_router.route(
+    "handle_cb_checklist_message",
+    all_of=[Trigger("footer", cb_checklist_trigger, ignore_case=True)],
+)
+async def _route_cb_checklist(bot, parsed):
+    await handle_cb_checklist_message(bot=bot, message=parsed.message)
+
+
+# 👥 Clan Members Command
+@create_router.route(
+    "clan_members_command_listener",
+    all_of=[Trigger("description", triggers["clan_member"])],
+    announce="Clan Member Information embed",
+    timeout=120.0,
+)
+async def _route_clan_members(bot, parsed):
+    await clan_members_command_listener(bot, parsed.message)
+
+
+# 🧑‍🌾 Berry Reminder
+@create_router.route(
+    "berry_listener",
+    all_of=[Trigger("description", "garden overview", ignore_case=True)],
+    announce="Garden Overview embed",
+)
+async def _route_berry(bot, parsed):
+    await berry_listener(
+        bot=bot, before_message=parsed.before, message=parsed.message
+    )
+
+
+# 🧑‍🌾 Berry Water
+@create_router.route(
+    "handle_berry_water_message",
+    all_of=[Trigger("content", "Watered"), Trigger("content", "Next stage")],
+    announce="Berry Water message",
+)
+async def _route_berry_water(bot, parsed):
+    await handle_berry_water_message(bot=bot, message=parsed.message)
+
+
+# 🧑‍🌾 Mulch
+@create_router.route(
+    "handle_mulch_message",
+    all_of=[
+        Trigger("content", "Applied"),
+        Trigger("content", "Mulch"),
+        Trigger("content", "to Slot"),
+    ],
+    announce="Mulch message",
+)
+async def _route_mulch(bot, parsed):
+    await handle_mulch_message(bot=bot, message=parsed.message)
+
+
+# 🎅 Secret Santa
+@create_router.route(
+    "secret_santa_listener",
+    all_of=[Trigger("content", phrase) for phrase in secret_santa_phrases],
+    announce="🎅 Secret Santa Listener",
+)
+async def _route_secret_santa(bot, parsed):
+    await secret_santa_listener(bot=bot, message=parsed.message)
+
+
+# 🎅 Secret Santa Timer
+@create_router.route(
+    "secret_santa_timer_listener",
+    all_of=[Trigger("content", ":x: You may send out another gift on")],
+    announce="🎅 Secret Santa Timer Listener",
+)
+async def _route_secret_santa_timer(bot, parsed):
+    await secret_santa_timer_listener(bot=bot, message=parsed.message)
+
+
+# ❄️ Hiker Snow Damage
+@create_router.route(
+    "hiker_snow_damage_listener",
+    all_of=[Trigger("description", triggers["hiker"])],
+    announce="❄️ Hiker Snow Damage Listener",
+)
+async def _route_hiker(bot, parsed):
+    await hiker_snow_damage_listener(message=parsed.message)
+
+
+# 🎃 Halloween Contest Embed
+@create_router.route(
+    "halloween_contest_embed_listener",
+    all_of=[Trigger("author", "halloween catch contest", ignore_case=True)],
+    announce="🎃 Halloween Contest Embed Listener",
+)
+async def _route_halloween_contest(bot, parsed):
+    await halloween_contest_embed_listener(bot=bot, message=parsed.message)
+
+
+create_router.compile()
+
+
 class MessageCreateListener(commands.Cog):
     # 💜────────────────────────────────────────────
     # [🟣 INIT] Cog Initialization
@@ -159,385 +546,9 @@ class MessageCreateListener(commands.Cog):
                 )
                 await test_message_listener(bot=self.bot, message=message)
 
-            # --- Weakness chart + general processing ---
-            if message.guild and message.guild.id in (
-                ACTIVE_GUILD_ID,
-                STAFF_SERVER_GUILD_ID,
-                STRAYMONS_GUILD_ID,
-                1154753039685660793,
-            ):
-                content = message.content
-                first_embed = message.embeds[0] if message.embeds else None
-                first_embed_author = (
-                    first_embed.author.name
-                    if first_embed and first_embed.author
-                    else ""
-                )
-                first_embed_description = (
-                    first_embed.description
-                    if first_embed and first_embed.description
-                    else ""
-                )
-                first_embed_footer = (
-                    first_embed.footer.text
-                    if first_embed and first_embed.footer
-                    else ""
-                )
-                # 💜────────────────────────────────────────────
-                #           ⏲️ Pokemon Timer Processing Only
-                # 💜────────────────────────────────────────────
-                if message.embeds and message.embeds[0]:
-                    embed = message.embeds[0]
-                    embed_description = embed.description if embed else None
-                    if embed_description and "found a wild" in embed_description:
-                        await detect_pokemeow_reply(message)
-
-                        # 🥎 Recommend ball
-                        await recommend_ball(message, self.bot)
-
-                # Faction Ball Alert
-                if first_embed:
-                    if (
-                        first_embed.description
-                        and "<:team_logo:" in first_embed.description
-                        and "found a wild" in first_embed.description
-                    ):
-                        await faction_ball_alert(before=message, after=message)
-                # 💜────────────────────────────────────────────
-                # ⚔️ Held Item Ping Processing Only
-                # 💜────────────────────────────────────────────
-                if (
-                    first_embed_description
-                    and "<:held_item:" in first_embed_description
-                ):
-                    await held_item_ping_handler(self.bot, message)
-                # 💜────────────────────────────────────────────
-                #           🎣 Fish Timer Processing Only
-                # 💜────────────────────────────────────────────
-                if message.embeds and message.embeds[0]:
-                    embed = message.embeds[0]
-                    embed_description = embed.description if embed else None
-                    if (
-                        embed_description
-                        and "cast a" in embed_description
-                        and "into the water" in embed_description
-                    ):
-                        await fish_timer_handler(message)
-
-                # 💜────────────────────────────────────────────
-                # ⚔️ Battle Timer Processing Only
-                # 💜────────────────────────────────────────────
-                if first_embed_author and "PokeMeow Battles" in first_embed_author:
-                    await detect_pokemeow_battle(bot=self.bot, message=message)
-
-                # Process battle won
-                if message.content and battle_won_trigger in message.content:
-
-                    await battle_won_listener(bot=self.bot, message=message)
-
-                # 💜────────────────────────────────────────────
-                # ⚔️ Relics Processing Only
-                # 💜────────────────────────────────────────────
-                if (
-                    first_embed_author
-                    and "pokemeow research lab" in first_embed_author.lower()
-                ):
-                    await handle_relics_message(bot=self.bot, message=message)
-
-                # 🧪 Autoupdate catch boost via ;perks
-                if first_embed:
-                    embed_author_name = (
-                        first_embed.author.name
-                        if first_embed.author and first_embed.author.name
-                        else ""
-                    )
-                    if "perks" in embed_author_name.lower() and not any(
-                        phrase in embed_author_name for phrase in BANNED_PERKS_PHRASES
-                    ):
-                        await auto_update_catchboost(bot=self.bot, message=message)
-
-                if message.channel.id == STRAYMONS__TEXT_CHANNELS.feeling_lucky:
-                    # 🍀 Feeling Lucky Cooldown
-                    await feeling_lucky_cd(bot=self.bot, message=message)
-
-                # 🌟 Newly Channel Boost Listener
-                if newly_boosted_trigger.lower() in message.content.lower():
-                    await newly_boosted_channel_listener(bot=self.bot, message=message)
-
-                # 😢 Remove Channel Boost Listener
-                if remove_boosted_trigger.lower() in message.content.lower():
-                    await remove_boosted_channel_listener(bot=self.bot, message=message)
-
-                # ⏰ Weekly Stats Syncer
-                embed = message.embeds[0] if message.embeds else None
-                if embed:
-                    embed_title = embed.title or ""
-                    if weekly_stats_trigger in embed_title:
-                        pretty_log(
-                            "info",
-                            f"Matched Weekly Stats trigger  from created message | Message ID: {message.id} | Channel: {message.channel.name}",
-                        )
-                        await weekly_stats_syncer(
-                            bot=self.bot,
-                            before=message,
-                            message=message,
-                        )
-
-                # Faction Ball Listener from ;fa command
-                if first_embed:
-                    if first_embed.author and any(
-                        f in first_embed.author.name.lower() for f in FACTIONS
-                    ):
-                        await extract_faction_ball_from_fa(
-                            bot=self.bot, message=message
-                        )
-
-                # Daily Faction Ball Listener
-                if first_embed:
-                    if (
-                        first_embed.title
-                        and "daily streak" in first_embed.title.lower()
-                    ):
-                        pretty_log(
-                            "info",
-                            f"Matched Daily Faction Ball Listener | Message ID: {message.id} | Channel: {message.channel.name}",
-                        )
-                        await extract_faction_ball_from_daily(
-                            bot=self.bot, message=message
-                        )
-                # World Boss Battle Reminder Registration
-                if first_embed:
-                    embed_description = first_embed.description or ""
-                    if (
-                        "<:checkedbox:752302633141665812> You are registered for this fight"
-                        in embed_description
-                        and ";wb fight" in embed_description
-                    ):
-                        pretty_log(
-                            "info",
-                            f"Matched World Boss Battle Reminder Registration | Message ID: {message.id} | Channel: {message.channel.name}",
-                        )
-                        await register_wb_battle_reminder(bot=self.bot, message=message)
-
-                # 💜────────────────────────────────────────────
-                # Egg Hatching Listeners
-                # 💜────────────────────────────────────────────
-                if message.content and message.author.id == POKEMEOW_APPLICATION_ID:
-                    if (
-                        "your egg is ready to hatch! `/egg hatch` to hatch it."
-                        in message.content
-                    ):
-                        pretty_log(
-                            "info",
-                            f"🔹 Matched Egg Ready to Hatch Listener | message_id={message.id}",
-                        )
-                        await egg_ready_to_hatch_listener(bot=self.bot, message=message)
-                # Egg Hatched Listener
-                if first_embed:
-                    if (
-                        first_embed_footer
-                        and "PokeMeow | Egg Hatch" in first_embed.footer.text
-                    ):
-                        pretty_log(
-                            "info",
-                            f"🔹 Matched Egg Hatched Listener | message_id={message.id}",
-                        )
-                        await egg_hatched_listener(bot=self.bot, message=message)
-
-                # Special Battle NPC Listener (Disabled for now)
-                if first_embed:
-                    if (
-                        first_embed.description
-                        and "challenged <:alph_scientist:1504637214217470032> **Alph Scientist** to a battle!"
-                        in first_embed.description
-                    ):
-                        pretty_log(
-                            "info",
-                            f"🔹 Matched Special Battle NPC Listener | message_id={message.id}",
-                        )
-                        await special_battle_npc_listener(bot=self.bot, message=message)
-                if (
-                    content
-                    and UNOWN_NPC_NA_LINE
-                    in content
-                ):
-                    pretty_log(
-                        "info",
-                        f"🔹 Matched Special Battle NPC Timer Listener for XMAS BLUE | message_id={message.id}",
-                    )
-                    await special_battle_npc_timer_listener(
-                        bot=self.bot, message=message
-                    )
-                # 🛡️ Captcha Alert Listener
-                if first_embed:
-                    title = first_embed.title.lower() if first_embed.title else ""
-                    description = (
-                        first_embed.description.lower()
-                        if first_embed.description
-                        else ""
-                    )
-                    if (
-                        ("captcha" in title or "captcha" in description)
-                        and "captcha forgiveness centre" not in title
-                        and "captcha forgiveness centre" not in description
-                    ):
-
-                        await captcha_alert_handler(bot=self.bot, message=message)
-
-                # 🟣 Catchbot processing
-                if message.content:
-                    # 1️⃣ CatchBot return text
-                    if cb_return_trigger.lower() in message.content.lower():
-                        pretty_log(
-                            "info",
-                            f"Matched CatchBot return trigger | Message ID: {message.id} | Channel: {message.channel.name}",
-                        )
-                        await handle_cb_return_message(bot=self.bot, message=message)
-
-                    # 2️⃣ CatchBot run message
-                    elif CATCHBOT_SPENT_PATTERN.search(message.content):
-                        pretty_log(
-                            "info",
-                            f"Matched CatchBot spent pattern | Message ID: {message.id} | Channel: {message.channel.name}",
-                        )
-                        await handle_cb_run_message(bot=self.bot, message=message)
-
-                # 3️⃣ CatchBot embeds
-                if first_embed:
-
-                    # 🔹 Check fields
-                    for field in first_embed.fields:
-                        name = field.name.lower() if field.name else ""
-                        value = field.value.lower() if field.value else ""
-
-                        if (
-                            cb_command_embed_trigger.lower() in name
-                            or cb_command_embed_trigger.lower() in value
-                        ):
-                            pretty_log(
-                                "embed",
-                                f"Matched CatchBot command trigger in embed field: {field.name}",
-                            )
-                            await handle_cb_command_embed(bot=self.bot, message=message)
-                            break
-
-                    # 🔹 Check footer for ;cl command
-                    if first_embed.footer and first_embed.footer.text:
-                        footer_text = first_embed.footer.text.lower()
-                        if cb_checklist_trigger.lower() in footer_text:
-                            """pretty_log(
-                                "embed",
-                                f"Matched CatchBot checklist trigger in embed footer: {footer_text}",
-                            )"""
-                            await handle_cb_checklist_message(
-                                bot=self.bot, message=message
-                            )
-                # 💜────────────────────────────────────────────
-                #          👥 Clan Members Command Listener
-                # 💜────────────────────────────────────────────
-                if first_embed:
-                    if (
-                        first_embed_description
-                        and triggers["clan_member"] in first_embed_description
-                    ):
-                        pretty_log(
-                            "info",
-                            "Detected Clan Member Information embed, processing clan members command...",
-                        )
-                        await clan_members_command_listener(
-                            self.bot,
-                            message,
-                        )
-                # 💜────────────────────────────────────────────
-                #          🧑‍🌾 Berry Reminder Listener
-                # 💜────────────────────────────────────────────
-                if first_embed:
-                    if (
-                        first_embed_description
-                        and "garden overview" in first_embed_description.lower()
-                    ):
-                        pretty_log(
-                            "info",
-                            "Detected Garden Overview embed, processing berry reminders...",
-                        )
-                        await berry_listener(
-                            bot=self.bot,
-                            before_message=message,
-                            message=message,
-                        )
-
-                # 💜────────────────────────────────────────────
-                #          🧑‍🌾 Berry Water Listener
-                # 💜────────────────────────────────────────────
-                if message.content:
-                    if "Watered" in message.content and "Next stage" in message.content:
-                        pretty_log(
-                            "info",
-                            "Detected Berry Water message, processing berry water reminders...",
-                        )
-                        await handle_berry_water_message(bot=self.bot, message=message)
-                # 💜────────────────────────────────────────────
-                #          🧑‍🌾  Mulch Listener
-                # 💜────────────────────────────────────────────
-                if message.content:
-                    if (
-                        "Applied" in message.content
-                        and "Mulch" in message.content
-                        and "to Slot" in message.content
-                    ):
-                        pretty_log(
-                            "info",
-                            "Detected Mulch message, processing growth mulch reminders...",
-                        )
-                        await handle_mulch_message(bot=self.bot, message=message)
-
-                # 💜────────────────────────────────────────────
-                #          ⛄️ Seasonal Listeners
-                # 💜────────────────────────────────────────────
-                # Secret Santa Listener
-                if message.content:
-                    # Check if all ss phrases are in the message content
-                    if all(
-                        phrase in message.content for phrase in secret_santa_phrases
-                    ):
-                        pretty_log(
-                            "info",
-                            f"🎅 Matched Secret Santa Listener | Message ID: {message.id} | Channel: {message.channel.name}",
-                        )
-                        await secret_santa_listener(bot=self.bot, message=message)
-                # Secret Santa Timer Listener
-                if message.content:
-                    if ":x: You may send out another gift on" in message.content:
-                        pretty_log(
-                            "info",
-                            f"🎅 Matched Secret Santa Timer Listener | Message ID: {message.id} | Channel: {message.channel.name}",
-                        )
-                        await secret_santa_timer_listener(bot=self.bot, message=message)
-                # ❄️ Hiker Snow Damage Listener
-                if (
-                    first_embed_description
-                    and triggers["hiker"] in first_embed_description
-                ):
-                    pretty_log(
-                        "info",
-                        f"❄️ Matched Hiker Snow Damage Listener | Message ID: {message.id} | Channel: {message.channel.name}",
-                    )
-                    await hiker_snow_damage_listener(message=message)
-
-                # 🎃 Halloween Contest Embed Listener
-                if first_embed:
-                    embed_author = first_embed.author.name if first_embed.author else ""
-                    if (
-                        embed_author
-                        and "halloween catch contest" in embed_author.lower()
-                    ):
-                        pretty_log(
-                            "info",
-                            f"🎃 Matched Halloween Contest Embed Listener | Message ID: {message.id} | Channel: {message.channel.name}",
-                        )
-                        await halloween_contest_embed_listener(
-                            bot=self.bot, message=message
-                        )
+            # --- Routed listener processing ---
+            if message.guild and message.guild.id in LISTENED_GUILD_IDS:
+                await create_router.dispatch(self.bot, ParsedPokeMeowMessage(message))
 
             # 🌊 Waterstate channel processing ---
             if message.channel.id == WATERSTATE_CHANNEL_ID:
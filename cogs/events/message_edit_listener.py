@@ -31,11 +31,12 @@ from utils.listener_func.pokemon_caught import pokemon_caught_listener
 from utils.listener_func.pokemon_timer import detect_pokemeow_reply
 from utils.listener_func.wb_reg_listener import handle_wb_register_command
 from utils.listener_func.weekly_stats_syncer import weekly_stats_syncer
+from utils.essentials.message_router import MessageRouter, Trigger
+from utils.essentials.parsed_message import FISHING_COLOR, ParsedPokeMeowMessage
 from utils.loggers.pretty_logs import pretty_log
 from utils.listener_func.berry_listener import berry_listener
 from utils.listener_func.berry_pouch_listener import handle_berry_pouch_message
 
-FISHING_COLOR = 0x87CEFA
 
 weekly_stats_trigger = "**Clan Weekly Stats — Straymons**"
 explore_trigger = ":stopwatch: Your explore session has ended!"
@@ -46,6 +47,157 @@ triggers = {
 }
 
 
+LISTENED_GUILD_IDS = frozenset(
+    (
+        ACTIVE_GUILD_ID,
+        STAFF_SERVER_GUILD_ID,
+        STRAYMONS_GUILD_ID,
+        OKA_SERVER_ID,
+        1154753039685660793,
+    )
+)
+
+# 💜────────────────────────────────────────────
+# [🟣 ROUTES] Compiled trigger router
+# ─────────────────────────────────────────────
+# Routes are matched in one pass per edit. Matched handlers run
+# concurrently, each with its own timeout; `after` keeps ordered pairs in order.
+edit_router = MessageRouter(label="💜 EDIT ROUTER", concurrent=True)
+
+
+# 🔹 Fishing reco ball
+@edit_router.route(
+    "recommend_fishing_ball", all_of=[Trigger("description", "fished a wild")]
+)
+async def _route_fishing_reco(bot, parsed):
+    await recommend_fishing_ball(message=parsed.message, bot=bot)
+
+
+# 💒 Boosted Channel Listener (checks every edit itself)
+@edit_router.route("handle_boosted_channel_on_edit")
+async def _route_boosted_channel(bot, parsed):
+    await handle_boosted_channel_on_edit(bot=bot, message=parsed.message)
+
+
+# 💠 Pokemon or fish caught for Weekly Goal Tracker
+@edit_router.route(
+    "pokemon_caught_listener", all_of=[Trigger("description", "You caught a")]
+)
+async def _route_pokemon_caught(bot, parsed):
+    await pokemon_caught_listener(
+        bot=bot, before_message=parsed.before, message=parsed.message, parsed=parsed
+    )
+
+
+# ⏰ Clan Weekly Stats
+@edit_router.route("weekly_stats_syncer", all_of=[Trigger("title", weekly_stats_trigger)])
+async def _route_weekly_stats(bot, parsed):
+    await weekly_stats_syncer(
+        bot=bot, before=parsed.before, message=parsed.message, parsed=parsed
+    )
+
+
+# 🧭 Explore Caught
+@edit_router.route("explore_caught_listener", all_of=[Trigger("content", explore_trigger)])
+async def _route_explore_caught(bot, parsed):
+    after = parsed.message
+    pretty_log(
+        "info",
+        f"Detected explore caught edit by {after.author} ({after.author.id})",
+        label="💠 EXPLORE",
+        bot=bot,
+    )
+    await explore_caught_listener(bot=bot, before=parsed.before, after=after)
+
+
+# 🍀 Feeling Lucky rarespawn
+@edit_router.route(
+    "fl_rs_checker",
+    all_of=[Trigger("description", "You caught a")],
+    check=lambda m: m.channel.id == STRAYMONS__TEXT_CHANNELS.feeling_lucky,
+)
+async def _route_fl_rs(bot, parsed):
+    pretty_log(
+        "info",
+        f"Detected Feeling Lucky rare spawn",
+        label="🍀 FL RS",
+        bot=bot,
+    )
+    await fl_rs_checker(bot=bot, message=parsed.message)
+
+
+# 🛡️ Faction Ball Alert (fishing)
+@edit_router.route(
+    "faction_ball_alert",
+    all_of=[
+        Trigger("description", "<:team_logo:"),
+        Trigger("description", "fished a wild"),
+    ],
+    check=lambda m: m.embeds[0].color is not None
+    and m.embeds[0].color.value == FISHING_COLOR,
+)
+async def _route_faction_ball_alert(bot, parsed):
+    await faction_ball_alert(
+        before=parsed.before, after=parsed.message, parsed=parsed
+    )
+
+
+# 👥 Clan Members Command
+@edit_router.route(
+    "clan_members_command_listener",
+    all_of=[Trigger("description", triggers["clan_member"])],
+    announce="Clan Member Information embed",
+    timeout=120.0,
+)
+async def _route_clan_members(bot, parsed):
+    await clan_members_command_listener(bot, parsed.message)
+
+
+# 🧑‍🌾 Berry Reminder
+@edit_router.route(
+    "berry_listener",
+    all_of=[Trigger("description", "garden overview", ignore_case=True)],
+    announce="Garden Overview embed",
+)
+async def _route_berry(bot, parsed):
+    await berry_listener(
+        bot=bot, before_message=parsed.before, message=parsed.message
+    )
+
+
+# 🧑‍🌾 Berry Pouch
+@edit_router.route(
+    "handle_berry_pouch_message",
+    all_of=[Trigger("footer", "berry pouch", ignore_case=True)],
+    announce="Berry Pouch embed",
+)
+async def _route_berry_pouch(bot, parsed):
+    await handle_berry_pouch_message(
+        bot=bot, before=parsed.before, message=parsed.message
+    )
+
+
+# 👑 World Boss Battle Reminder Registration Confirmation
+@edit_router.route(
+    "handle_wb_register_command",
+    all_of=[
+        Trigger(
+            "description",
+            "<:checkedbox:752302633141665812> Successfully registered your",
+        ),
+        Trigger("title", "**A World Boss has spawned! Register now!**"),
+    ],
+    announce="World Boss Battle Reminder Registration Confirmation",
+)
+async def _route_wb_register(bot, parsed):
+    await handle_wb_register_command(
+        bot=bot, before_message=parsed.before, message=parsed.message
+    )
+
+
+edit_router.compile()
+
+
 class MessageEditListener(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
@@ -82,108 +234,10 @@ class MessageEditListener(commands.Cog):
                 and not after.webhook_id
             ):
                 return
-            # if after.guild and after.guild.id == ACTIVE_GUILD_ID:
-
-            # --- Weakness chart processing (Active + Staff Guilds) ---
-            if after.guild and after.guild.id in (
-                ACTIVE_GUILD_ID,
-                STAFF_SERVER_GUILD_ID,
-                STRAYMONS_GUILD_ID,
-                OKA_SERVER_ID,
-                1154753039685660793,
-            ):
-                embed = after.embeds[0] if after.embeds else None
-                embed_description = embed.description if embed else ""
-
-                first_embed = after.embeds[0] if after.embeds else None
-                first_embed_author = (
-                    first_embed.author.name
-                    if first_embed and first_embed.author
-                    else ""
-                )
-                first_embed_description = (
-                    first_embed.description
-                    if first_embed and first_embed.description
-                    else ""
-                )
-                first_embed_footer = (
-                    first_embed.footer.text
-                    if first_embed and first_embed.footer
-                    else ""
-                )
-                first_embed_author_text =(
-                    first_embed.author.text if first_embed and first_embed.author and hasattr(first_embed.author, "text") else ""
-                )
-                # 🔹 Fishing reco ball
-                if embed_description and "fished a wild" in embed_description:
-                    await recommend_fishing_ball(message=after, bot=self.bot)
-
-                # Boosted Channel Listener
-                await handle_boosted_channel_on_edit(bot=self.bot, message=after)
-
-                # Process Pokemon or fish caught for Weekly Goal Tracker
-                if after.embeds:
-                    embed_description = after.embeds[0].description or ""
-                    if embed_description and "You caught a" in embed_description:
-                        await pokemon_caught_listener(
-                            bot=self.bot, before_message=before, message=after
-                        )
-
-                # Process for Clan Weekly Stats
-                if after.embeds:
-                    embed_title = after.embeds[0].title or ""
-                    if weekly_stats_trigger in embed_title:
-                        await weekly_stats_syncer(
-                            bot=self.bot,
-                            before=before,
-                            message=after,
-                        )
-
-                # Process for Explore Caught
-                if after.content and explore_trigger in after.content:
-                    pretty_log(
-                        "info",
-                        f"Detected explore caught edit by {after.author} ({after.author.id})",
-                        label="💠 EXPLORE",
-                        bot=self.bot,
-                    )
-                    await explore_caught_listener(
-                        bot=self.bot, before=before, after=after
-                    )
 
-                # Process for Feeling Lucky rarespawn
-                if after.channel.id == STRAYMONS__TEXT_CHANNELS.feeling_lucky:
-                    if after.embeds:
-                        embed_description = after.embeds[0].description or ""
-                        if embed_description and "You caught a" in embed_description:
-                            pretty_log(
-                                "info",
-                                f"Detected Feeling Lucky rare spawn",
-                                label="🍀 FL RS",
-                                bot=self.bot,
-                            )
-                            await fl_rs_checker(bot=self.bot, message=after)
-
-                # Faction Ball Alert
-                if after.embeds:
-                    desc = after.embeds[0].description
-                    color = after.embeds[0].color
-                    if (
-                        desc
-                        and "<:team_logo:" in desc
-                        and "fished a wild" in desc
-                        and (
-                            color == FISHING_COLOR
-                            or getattr(color, "value", None) == FISHING_COLOR
-                        )
-                    ):
-                        """pretty_log(
-                            "info",
-                            f"Detected faction ball alert in fish embed",
-                            label="🛡️ FACTION BALL ALERT",
-                            bot=self.bot,
-                        )"""
-                        await faction_ball_alert(before=before, after=after)
+            # --- Routed listener processing ---
+            if after.guild and after.guild.id in LISTENED_GUILD_IDS:
+                await edit_router.dispatch(self.bot, ParsedPokeMeowMessage(after, before))
 
                 # 🎃 Halloween Contest Score Listener (Disabled for now)
                 """content = after.content
@@ -195,76 +249,6 @@ class MessageEditListener(commands.Cog):
                     await halloween_contest_score_listener(
                         bot=self.bot, before_message=before, message=after
                     )"""
-                # 💜────────────────────────────────────────────
-                #          👥 Clan Members Command Listener
-                # 💜────────────────────────────────────────────
-                if first_embed:
-                    if (
-                        first_embed_description
-                        and triggers["clan_member"] in first_embed_description
-                    ):
-                        pretty_log(
-                            "info",
-                            "Detected Clan Member Information embed, processing clan members command...",
-                        )
-                        await clan_members_command_listener(
-                            self.bot,
-                            after,
-                        )
-                # 💜────────────────────────────────────────────
-                #          🧑‍🌾 Berry Reminder Listener
-                # 💜────────────────────────────────────────────
-                if first_embed:
-                    if (
-                        first_embed_description
-                        and "garden overview" in first_embed_description.lower()
-                    ):
-                        pretty_log(
-                            "info",
-                            "Detected Garden Overview embed, processing berry reminders...",
-                        )
-                        await berry_listener(
-                            bot=self.bot,
-                            before_message=before,
-                            message=after,
-                        )
-                # 💜────────────────────────────────────────────
-                #          🧑‍🌾 Berry Pounch Listener
-                # 💜────────────────────────────────────────────
-                if first_embed:
-                    if (
-                        first_embed_footer
-                        and "berry pouch" in first_embed_footer.lower()
-                    ):
-                        pretty_log(
-                            "info",
-                            "Detected Berry Pouch embed, processing berry pouch listener...",
-                        )
-                        await handle_berry_pouch_message(
-                            bot=self.bot,
-                            before=before,
-                            message=after,
-                        )
-
-                # 💜────────────────────────────────────────────
-                #          👑 World Boss Battle Reminder Registration Confirmation
-                # 💜────────────────────────────────────────────
-                if first_embed:
-                    if (
-                        first_embed_description
-                        and "<:checkedbox:752302633141665812> Successfully registered your"
-                        in first_embed_description
-                        and first_embed.title
-                        and "**A World Boss has spawned! Register now!**"
-                        in first_embed.title
-                    ):
-                        pretty_log(
-                            "info",
-                            f"Matched World Boss Battle Reminder Registration Confirmation | Message ID: {after.id} | Channel: {after.channel.name}",
-                        )
-                        await handle_wb_register_command(
-                            bot=self.bot, before_message=before, message=after
-                        )
         except Exception as e:
             pretty_log(
                 tag="critical",
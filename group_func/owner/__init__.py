@@ -1,10 +1,16 @@
 from .test.test_held_item_ping import test_held_item_ping_func
 from .test.test_recommend import test_recommend_func
+from .top_level.db_pool import db_pool_stats_func
 from .top_level.extract_rarities import extract_rarities_func
 from .top_level.fetch_message import fetch_message_from_link_func
+from .top_level.listener_capture import listener_capture_func
+from .top_level.perf_stats import perf_stats_func
 __all__ = [
     "test_recommend_func",
     "test_held_item_ping_func",
     "extract_rarities_func",
     "fetch_message_from_link_func",
+    "perf_stats_func",
+    "listener_capture_func",
+    "db_pool_stats_func",
 ]
@@ -0,0 +1,102 @@
+import time
+
+import discord
+
+from utils.essentials.loader.pretty_defer import pretty_defer
+from utils.essentials.perf_stats import format_seconds
+from utils.essentials.pool_telemetry import pool_telemetry
+from utils.loggers.pretty_logs import pretty_log
+
+
+# 💠────────────────────────────────────────────
+# [🟣 HELPER] Render latency tables
+# ─────────────────────────────────────────────
+def _latency_table(rows, title: str, extra: str = "err") -> str:
+    if not rows:
+        return f"No {title} recorded yet."
+    header = f"{title:<30}{'n':>6}{extra:>5}{'p95':>9}{'max':>9}"
+    lines = [header, "─" * len(header)]
+    for label, stats in rows:
+        count = stats.timeouts if extra == "long" else stats.errors
+        lines.append(
+            f"{label[:29]:<30}{stats.calls:>6}{count:>5}"
+            f"{format_seconds(stats.percentile(95)):>9}{format_seconds(stats.max):>9}"
+        )
+    return "\n".join(lines)
+
+
+def _slow_query_lines(limit: int = 8) -> str:
+    slow = list(pool_telemetry.slow_queries)[-limit:]
+    if not slow:
+        return "No slow queries."
+    return "\n".join(
+        f"<t:{int(q.at)}:T> {format_seconds(q.seconds)} {q.label[:40]}"
+        f"{f' ({q.error})' if q.error else ''}\n  ↳ {q.site}"
+        for q in reversed(slow)
+    )
+
+
+# 💠────────────────────────────────────────────
+# [🟣 FUNC] /owner db-pool
+# ─────────────────────────────────────────────
+async def db_pool_stats_func(
+    bot: discord.Client,
+    interaction: discord.Interaction,
+    reset: bool = False,
+) -> None:
+    """Shows pool acquire waits, connection holds per call site and slow queries."""
+    loader = await pretty_defer(
+        interaction,
+        content="Collecting pool stats…",
+        ephemeral=True,
+    )
+
+    wait = pool_telemetry.acquire_wait
+    hold = pool_telemetry.hold
+    embed = discord.Embed(
+        title="🗄️ DB Pool Stats",
+        description=pool_telemetry.summary_line(getattr(bot, "pg_pool", None)),
+        color=0xDDA0DD,
+    )
+    embed.add_field(
+        name="Acquire wait",
+        value=(
+            f"p50 {format_seconds(wait.percentile(50))} • "
+            f"p99 {format_seconds(wait.percentile(99))} • "
+            f"{wait.calls} acquires"
+        ),
+        inline=False,
+    )
+    embed.add_field(
+        name="Hold time",
+        value=(
+            f"p50 {format_seconds(hold.percentile(50))} • "
+            f"p99 {format_seconds(hold.percentile(99))}"
+        ),
+        inline=False,
+    )
+    holders = _latency_table(pool_telemetry.top_holders(8), "holds", extra="long")
+    queries = _latency_table(pool_telemetry.top_queries(8), "queries")
+    embed.add_field(
+        name="Longest holders (call site)",
+        value=f"```\n{holders}\n```"[:1024],
+        inline=False,
+    )
+    embed.add_field(
+        name="Slowest queries (by p99)",
+        value=f"```\n{queries}\n```"[:1024],
+        inline=False,
+    )
+    embed.add_field(
+        name="Recent slow queries",
+        value=_slow_query_lines()[:1024],
+        inline=False,
+    )
+    uptime_minutes = int((time.time() - pool_telemetry.started_at) // 60)
+    embed.set_footer(text=f"Over the last {uptime_minutes} min")
+
+    if reset:
+        pool_telemetry.reset()
+        pretty_log("info", "Pool stats reset", label="🗄️ DB POOL")
+
+    await loader.success(content="", embed=embed)
@@ -0,0 +1,44 @@
+import discord
+
+from utils.essentials.listener_capture import listener_capture
+from utils.essentials.loader.pretty_defer import pretty_defer
+
+
+# 💠────────────────────────────────────────────
+# [🟣 FUNC] /owner capture
+# ─────────────────────────────────────────────
+async def listener_capture_func(
+    bot: discord.Client,
+    interaction: discord.Interaction,
+    action: str = "status",
+    max_minutes: int = 30,
+) -> None:
+    """Starts/stops recording listener traffic for the offline replay benchmark."""
+    loader = await pretty_defer(
+        interaction,
+        content="Updating listener capture…",
+        ephemeral=True,
+    )
+
+    if action == "start":
+        if listener_capture.running:
+            content = f"Already capturing to `{listener_capture.path}` ({listener_capture.events} events)."
+        else:
+            path = listener_capture.start(bot, max_minutes=max_minutes)
+            content = f"Capturing listener traffic to `{path}` for up to {max_minutes} min."
+    elif action == "stop":
+        path, events = await listener_capture.stop()
+        content = (
+            f"Saved {events} events to `{path}`.\n"
+            f"Replay with `python -m utils.essentials.listener_replay {path}`"
+            if path
+            else "No capture was running."
+        )
+    else:
+        content = (
+            f"Capturing to `{listener_capture.path}` ({listener_capture.events} events)."
+            if listener_capture.running
+            else "No capture running."
+        )
+
+    await loader.success(content=content)
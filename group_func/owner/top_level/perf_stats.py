@@ -0,0 +1,72 @@
+import discord
+
+from utils.essentials.loader.pretty_defer import pretty_defer
+from utils.essentials.perf_stats import (
+    format_seconds,
+    perf_stats,
+    perf_window_seconds,
+    reset_perf_stats,
+    top_offenders,
+)
+from utils.loggers.pretty_logs import pretty_log
+
+
+# 💠────────────────────────────────────────────
+# [🟣 HELPER] Render perf table
+# ─────────────────────────────────────────────
+def build_perf_table(sort_by: str, limit: int) -> str:
+    rows = top_offenders(sort_by=sort_by, limit=limit)
+    if not rows:
+        return "No handler or checker calls recorded yet."
+
+    header = f"{'name':<28}{'calls':>7}{'err':>5}{'to':>4}{'p50':>9}{'p95':>9}{'p99':>9}"
+    lines = [header, "─" * len(header)]
+    for group, name, stats in rows:
+        # 🔹 Drop the router/loop emoji so columns stay aligned
+        short_group = group.split(" ", 1)[-1].split(" ")[0].lower()
+        label = f"{short_group}:{name}"[:27]
+        lines.append(
+            f"{label:<28}{stats.calls:>7}{stats.errors:>5}{stats.timeouts:>4}"
+            f"{format_seconds(stats.percentile(50)):>9}"
+            f"{format_seconds(stats.percentile(95)):>9}"
+            f"{format_seconds(stats.percentile(99)):>9}"
+        )
+    return "\n".join(lines)
+
+
+# 💠────────────────────────────────────────────
+# [🟣 FUNC] /owner perf
+# ─────────────────────────────────────────────
+async def perf_stats_func(
+    bot: discord.Client,
+    interaction: discord.Interaction,
+    sort_by: str = "p99",
+    limit: int = 15,
+    reset: bool = False,
+) -> None:
+    """Shows the slowest / most failing listener handlers and loop checkers."""
+    loader = await pretty_defer(
+        interaction,
+        content="Collecting perf stats…",
+        ephemeral=True,
+    )
+
+    limit = max(1, min(limit, 30))
+    table = build_perf_table(sort_by=sort_by, limit=limit)
+    uptime_minutes = int(perf_window_seconds() // 60)
+    total_calls = sum(stats.calls for stats in perf_stats.values())
+
+    embed = discord.Embed(
+        title="📊 Handler Perf Stats",
+        description=f"```\n{table}\n```"[:4096],
+        color=0xDDA0DD,
+    )
+    embed.set_footer(
+        text=f"Sorted by {sort_by} • {total_calls} calls over {uptime_minutes} min"
+    )
+
+    if reset:
+        reset_perf_stats()
+        pretty_log("info", "Perf stats reset", label="📊 PERF")
+
+    await loader.success(content="", embed=embed)
@@ -75,16 +75,20 @@ def held_item_message(pokemon_name: str, user_sub: dict) -> str | None:
             "duskball": True
         }
     """
-    debug_log(f"held_item_message called for {pokemon_name} with user_sub: {user_sub}")
+    debug_log(
+        "held_item_message called for %s with user_sub: %s",
+        pokemon_name,
+        user_sub,
+    )
     subscribed_items = user_sub.get("subscribed_items", set())
     all_items_flag = user_sub.get("all_held_items", False)
     moonball_subbed = "moonball" in subscribed_items
-    debug_log(f"User Moonball subscribed: {moonball_subbed}")
+    debug_log("User Moonball subscribed: %s", moonball_subbed)
     duskball_subbed = "duskball" in subscribed_items
-    debug_log(f"User Duskball subscribed: {duskball_subbed}")
+    debug_log("User Duskball subscribed: %s", duskball_subbed)
     nyc = ZoneInfo("America/New_York")
     now_nyc = datetime.now(nyc)
-    debug_log(f"Current time in EST: {now_nyc.strftime('%Y-%m-%d %H:%M:%S')} ")
+    debug_log(lambda: f"Current time in EST: {now_nyc.strftime('%Y-%m-%d %H:%M:%S')} ")
 
     held_item_phrase = f"{Emojis.held_item} item! "
 
@@ -98,28 +102,28 @@ def held_item_message(pokemon_name: str, user_sub: dict) -> str | None:
     # Special balls to show
     special_balls = []
     if is_midnight_est() and moonball_subbed:
-        debug_log(f"Midnight EST detected for {proper_pokemon_name}")
+        debug_log("Midnight EST detected for %s", proper_pokemon_name)
         special_balls.append(f"{Emojis.moonball} **__Moonball__**")
-        debug_log(f"Added Moonball for {proper_pokemon_name}")
+        debug_log("Added Moonball for %s", proper_pokemon_name)
         if duskball_subbed:
             special_balls.append(f"{Emojis.duskball} **__Duskball__**")
-            debug_log(f"Added Duskball for {proper_pokemon_name}")
+            debug_log("Added Duskball for %s", proper_pokemon_name)
     elif is_nighttime_est() and duskball_subbed:
-        debug_log(f"Nighttime EST detected for {proper_pokemon_name}")
+        debug_log("Nighttime EST detected for %s", proper_pokemon_name)
         special_balls.append(f"{Emojis.duskball} **__Duskball__**")
-        debug_log(f"Added Duskball for {proper_pokemon_name}")
+        debug_log("Added Duskball for %s", proper_pokemon_name)
     else:
-        debug_log(f"No special balls added for {proper_pokemon_name}")
+        debug_log("No special balls added for %s", proper_pokemon_name)
 
     # No held items
     if not items_for_pokemon:
-        debug_log(f"No held items for {proper_pokemon_name}")
+        debug_log("No held items for %s", proper_pokemon_name)
         if special_balls:
             balls_str = " ".join(special_balls)
-            debug_log(f"Special balls for {proper_pokemon_name}: {balls_str}")
+            debug_log("Special balls for %s: %s", proper_pokemon_name, balls_str)
             return f"{proper_pokemon_name} is holding an {held_item_phrase} (Special Item Chance: {balls_str})"
         else:
-            debug_log(f"No special balls for {proper_pokemon_name}")
+            debug_log("No special balls for %s", proper_pokemon_name)
             return f"{proper_pokemon_name} is holding an {held_item_phrase}"
 
     # Held items
@@ -131,13 +135,13 @@ def held_item_message(pokemon_name: str, user_sub: dict) -> str | None:
     items_to_show.extend(special_balls)
 
     if not items_to_show:
-        debug_log(f"No subscribed held items for {proper_pokemon_name}")
+        debug_log("No subscribed held items for %s", proper_pokemon_name)
         return None
 
     if len(items_to_show) == 1:
-        debug_log(f"One held item for {proper_pokemon_name}: {items_to_show[0]}")
+        debug_log("One held item for %s: %s", proper_pokemon_name, items_to_show[0])
         return f"{proper_pokemon_name} is holding an {held_item_phrase} (Special Item Chance: {items_to_show[0]})"
     else:
         items_str = " or ".join(items_to_show)
-        debug_log(f"Multiple held items for {proper_pokemon_name}: {items_str}")
+        debug_log("Multiple held items for %s: %s", proper_pokemon_name, items_str)
         return f"{proper_pokemon_name} is holding an {held_item_phrase} (Special Item Chance: {items_str})"
@@ -1,7 +1,37 @@
+import time
 from typing import List, Optional
 from datetime import datetime, timedelta
+from utils.background_task.due_scheduler import POKEMON_REMINDER, schedule_due
+from utils.essentials.get_pg_pool import register_query
 from utils.loggers.pretty_logs import pretty_log
 
+SCHEDULE_EXISTS_WITH_TS = register_query(
+    "reminders_schedule.exists_with_ts",
+    """
+    SELECT 1
+    FROM pokemeow_reminders_schedule
+    WHERE user_id = $1
+      AND type = $2
+      AND ends_on = $3
+    LIMIT 1
+    """,
+    kind="fetchval",
+    timeout=5.0,
+)
+UPSERT_USER_SCHEDULE = register_query(
+    "reminders_schedule.upsert",
+    """
+    INSERT INTO pokemeow_reminders_schedule (user_id, user_name, type, ends_on, remind_next_on, reminder_sent)
+    VALUES ($1, $2, $3, $4, $5, $6)
+    ON CONFLICT (user_id, type) DO UPDATE
+    SET user_name = EXCLUDED.user_name,
+        ends_on = EXCLUDED.ends_on,
+        remind_next_on = EXCLUDED.remind_next_on,
+        reminder_sent = EXCLUDED.reminder_sent
+    """,
+    timeout=5.0,
+)
+
 # ────────────────────────────────────────────
 #     🐱 Pokemeow Reminders Schedule DB 🐱
 # ────────────────────────────────────────────
@@ -21,6 +51,23 @@ async def fetch_all_schedules(bot) -> list[dict]:
         return []
 
 
+async def fetch_all_schedule_due_times(bot) -> list:
+    """
+    Fetches every unsent ends_on and every remind_next_on; seeds the due
+    scheduler at startup and tells it after each run what is still pending.
+    """
+    async with bot.pg_pool.acquire() as conn:
+        rows = await conn.fetch(
+            "SELECT ends_on, remind_next_on, reminder_sent FROM pokemeow_reminders_schedule"
+        )
+    due_times = []
+    for row in rows:
+        if not row["reminder_sent"]:
+            due_times.append(row["ends_on"])
+        due_times.append(row["remind_next_on"])
+    return [ts for ts in due_times if ts]
+
+
 async def fetch_user_schedule(bot, user_id: int, type_: str) -> Optional[dict]:
     try:
         async with bot.pg_pool.acquire() as conn:
@@ -79,34 +126,23 @@ async def schedule_exists_with_same_ts(
     Returns True if found, False otherwise.
     """
     try:
-        async with bot.pg_pool.acquire() as conn:
-            row = await conn.fetchrow(
-                """
-                SELECT 1
-                FROM pokemeow_reminders_schedule
-                WHERE user_id = $1
-                  AND type = $2
-                  AND ends_on = $3
-                LIMIT 1
-                """,
-                user_id,
-                type_,
-                timestamp,
+        found = await bot.pg_pool.run(
+            SCHEDULE_EXISTS_WITH_TS, user_id, type_, timestamp
+        )
+        if found:
+            pretty_log(
+                "debug",
+                f"[CB CHECK] Found existing schedule for {user_id} type={type_} ts={timestamp}",
+                bot=bot,
+            )
+            return True
+        else:
+            pretty_log(
+                "debug",
+                f"[CB CHECK] No existing schedule for {user_id} type={type_} ts={timestamp}",
+                bot=bot,
             )
-            if row:
-                pretty_log(
-                    "debug",
-                    f"[CB CHECK] Found existing schedule for {user_id} type={type_} ts={timestamp}",
-                    bot=bot,
-                )
-                return True
-            else:
-                pretty_log(
-                    "debug",
-                    f"[CB CHECK] No existing schedule for {user_id} type={type_} ts={timestamp}",
-                    bot=bot,
-                )
-                return False
+            return False
     except Exception as e:
         pretty_log(
             "error",
@@ -126,24 +162,17 @@ async def upsert_user_schedule(
     reminder_sent: bool = False,  # new param
 ):
     try:
-        async with bot.pg_pool.acquire() as conn:
-            await conn.execute(
-                """
-                INSERT INTO pokemeow_reminders_schedule (user_id, user_name, type, ends_on, remind_next_on, reminder_sent)
-                VALUES ($1, $2, $3, $4, $5, $6)
-                ON CONFLICT (user_id, type) DO UPDATE
-                SET user_name = EXCLUDED.user_name,
-                    ends_on = EXCLUDED.ends_on,
-                    remind_next_on = EXCLUDED.remind_next_on,
-                    reminder_sent = EXCLUDED.reminder_sent
-                """,
-                user_id,
-                user_name,
-                type_,
-                ends_on,
-                remind_next_on,
-                reminder_sent,
-            )
+        await bot.pg_pool.run(
+            UPSERT_USER_SCHEDULE,
+            user_id,
+            user_name,
+            type_,
+            ends_on,
+            remind_next_on,
+            reminder_sent,
+        )
+        schedule_due(POKEMON_REMINDER, ends_on)
+        schedule_due(POKEMON_REMINDER, remind_next_on)
         pretty_log(
             "info", f"Upserted schedule for user {user_name}, type {type_}", bot=bot
         )
@@ -199,6 +228,11 @@ async def get_catchbot_reminds_next_on(bot, user_id: int) -> Optional[dict]:
 async def update_catchbot_reminds_next_on(
     bot, user_id: int, minutes: int | None, ends_on: int | None = None
 ):
+    """
+    Sets the next repeating catchbot reminder `minutes` after `ends_on` (the
+    return time, or the previous remind_next_on when repeating). Slots that
+    are already past are skipped so the next reminder is always in the future.
+    """
     try:
         if not minutes or minutes <= 0 or not ends_on:
             next_on = None
@@ -206,6 +240,10 @@ async def update_catchbot_reminds_next_on(
             next_on = calculate_remind_next_on(
                 {"repeating": minutes, "mode": "dms"}, ends_on
             )
+            now = int(time.time())
+            if next_on <= now:
+                interval = int(minutes) * 60
+                next_on += ((now - next_on) // interval + 1) * interval
 
         async with bot.pg_pool.acquire() as conn:
             await conn.execute(
@@ -217,6 +255,7 @@ async def update_catchbot_reminds_next_on(
                 next_on,
                 user_id,
             )
+        schedule_due(POKEMON_REMINDER, next_on)
 
         pretty_log(
             "info",
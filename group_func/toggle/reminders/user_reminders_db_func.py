@@ -150,6 +150,28 @@ def merge_with_defaults(reminders: dict) -> dict:
     return merged
 
 
+async def _patch_user_reminders(
+    bot, user_id: int, user_name: str, updates: dict, removals=()
+) -> Optional[dict]:
+    """
+    Applies dotted-path updates/removals to a user's reminders in one atomic
+    statement: creates the row if missing, fills in missing defaults, and
+    returns the document as stored.
+    """
+    return await patch_json_fields(
+        bot,
+        "user_pokemeow_reminders",
+        "user_id",
+        user_id,
+        "reminders",
+        updates,
+        removals=removals,
+        defaults=REMINDERS_DEFAULTS,
+        upsert=True,
+        extra_columns={"user_name": user_name},
+    )
+
+
 async def upsert_user_reminders(bot, user_id: int, user_name: str, updates: dict):
     """
     Incrementally upsert reminders for a user.
@@ -157,61 +179,21 @@ async def upsert_user_reminders(bot, user_id: int, user_name: str, updates: dict
     - Merges with defaults (new fields auto-added)
     - Applies only the provided updates
     """
-    try:
-        async with bot.pg_pool.acquire() as conn:
-            # 🔹 1. Fetch current row (if any)
-            row = await conn.fetchrow(
-                "SELECT reminders FROM user_pokemeow_reminders WHERE user_id = $1",
-                user_id,
-            )
-
-            # 🔹 Safely parse JSON from DB
-            if row and row["reminders"]:
-                if isinstance(row["reminders"], str):
-                    try:
-                        current_reminders = json.loads(row["reminders"])
-                    except json.JSONDecodeError:
-                        current_reminders = {}
-                elif isinstance(row["reminders"], dict):
-                    current_reminders = row["reminders"]
-                else:
-                    current_reminders = {}
-            else:
-                current_reminders = {}
-
-            # 🔹 Merge with defaults
-            merged = merge_with_defaults(current_reminders)
-
-            # 🔹 Apply incremental updates (multi-field safe)
-            for section, changes in updates.items():
-                if section not in merged or not isinstance(merged[section], dict):
-                    merged[section] = {}
-                if isinstance(changes, dict):
-                    merged[section].update(changes)
-
-            # 🔹 Upsert row
-            await conn.execute(
-                """
-                INSERT INTO user_pokemeow_reminders (user_id, user_name, reminders)
-                VALUES ($1, $2, $3)
-                ON CONFLICT (user_id) DO UPDATE
-                SET user_name = EXCLUDED.user_name,
-                    reminders = EXCLUDED.reminders
-                """,
-                user_id,
-                user_name,
-                json.dumps(merged),
-            )
-
-        pretty_log("info", f"Incrementally upserted user {user_name}", bot=bot)
-        return merged
-
-    except Exception as e:
-        pretty_log(
-            "error", f"Failed incremental upsert for user {user_id}: {e}", bot=bot
-        )
+    # 🔹 {"relics": {"mode": "dm"}} → {"relics.mode": "dm"}
+    dotted_updates = {
+        f"{section}.{key}": value
+        for section, changes in updates.items()
+        if isinstance(changes, dict)
+        for key, value in changes.items()
+    }
+    merged = await _patch_user_reminders(bot, user_id, user_name, dotted_updates)
+    if merged is None:
+        pretty_log("error", f"Failed incremental upsert for user {user_id}", bot=bot)
         return None
 
+    pretty_log("info", f"Incrementally upserted user {user_name}", bot=bot)
+    return merged
+
 
 # 💠────────────────────────────────────────────
 # [🟣 DB FUNCTION] Update reminders JSON (supports nested keys)
@@ -220,52 +202,22 @@ async def update_user_reminders(bot, user_id: int, updates: dict):
     """
     Merge multiple nested keys into a user's reminders column.
 
-    Handles dotted keys like "relics.mode" safely in Python.
+    Handles dotted keys like "relics.mode" server-side in one statement and
+    returns the updated reminders (None if the user has no row).
     """
-    try:
-        async with bot.pg_pool.acquire() as conn:
-            # Fetch current reminders
-            row = await conn.fetchrow(
-                "SELECT reminders FROM user_pokemeow_reminders WHERE user_id = $1",
-                user_id,
-            )
-            if not row:
-                pretty_log("warn", f"No user row found for {user_id}", bot=bot)
-                return
-
-            reminders = row["reminders"] or {}
-            if isinstance(reminders, str):
-                import json
-
-                reminders = json.loads(reminders)
-
-            # Apply updates (dotted keys)
-            for key, value in updates.items():
-                parts = key.split(".")
-                d = reminders
-                for p in parts[:-1]:
-                    if p not in d or not isinstance(d[p], dict):
-                        d[p] = {}
-                    d = d[p]
-                d[parts[-1]] = value
-
-            # Write back as JSON
-            import json
-
-            await conn.execute(
-                "UPDATE user_pokemeow_reminders SET reminders = $1 WHERE user_id = $2",
-                json.dumps(reminders),
-                user_id,
-            )
+    from utils.cache.reminders_cache import user_reminders_cache
 
-        pretty_log("info", f"Updated reminders for user {user_id}: {updates}", bot=bot)
+    reminders = await patch_json_fields(
+        bot, "user_pokemeow_reminders", "user_id", user_id, "reminders", updates
+    )
+    if reminders is None:
+        pretty_log("warn", f"No user row updated for {user_id}", bot=bot)
+        return None
 
-    except Exception as e:
-        pretty_log(
-            "error",
-            f"[JSONB] Failed to update reminders for user {user_id}: {e}",
-            bot=bot,
-        )
+    if user_id in user_reminders_cache:
+        user_reminders_cache[user_id] = reminders
+    pretty_log("info", f"Updated reminders for user {user_id}: {updates}", bot=bot)
+    return reminders
 
 
 # 💠────────────────────────────────────────────
@@ -304,14 +256,16 @@ def _deep_set(d: dict, keys: list[str], value):
 
 
 async def update_user_reminders_fields(
-    bot, user_id: int, user_name: str, updates: dict
+    bot, user_id: int, user_name: str, updates: dict, removals=()
 ):
     """
     Safely update multiple nested fields in a user's reminders.
     - updates: dict where keys are dotted paths (e.g., "catchbot.schedule.next_run")
                and values are the values to set.
+    - removals: dotted paths to delete (e.g., "catchbot.reminds_next_on").
     - Merge-safe: only updates provided fields, keeps all other data intact.
-    - Updates both cache and DB incrementally.
+    - Updates the cache right away, then refreshes it from the document the
+      DB returns after the atomic patch.
 
     Example:
         await update_user_reminders_fields(
@@ -325,7 +279,6 @@ async def update_user_reminders_fields(
         )
     """
     from utils.cache.reminders_cache import user_reminders_cache
-    from group_func.toggle.reminders.user_reminders_db_func import upsert_user_reminders
 
     try:
         # ───────────── Fetch current cache or init ─────────────
@@ -336,34 +289,22 @@ async def update_user_reminders_fields(
             keys = field_path.split(".")
             if not keys:
                 raise ValueError(f"Invalid field_path: {field_path}")
+            _deep_set(current_reminders, keys, value)
+        for field_path in removals:
+            keys = field_path.split(".")
             d = current_reminders
             for k in keys[:-1]:
-                if k not in d or not isinstance(d[k], dict):
-                    d[k] = {}
-                d = d[k]
-            d[keys[-1]] = value
+                d = d.get(k) if isinstance(d, dict) else None
+            if isinstance(d, dict):
+                d.pop(keys[-1], None)
 
         # Save back to cache immediately
         user_reminders_cache[user_id] = current_reminders
 
-        # ───────────── Prepare nested update for DB ─────────────
-        # Build a dict grouped by top-level section
-        nested_updates = {}
-        for field_path, value in updates.items():
-            keys = field_path.split(".")
-            section = keys[0]
-            d = nested_updates.setdefault(section, {})
-            # Traverse / set the rest
-            for k in keys[1:-1]:
-                if k not in d or not isinstance(d[k], dict):
-                    d[k] = {}
-                d = d[k]
-            d[keys[-1]] = value
-
-        # ───────────── Upsert to DB ─────────────
-        merged = await upsert_user_reminders(bot, user_id, user_name, nested_updates)
-
-        # Update cache with merged DB result for safety
+        # ───────────── Patch DB, refresh cache from result ─────────────
+        merged = await _patch_user_reminders(
+            bot, user_id, user_name, updates, removals
+        )
         if merged:
             user_reminders_cache[user_id] = merged
 
@@ -19,20 +19,10 @@ from dotenv import load_dotenv
 # ── 🧸 Project-Specific Imports 🧸 ──
 from config.current_setup import *
 from utils.background_task.scheduler import setup_scheduler
-from utils.cache.centralized_cache import load_all_caches
+from utils.cache.cache_snapshot import restore_cache_snapshot
+from utils.cache.centralized_cache import load_all_caches, refresh_due_caches
 from utils.essentials.get_pg_pool import get_pg_pool
 from utils.essentials.role_checks import *
-from utils.listener_func.ball_reco_ping import processed_pokemon_spawns
-from utils.listener_func.explore_caught_listener import (
-    processed_explore_caught_messages,
-)
-from utils.listener_func.faction_ball_alert import processed_faction_ball_alerts
-from utils.listener_func.fish_reco_ping import processed_fishing_messages
-from utils.listener_func.halloween_contest_listener import (
-    processed_halloween_score_message_ids,
-)
-from utils.listener_func.pokemon_caught import processed_caught_messages
-from utils.listener_func.weekly_stats_syncer import processed_weekly_stats_messages
 from utils.loggers.pretty_logs import pretty_log, set_minccino_bot
 from utils.loggers.rate_limit_logger import setup_rate_limit_logging
 
@@ -220,26 +210,16 @@ async def startup_tasks():
 
 
 # ── ⏱️🧸 Refresh All Caches 🧸⏱️ ──
-@tasks.loop(hours=1)
+@tasks.loop(minutes=10)
 async def refresh_all_caches():
     # Skip the very first run
     if not hasattr(refresh_all_caches, "has_run"):
         refresh_all_caches.has_run = True
         return
 
-    await load_all_caches(bot)
-    processed_fishing_messages.clear()
-    processed_caught_messages.clear()
-    processed_explore_caught_messages.clear()
-    processed_pokemon_spawns.clear()
-    processed_faction_ball_alerts.clear()
-    processed_weekly_stats_messages.clear()
-    # processed_halloween_score_message_ids.clear()
-    pretty_log(
-        tag="",
-        message="All caches refreshed and processed messages are cleared.",
-        label="🧸 Cache Refresher",
-    )
+    # 💠 Each cache reloads on its own interval (see centralized_cache);
+    # processed_* message dedupes expire on their own (MessageDedupe)
+    await refresh_due_caches(bot)
 
 
 # ╭───────────────────────────────╮
@@ -389,6 +369,9 @@ async def main():
     load_dotenv()
     pretty_log("ready", "MinccinoBot is starting...")
 
+    # 💾 Warm start: serve from the last snapshot until load_all_caches reconciles
+    restore_cache_snapshot()
+
     token = (os.getenv("DISCORD_TOKEN") or "").strip()
     if not token:
         pretty_log("error", "DISCORD_TOKEN is missing or empty. Aborting startup.")
@@ -66,20 +66,23 @@ async def berry_reminder_checker(bot: discord.Client):
     if not due_reminders:
         # debug_log("No due berry reminders found. Exiting checker.")
         return
-    debug_log(f"Found {len(due_reminders)} due reminders. Getting guild...")
+    debug_log("Found %s due reminders. Getting guild...", len(due_reminders))
     guild = bot.get_guild(STRAYMONS_GUILD_ID)
 
     # Group reminders by user and channel ONLY
     from collections import defaultdict
 
     due_reminders_count = len(due_reminders)
-    debug_log(f"Fetched {due_reminders_count} due berry reminders from the database.")
+    debug_log("Fetched %s due berry reminders from the database.", due_reminders_count)
     user_channel_reminders = defaultdict(list)
 
     for reminder in due_reminders:
         now_epoch = int(time.time())
         debug_log(
-            f"Processing reminder: {reminder} | grows_on={reminder['grows_on']} | now={now_epoch}"
+            "Processing reminder: %s | grows_on=%s | now=%s",
+            reminder,
+            reminder["grows_on"],
+            now_epoch,
         )
         key = (
             reminder["user_id"],
@@ -87,7 +90,7 @@ async def berry_reminder_checker(bot: discord.Client):
             reminder["channel_id"],
             reminder["channel_name"],
         )
-        debug_log(f"Assigning reminder to user/channel key: {key}")
+        debug_log("Assigning reminder to user/channel key: %s", key)
         user_channel_reminders[key].append(reminder)
 
     for (
@@ -98,13 +101,17 @@ async def berry_reminder_checker(bot: discord.Client):
     ), reminders in user_channel_reminders.items():
         try:
             debug_log(
-                f"Handling reminders for user_id={user_id}, user_name={user_name}, "
-                f"channel_id={channel_id}, channel_name={channel_name}, reminders_count={len(reminders)}"
+                "Handling reminders for user_id=%s, user_name=%s, channel_id=%s, channel_name=%s, reminders_count=%s",
+                user_id,
+                user_name,
+                channel_id,
+                channel_name,
+                len(reminders),
             )
 
             # Sort by slot_number for consistency
             user = guild.get_member(user_id) if guild else None
-            debug_log(f"Fetched user: {user} for user_id={user_id}")
+            debug_log("Fetched user: %s for user_id=%s", user, user_id)
             mention = user.mention if user else user_name
             reminders.sort(key=lambda r: r["slot_number"])
 
@@ -112,7 +119,9 @@ async def berry_reminder_checker(bot: discord.Client):
             to_be_harvested_berry_names = []
             for reminder in reminders:
                 debug_log(
-                    f"Processing reminder for slot {reminder['slot_number']}: {reminder}"
+                    "Processing reminder for slot %s: %s",
+                    reminder["slot_number"],
+                    reminder,
                 )
                 water_can_type = reminder.get("water_can_type", "unknown")
                 stage = reminder.get("stage", "unknown")
@@ -130,7 +139,13 @@ async def berry_reminder_checker(bot: discord.Client):
                 slot_number = reminder["slot_number"]
                 berry_emoji = berry_map.get(berry_name_raw, {}).get("emoji", "")
                 debug_log(
-                    f"water_can_type={water_can_type}, stage={stage}, next_stage={next_stage}, mulch_type={mulch_type}, slot_number={slot_number}, berry_name_raw={berry_name_raw}"
+                    "water_can_type=%s, stage=%s, next_stage=%s, mulch_type=%s, slot_number=%s, berry_name_raw=%s",
+                    water_can_type,
+                    stage,
+                    next_stage,
+                    mulch_type,
+                    slot_number,
+                    berry_name_raw,
                 )
                 if water_can_type != "unknown" and stage != "unknown":
                     if (
@@ -138,11 +153,14 @@ async def berry_reminder_checker(bot: discord.Client):
                         or water_can_type.lower() == "wailmer pail"
                     ):
                         debug_log(
-                            f"Sprayduck/Wailmer Pail used for slot {slot_number}. next_stage={next_stage}"
+                            "Sprayduck/Wailmer Pail used for slot %s. next_stage=%s",
+                            slot_number,
+                            next_stage,
                         )
                         if next_stage.lower() != "berry":
                             debug_log(
-                                f"Updating growth stage for slot {slot_number} (not berry stage)"
+                                "Updating growth stage for slot %s (not berry stage)",
+                                slot_number,
                             )
                             await update_growth_stage_func(
                                 bot,
@@ -163,33 +181,43 @@ async def berry_reminder_checker(bot: discord.Client):
                         else:
                             context = "watering stage"
                             debug_log(
-                                f"Growth paused for slot {slot_number}, removing reminder."
+                                "Growth paused for slot %s, removing reminder.",
+                                slot_number,
                             )
 
                 berry_name = f"{berry_emoji} {berry_name_raw.title()} (Slot {slot_number})".strip()
                 debug_log(
-                    f"Prepared berry name: {berry_name} (raw: {berry_name_raw}) for context: {context}"
+                    "Prepared berry name: %s (raw: %s) for context: %s",
+                    berry_name,
+                    berry_name_raw,
+                    context,
                 )
                 if context == "watering stage":
                     to_be_watered_berry_names.append(berry_name)
                     debug_log(
-                        f"Added to watering list: {berry_name} for slot {slot_number}"
+                        "Added to watering list: %s for slot %s",
+                        berry_name,
+                        slot_number,
                     )
                 else:
                     to_be_harvested_berry_names.append(berry_name)
                     debug_log(
-                        f"Added to harvesting list: {berry_name} for slot {slot_number}"
+                        "Added to harvesting list: %s for slot %s",
+                        berry_name,
+                        slot_number,
                     )
                 if not to_be_watered_berry_names and not to_be_harvested_berry_names:
                     debug_log(
-                        f"No berries to be watered or harvested for user_id={user_id} after processing reminders. Skipping message sending."
+                        "No berries to be watered or harvested for user_id=%s after processing reminders. Skipping message sending.",
+                        user_id,
                     )
                     continue
 
             # Compose message depending on how many berries are due
             if not to_be_watered_berry_names and not to_be_harvested_berry_names:
                 debug_log(
-                    f"No berries to be watered or harvested for user_id={user_id} after processing reminders. Skipping message sending."
+                    "No berries to be watered or harvested for user_id=%s after processing reminders. Skipping message sending.",
+                    user_id,
                 )
                 continue
 
@@ -199,10 +227,10 @@ async def berry_reminder_checker(bot: discord.Client):
             to_be_harvested_field_name = (
                 "Berries to be harvested. Use `;berry harvest` to harvest them:"
             )
-            debug_log(f"Composing embed for user {user_name} (ID: {user_id})")
+            debug_log("Composing embed for user %s (ID: %s)", user_name, user_id)
             embed = discord.Embed(color=0x66CC66)
             if to_be_watered_berry_names:
-                debug_log(f"Adding watered berries field: {to_be_watered_berry_names}")
+                debug_log("Adding watered berries field: %s", to_be_watered_berry_names)
                 embed.add_field(
                     name=to_be_watered_field_name,
                     value="\n".join(to_be_watered_berry_names),
@@ -210,7 +238,8 @@ async def berry_reminder_checker(bot: discord.Client):
                 )
             if to_be_harvested_berry_names:
                 debug_log(
-                    f"Adding harvested berries field: {to_be_harvested_berry_names}"
+                    "Adding harvested berries field: %s",
+                    to_be_harvested_berry_names,
                 )
                 embed.add_field(
                     name=to_be_harvested_field_name,
@@ -229,12 +258,14 @@ async def berry_reminder_checker(bot: discord.Client):
             embed.set_thumbnail(url=thumbnail_url)
             embed.set_image(url=MINC_DIVIDER.flowers)
 
-            debug_log(f"Composed message: {msg}")
+            debug_log("Composed message: %s", msg)
 
             # Send to the channel resolved by id.
             channel = bot.get_channel(channel_id)
             debug_log(
-                f"Looking up channel by id: {channel_id}, expected name: {channel_name}"
+                "Looking up channel by id: %s, expected name: %s",
+                channel_id,
+                channel_name,
             )
             if not channel:
                 pretty_log(
@@ -246,14 +277,24 @@ async def berry_reminder_checker(bot: discord.Client):
 
             if channel.name != channel_name:
                 debug_log(
-                    f"Channel name mismatch for id {channel_id}: expected '{channel_name}', got '{channel.name}'. Sending anyway by channel id."
+                    "Channel name mismatch for id %s: expected '%s', got '%s'. Sending anyway by channel id.",
+                    channel_id,
+                    channel_name,
+                    channel.name,
                 )
 
             debug_log(
-                f"Found channel: {channel} (name: {channel.name}) in guild: {channel.guild.name}"
+                "Found channel: %s (name: %s) in guild: %s",
+                channel,
+                channel.name,
+                channel.guild.name,
             )
             debug_log(
-                f"Attempting to send message to channel {channel.name} (ID: {channel.id}) for user {user_name} (ID: {user_id})"
+                "Attempting to send message to channel %s (ID: %s) for user %s (ID: %s)",
+                channel.name,
+                channel.id,
+                user_name,
+                user_id,
             )
 
             dispatch_key = (
@@ -269,7 +310,9 @@ async def berry_reminder_checker(bot: discord.Client):
                 and now_epoch - last_sent_epoch < BERRY_DISPATCH_DEDUP_SECONDS
             ):
                 debug_log(
-                    f"Skipping duplicate berry reminder for user_id={user_id} in channel_id={channel_id}."
+                    "Skipping duplicate berry reminder for user_id=%s in channel_id=%s.",
+                    user_id,
+                    channel_id,
                 )
                 continue
 
@@ -291,7 +334,11 @@ async def berry_reminder_checker(bot: discord.Client):
                 bot=bot,
             )
             debug_log(
-                f"Sent message to channel {channel.name} (ID: {channel.id}) for user {user_name} (ID: {user_id})"
+                "Sent message to channel %s (ID: %s) for user %s (ID: %s)",
+                channel.name,
+                channel.id,
+                user_name,
+                user_id,
             )
 
             # Remove each berry reminder after sending — use the actual reminder slot_number
@@ -301,7 +348,9 @@ async def berry_reminder_checker(bot: discord.Client):
                     == "berry"
                 ):
                     debug_log(
-                        f"Removing berry reminder for user_id={user_id}, slot_number={reminder['slot_number']}"
+                        "Removing berry reminder for user_id=%s, slot_number=%s",
+                        user_id,
+                        reminder["slot_number"],
                     )
                     await remove_berry_reminder(
                         bot, user_id, slot_number=reminder["slot_number"]
@@ -309,7 +358,9 @@ async def berry_reminder_checker(bot: discord.Client):
                 else:
                     # Update growth stage to next_stage for non-berry reminders after sending reminder
                     debug_log(
-                        f"Updating growth stage to next_stage for user_id={user_id}, slot_number={reminder['slot_number']}"
+                        "Updating growth stage to next_stage for user_id=%s, slot_number=%s",
+                        user_id,
+                        reminder["slot_number"],
                     )
                     mulch_type = reminder.get("mulch_type") or "unknown"
                     await update_growth_stage_func(
@@ -327,4 +378,4 @@ async def berry_reminder_checker(bot: discord.Client):
                 f"Failed to process berry reminders for {user_name} (user_id: {user_id}): {e}",
                 bot=bot,
             )
-            debug_log(f"Exception occurred while processing user reminders: {e}")
+            debug_log("Exception occurred while processing user reminders: %s", e)
@@ -0,0 +1,205 @@
+# 🟣────────────────────────────────────────────
+#        ⏰ Due-Time Reminder Scheduler ⏰
+# ─────────────────────────────────────────────
+# Replaces the 60-second polling of the reminder checkers. Every write of a
+# due timestamp (berry grows_on, moisture_dries_on, reminder ends_on, ...)
+# calls schedule_due(kind, ts). One task sleeps on a min-heap until the
+# earliest timestamp and then runs that kind's checker, which still does
+# the actual fetch-due-rows / notify / delete work.
+#
+# At startup each kind is seeded from a single scan of its table and every
+# checker runs once to recover anything that came due while offline.
+#
+# Checkers swallow their per-row failures (missing channel, failed send,
+# mode "off", ...), so after every run the kind's pending due times are read
+# again: anything still overdue is retried RERUN_DELAY_SECONDS later, like
+# the old 60-second poll did.
+import asyncio
+import heapq
+import itertools
+import time
+
+from utils.essentials.perf_stats import perf_timer
+from utils.loggers.pretty_logs import pretty_log
+
+PERF_GROUP = "⏰ DUE SCHEDULER"
+
+# 🔹 Kinds, one per checker
+FEELING_LUCKY = "fl_cd_checker"
+BERRY_GROWTH = "berry_reminder_checker"
+BERRY_WATER = "berry_water_reminder"
+POKEMON_REMINDER = "pokemon_reminder_checker"
+SPECIAL_BATTLE = "special_battle_timer_checker"
+WORLD_BOSS = "wb_battle_reminder_checker"
+
+DUE_SLACK_SECONDS = 1.0  # run slightly after the due second so the DB agrees it is due
+RETRY_AFTER_ERROR_SECONDS = 60
+# 🔹 A checker that re-queues its own kind at a past time would run again
+# straight away, forever; such items, and rows a run left overdue, wait this
+# long instead (the old poll rate)
+RERUN_DELAY_SECONDS = 60
+
+
+def _epoch(due_ts) -> float:
+    if hasattr(due_ts, "timestamp"):  # datetime columns
+        return due_ts.timestamp()
+    return due_ts
+
+
+# 💠────────────────────────────────────────────
+# [🟣 CLASS] DueScheduler
+# ─────────────────────────────────────────────
+class DueScheduler:
+    """
+    Min-heap of (due_ts, kind) with one sleeper task.
+
+    - register(kind, checker, seed, pending): checker(bot) handles every due
+      row of that kind; seed(bot) returns the pending due timestamps at
+      startup; pending(bot) (default: seed) returns them after each run, to
+      retry rows the checker left overdue
+    - schedule(kind, due_ts): wakes the sleeper if the new item is earliest
+    """
+
+    def __init__(self):
+        self.bot = None
+        self._checkers: dict[str, object] = {}
+        self._seeds: dict[str, object] = {}
+        self._pending: dict[str, object] = {}
+        self._heap: list[tuple[float, int, str]] = []
+        self._queued: set[tuple[str, int]] = set()
+        self._counter = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._running: str | None = None
+
+    # 🔹 Registration
+    def register(self, kind: str, checker, seed=None, pending=None):
+        self._checkers[kind] = checker
+        if seed:
+            self._seeds[kind] = seed
+        if pending or seed:
+            self._pending[kind] = pending or seed
+
+    # 🔹 Producer side
+    def schedule(self, kind: str, due_ts: int | float | None):
+        """Queues one due timestamp; duplicates of the same (kind, second) are merged."""
+        if not due_ts:
+            return
+        due_ts = int(_epoch(due_ts))
+        if kind == self._running and due_ts <= time.time():
+            due_ts = int(time.time()) + RERUN_DELAY_SECONDS
+        if (kind, due_ts) in self._queued:
+            return
+        self._queued.add((kind, due_ts))
+        heapq.heappush(self._heap, (due_ts, next(self._counter), kind))
+        if self._heap[0][0] == due_ts:
+            self._wakeup.set()
+
+    def next_due(self) -> tuple[int, str] | None:
+        return (self._heap[0][0], self._heap[0][2]) if self._heap else None
+
+    def __len__(self):
+        return len(self._heap)
+
+    # 🔹 Consumer side
+    def start(self, bot):
+        """Seeds from the DB, runs a recovery pass and starts the sleeper once."""
+        self.bot = bot
+        if self._task and not self._task.done():
+            return self._task
+        self._task = asyncio.create_task(self._run())
+        return self._task
+
+    def stop(self):
+        if self._task and not self._task.done():
+            self._task.cancel()
+        self._task = None
+
+    async def _recover(self):
+        for kind, seed in self._seeds.items():
+            try:
+                timestamps = await seed(self.bot)
+                for due_ts in timestamps:
+                    self.schedule(kind, due_ts)
+                pretty_log(
+                    "info",
+                    f"Seeded {len(timestamps)} pending {kind} due times",
+                    label=PERF_GROUP,
+                )
+            except Exception as e:
+                pretty_log(
+                    "error",
+                    f"Failed to seed {kind} due times: {e}",
+                    label=PERF_GROUP,
+                )
+        # 🔹 Anything already overdue is handled by one pass of every checker;
+        # items that come due while it runs stay queued for the main loop
+        started = time.time()
+        for kind in self._checkers:
+            await self._run_checker(kind)
+        self._pop_due(started)
+
+    async def _run_checker(self, kind: str):
+        self._running = kind
+        try:
+            async with perf_timer(PERF_GROUP, kind):
+                await self._checkers[kind](bot=self.bot)
+            await self._retry_leftovers(kind)
+        except Exception as e:
+            pretty_log(
+                "error",
+                f"{kind} checker failed, retrying in {RETRY_AFTER_ERROR_SECONDS}s: {e}",
+                label=PERF_GROUP,
+            )
+            self.schedule(kind, time.time() + RETRY_AFTER_ERROR_SECONDS)
+        finally:
+            self._running = None
+
+    async def _retry_leftovers(self, kind: str):
+        """Re-queues the kind if rows are still overdue after its checker ran."""
+        pending = self._pending.get(kind)
+        if not pending:
+            return
+        now = time.time()
+        timestamps = await pending(self.bot)
+        if any(due_ts and _epoch(due_ts) <= now for due_ts in timestamps):
+            self.schedule(kind, now + RERUN_DELAY_SECONDS)
+
+    def _pop_due(self, now: float) -> list[str]:
+        """Pops every item due by `now`, returns each due kind once, in due order."""
+        kinds: list[str] = []
+        while self._heap and self._heap[0][0] + DUE_SLACK_SECONDS <= now:
+            due_ts, _, kind = heapq.heappop(self._heap)
+            self._queued.discard((kind, due_ts))
+            if kind not in kinds:
+                kinds.append(kind)
+        return kinds
+
+    async def _run(self):
+        await self.bot.wait_until_ready()
+        await self._recover()
+        pretty_log("", "✅ Due scheduler started!", label=PERF_GROUP)
+
+        while not self.bot.is_closed():
+            self._wakeup.clear()
+            for kind in self._pop_due(time.time()):
+                if kind in self._checkers:
+                    await self._run_checker(kind)
+            if self._wakeup.is_set():
+                continue  # 💤 something was scheduled while checkers ran
+
+            timeout = None
+            if self._heap:
+                timeout = max(0.0, self._heap[0][0] + DUE_SLACK_SECONDS - time.time())
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
+
+due_scheduler = DueScheduler()
+
+
+def schedule_due(kind: str, due_ts: int | float | None):
+    """Tell the due scheduler that `kind` has something due at `due_ts`."""
+    due_scheduler.schedule(kind, due_ts)
@@ -273,7 +273,10 @@ async def pokemon_reminder_checker(bot: discord.Client):
                             await target_channel.send(embed=embed)
 
                             await update_catchbot_reminds_next_on(
-                                bot, user_id, minutes=repeating, ends_on=ends_on_ts
+                                bot,
+                                user_id,
+                                minutes=repeating,
+                                ends_on=remind_next_on_ts,
                             )
 
                             pretty_log(
@@ -301,7 +304,7 @@ async def pokemon_reminder_checker(bot: discord.Client):
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # 🧹 Helper: Clear expired reminder fields by type (cache + DB)
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-import json
+from utils.essentials.db_json_helper import patch_json_fields
 
 
 async def clear_expired_reminder_fields(bot, user_id: int, reminder_type: str):
@@ -322,12 +325,13 @@ async def clear_expired_reminder_fields(bot, user_id: int, reminder_type: str):
         return
 
     entry = reminders[reminder_type]
-    changed = False
+    updates: dict = {}
+    removals: list[str] = []
 
     if reminder_type == "relics":
         if entry.get("expiration_timestamp") is not None:
             entry["expiration_timestamp"] = None
-            changed = True
+            updates["relics.expiration_timestamp"] = None
             pretty_log(
                 "info",
                 f"[REMINDER] Cleared relics expiration_timestamp for {user_id}",
@@ -337,7 +341,7 @@ async def clear_expired_reminder_fields(bot, user_id: int, reminder_type: str):
     elif reminder_type == "catchbot":
         if "returns_on" in entry:
             entry["returns_on"] = None
-            changed = True
+            updates["catchbot.returns_on"] = None
             pretty_log(
                 "info",
                 f"[REMINDER] Cleared catchbot returns_on for {user_id}",
@@ -348,34 +352,35 @@ async def clear_expired_reminder_fields(bot, user_id: int, reminder_type: str):
             # remove keys completely if no repeating
             entry.pop("returns_on", None)
             entry.pop("reminds_next_on", None)
-            changed = True
+            updates.pop("catchbot.returns_on", None)
+            removals += ["catchbot.returns_on", "catchbot.reminds_next_on"]
             pretty_log(
                 "info",
                 f"[REMINDER] Removed catchbot schedule (no repeat) for {user_id}",
                 bot=bot,
             )
 
-    # 🔹 Push updates to DB if changes happened
-    if changed:
-        try:
-            async with bot.pg_pool.acquire() as conn:
-                await conn.execute(
-                    """
-                    UPDATE user_pokemeow_reminders
-                    SET reminders = $2
-                    WHERE user_id = $1
-                    """,
-                    user_id,
-                    json.dumps(reminders),
-                )
-            pretty_log(
-                "db",
-                f"[REMINDER] Synced cleanup of {reminder_type} for {user_id} → DB updated",
-                bot=bot,
-            )
-        except Exception as e:
+    # 🔹 Push only the changed paths to DB; the cache takes what the DB returns
+    if updates or removals:
+        patched = await patch_json_fields(
+            bot,
+            "user_pokemeow_reminders",
+            "user_id",
+            user_id,
+            "reminders",
+            updates,
+            removals=removals,
+        )
+        if patched is None:
             pretty_log(
                 "error",
-                f"[REMINDER] Failed DB cleanup sync for {reminder_type} → {user_id}: {e}",
+                f"[REMINDER] Failed DB cleanup sync for {reminder_type} → {user_id}",
                 bot=bot,
             )
+            return
+        user_reminders_cache[user_id] = patched
+        pretty_log(
+            "db",
+            f"[REMINDER] Synced cleanup of {reminder_type} for {user_id} → DB updated",
+            bot=bot,
+        )
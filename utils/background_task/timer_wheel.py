@@ -0,0 +1,151 @@
+# 🟣────────────────────────────────────────────
+#        🎡 Ready-Notification Timer Wheel 🎡
+# ─────────────────────────────────────────────
+# Short "your command is ready" timers (pokemon 11s, fish 25s, battle 60s)
+# used to be one asyncio task per spawn, cancelled and re-created on every
+# command. They now live in one hashed timer wheel keyed by (user_id, kind):
+#
+# - schedule / cancel / reschedule are O(1) dict operations on one slot
+# - a single driver coroutine ticks while anything is pending, fires every
+#   entry of the elapsed slots as one batch, and goes idle when empty
+# - fired and cancelled entries are removed, so nothing accumulates
+#
+# Callbacks are plain callables (queue_send / queue_reaction); one that
+# returns an awaitable is run as a task.
+import asyncio
+import inspect
+import math
+from typing import Callable, Hashable
+
+from utils.loggers.pretty_logs import pretty_log
+
+TIMER_WHEEL_LABEL = "🎡 TIMER WHEEL"
+TICK_SECONDS = 0.25
+WHEEL_SLOTS = 512  # one revolution = 128s; longer delays just wait extra laps
+
+
+class TimerHandle:
+    __slots__ = ("wheel", "key", "callback", "due_tick")
+
+    def __init__(self, wheel: "TimerWheel", key: Hashable, callback, due_tick: int):
+        self.wheel = wheel
+        self.key = key
+        self.callback = callback
+        self.due_tick = due_tick
+
+    @property
+    def active(self) -> bool:
+        return self.wheel._entries.get(self.key) is self
+
+    def cancel(self) -> bool:
+        """Cancels this timer only if it was not replaced by a newer one for its key."""
+        if not self.active:
+            return False
+        return self.wheel.cancel(self.key)
+
+
+# 💠────────────────────────────────────────────
+# [🟣 CLASS] TimerWheel
+# ─────────────────────────────────────────────
+class TimerWheel:
+    def __init__(self, tick: float = TICK_SECONDS, slots: int = WHEEL_SLOTS):
+        self.tick = tick
+        self._slots: list[dict[Hashable, TimerHandle]] = [{} for _ in range(slots)]
+        self._entries: dict[Hashable, TimerHandle] = {}
+        self._origin: float | None = None
+        self._processed = 0  # last tick whose slot was fired
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._callback_tasks: set[asyncio.Task] = set()
+        self.fired = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def _current_tick(self, now: float) -> int:
+        return math.floor((now - self._origin) / self.tick)
+
+    def schedule(
+        self, key: Hashable, delay: float, callback: Callable[[], object]
+    ) -> TimerHandle:
+        """Schedules callback() after `delay` seconds, replacing any timer for `key`."""
+        now = asyncio.get_running_loop().time()
+        if self._origin is None:
+            self._origin = now
+        if not self._entries:
+            # 💠 Idle wheel: skip the empty ticks instead of replaying them
+            self._processed = self._current_tick(now)
+
+        self.cancel(key)
+        due_tick = max(
+            self._processed + 1, math.ceil((now + delay - self._origin) / self.tick)
+        )
+        handle = TimerHandle(self, key, callback, due_tick)
+        self._entries[key] = handle
+        self._slots[due_tick % len(self._slots)][key] = handle
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        self._wakeup.set()
+        return handle
+
+    def cancel(self, key: Hashable) -> bool:
+        handle = self._entries.pop(key, None)
+        if handle is None:
+            return False
+        self._slots[handle.due_tick % len(self._slots)].pop(key, None)
+        return True
+
+    def _pop_due(self, current: int) -> list[TimerHandle]:
+        slot_count = len(self._slots)
+        due: list[TimerHandle] = []
+        # 🔹 After a long stall one revolution already covers every slot
+        first = max(self._processed + 1, current - slot_count + 1)
+        for tick in range(first, current + 1):
+            slot = self._slots[tick % slot_count]
+            if not slot:
+                continue
+            for key, handle in list(slot.items()):
+                if handle.due_tick <= current:
+                    del slot[key]
+                    del self._entries[key]
+                    due.append(handle)
+        self._processed = current
+        return due
+
+    def _fire(self, handle: TimerHandle):
+        try:
+            result = handle.callback()
+            if inspect.isawaitable(result):
+                task = asyncio.ensure_future(result)
+                self._callback_tasks.add(task)
+                task.add_done_callback(self._callback_tasks.discard)
+            self.fired += 1
+        except Exception as e:
+            pretty_log(
+                "error",
+                f"Timer callback for {handle.key} failed: {e}",
+                label=TIMER_WHEEL_LABEL,
+            )
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            if not self._entries:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            next_tick_at = self._origin + (self._processed + 1) * self.tick
+            delay = next_tick_at - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            for handle in self._pop_due(self._current_tick(loop.time())):
+                self._fire(handle)
+
+
+timer_wheel = TimerWheel()
@@ -1,62 +1,79 @@
+import time
+
 import discord
 
 from config.current_setup import MINCCINO_COLOR
 from utils.database.wb_fight_db import (
     fetch_due_wb_battle_reminders,
-    remove_user_wb_battle_alert,
-    remove_wb_reminder,
+    remove_wb_reminders,
 )
 from utils.loggers.pretty_logs import pretty_log
 
+# 🔹 Reminders this late (e.g. due while the bot was down) are dropped silently
+STALE_AFTER_SECONDS = 30 * 60
+MENTIONS_PER_MESSAGE = 50  # keeps each message well under 2000 characters
+
 
 async def check_wb_battle_reminders(bot: discord.Client):
     """
-    Check for due world boss battle reminders and send notifications to users.
+    Sends every due world boss battle reminder and deletes them in bulk.
+    Run by the due scheduler at each fight time; users registered for the
+    same boss in the same channel are pinged in one message.
     """
+    from utils.listener_func.wb_reg_listener import format_display_boss_name
 
     due_reminders = await fetch_due_wb_battle_reminders(bot)
     if not due_reminders:
-        return # No due reminders
+        return  # No due reminders
 
+    now = int(time.time())
+    groups: dict[tuple[int, str], list[dict]] = {}
     for reminder in due_reminders:
-        user_id = reminder["user_id"]
-        user_name = reminder["user_name"]
-        wb_name = reminder["wb_name"]
-        channel_id = reminder["channel_id"]
-        user = bot.get_user(user_id)
-        if not user:
-            # Remove reminder and alert
-            await remove_user_wb_battle_alert(bot, user_id)
-            await remove_wb_reminder(bot, user_id)
+        if now - reminder["remind_on"] > STALE_AFTER_SECONDS:
             continue
+        key = (reminder["channel_id"], reminder["wb_name"])
+        groups.setdefault(key, []).append(reminder)
 
-        try:
-            channel = bot.get_channel(channel_id)
-            if channel:
-                content = f"{user.mention}, You can now join the World Boss Battle for **{wb_name}**!"
-                embed = discord.Embed(
-                    description=";wb f",
-                    color=MINCCINO_COLOR,
-                )
+    for (channel_id, wb_name), reminders in groups.items():
+        channel = bot.get_channel(channel_id)
+        if not channel:
+            pretty_log(
+                "warn",
+                f"Channel ID {channel_id} not found for {len(reminders)} WB battle reminders ({wb_name}).",
+                bot=bot,
+            )
+            continue
+
+        # 🔹 Users the bot can no longer see are skipped
+        mentions = [
+            user.mention
+            for user in (bot.get_user(r["user_id"]) for r in reminders)
+            if user
+        ]
+        display_wb_name = format_display_boss_name(wb_name)
+        embed = discord.Embed(description=";wb f", color=MINCCINO_COLOR)
+        for start in range(0, len(mentions), MENTIONS_PER_MESSAGE):
+            chunk = " ".join(mentions[start : start + MENTIONS_PER_MESSAGE])
+            content = f"{chunk}, You can now join the World Boss Battle for **{display_wb_name}**!"
+            try:
                 await channel.send(content=content, embed=embed)
+            except Exception as e:
                 pretty_log(
-                    "info",
-                    f"Sent WB battle reminder to {user_name} for {wb_name}.",
+                    "error",
+                    f"Failed to send WB battle reminders in {channel_id} for {wb_name}: {e}",
                     bot=bot,
                 )
-            else:
-                pretty_log(
-                    "warn",
-                    f"Channel ID {channel_id} not found for WB battle reminder of user {user_name}.",
-                    bot=bot,
-                )
-
-            # Remove the reminder after sending notification
-            await remove_wb_reminder(bot, user_id)
+        pretty_log(
+            "info",
+            f"Sent WB battle reminder for {wb_name} to {len(mentions)} users in {channel_id}.",
+            bot=bot,
+        )
 
-        except Exception as e:
-            pretty_log(
-                "error",
-                f"Failed to send WB battle reminder to {user_name} for {wb_name}: {e}",
-                bot=bot,
-            )
+    # Remove every handled reminder (sent, stale or unreachable) at once
+    await remove_wb_reminders(
+        bot,
+        [
+            (reminder["user_id"], reminder["wb_name"], reminder["remind_on"])
+            for reminder in due_reminders
+        ],
+    )
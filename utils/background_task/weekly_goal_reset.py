@@ -10,18 +10,14 @@ from utils.loggers.pretty_logs import pretty_log
 # -----------------------------
 async def reset_weekly_goals(bot):
     """Reset the weekly_goal_tracker table and in-memory cache."""
-    from utils.cache.weekly_goal_tracker_cache import (
-        weekly_goal_cache,
-        weekly_goal_cache_dirty,
-    )
+    from utils.cache.weekly_goal_tracker_cache import clear_weekly_goal_cache
 
     async with bot.pg_pool.acquire() as conn:
         # Clear DB
         await conn.execute("TRUNCATE TABLE weekly_goal_tracker;")
 
     # Clear in-memory cache
-    weekly_goal_cache.clear()
-    weekly_goal_cache_dirty.clear()
+    clear_weekly_goal_cache()
 
     goal_tracker_channel = bot.get_channel(STRAYMONS__TEXT_CHANNELS.goal_tracker)
     if goal_tracker_channel:
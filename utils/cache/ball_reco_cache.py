@@ -15,37 +15,41 @@ import json
 ball_reco_cache: dict[int, dict] = {}
 
 
+def ball_reco_row_to_entry(row: dict) -> dict:
+    # Parse JSON columns if they are strings
+    held_items = row.get("held_items") or {}
+    if isinstance(held_items, str):
+        held_items = json.loads(held_items)
+
+    pokemon = row.get("pokemon") or {}
+    if isinstance(pokemon, str):
+        pokemon = json.loads(pokemon)
+
+    fishing = row.get("fishing") or {}
+    if isinstance(fishing, str):
+        fishing = json.loads(fishing)
+
+    return {
+        "user_name": row.get("user_name"),
+        "is_patreon": row.get("is_patreon", False),
+        "catch_rate_bonus": row.get("catch_rate_bonus", 0),
+        "held_items": held_items,
+        "pokemon": pokemon,
+        "fishing": fishing,
+        "enabled": row.get("enabled", False),  # <-- add this
+    }
+
+
 async def load_ball_reco_cache(bot):
     """
     Load all user ball recommendation preferences into memory cache.
     Uses the fetch_all_user_recs DB function.
     """
-    ball_reco_cache.clear()
-
     rows = await fetch_all_user_recs(bot)
+    # 🔹 Clear only after the fetch, so readers never see an empty cache
+    ball_reco_cache.clear()
     for row in rows:
-        # Parse JSON columns if they are strings
-        held_items = row.get("held_items") or {}
-        if isinstance(held_items, str):
-            held_items = json.loads(held_items)
-
-        pokemon = row.get("pokemon") or {}
-        if isinstance(pokemon, str):
-            pokemon = json.loads(pokemon)
-
-        fishing = row.get("fishing") or {}
-        if isinstance(fishing, str):
-            fishing = json.loads(fishing)
-
-        ball_reco_cache[row["user_id"]] = {
-            "user_name": row.get("user_name"),
-            "is_patreon": row.get("is_patreon", False),
-            "catch_rate_bonus": row.get("catch_rate_bonus", 0),
-            "held_items": held_items,
-            "pokemon": pokemon,
-            "fishing": fishing,
-            "enabled": row.get("enabled", False),  # <-- add this
-        }
+        ball_reco_cache[row["user_id"]] = ball_reco_row_to_entry(row)
 
     return ball_reco_cache
 
@@ -11,9 +11,10 @@ async def load_boosted_channels_cache(bot):
     """
     Load all boosted channels into memory.
     """
-    boosted_channels_cache.clear()
     try:
         rows = await fetch_all_boosted_channels(bot)
+        # 🔹 Clear only after the fetch, so readers never see an empty cache
+        boosted_channels_cache.clear()
         for row in rows:
             channel_id = row["channel_id"]
             channel_name = row["channel_name"]
@@ -0,0 +1,372 @@
+# 🟣────────────────────────────────────────────
+#     📣 Postgres LISTEN/NOTIFY Cache Sync 📣
+# ─────────────────────────────────────────────
+# A row trigger on every cached table sends
+#   pg_notify('minccino_cache', {"table": ..., "key": ..., "op": ...})
+# for any INSERT / UPDATE / DELETE, whoever made it: this process, a second
+# bot process or a manual edit. One dedicated connection LISTENs and, per
+# table, either re-reads just that row into its cache (row mirror) or
+# reloads the whole cache through the cache registry (table reload).
+#
+# Bursts are coalesced: keys are collected for a short moment and a table
+# with too many changed rows is reloaded once instead of row by row.
+# After the listener reconnects, every synced cache is reloaded because
+# notifications sent while disconnected are lost.
+#
+# Triggers are installed once per process start, and only where they are
+# missing or differ: trigger DDL locks its table, and several processes
+# share the database.
+#
+# The row mirrors double as the single-key refresh API: refresh_cache_entry
+# re-reads one key of one cache, refresh_user_rows re-reads one user's rows
+# of several caches in a single statement (e.g. for /settings).
+import asyncio
+import json
+
+import asyncpg
+
+from utils.cache.cache_registry import load_registered_caches
+from utils.loggers.pretty_logs import pretty_log
+
+NOTIFY_CHANNEL = "minccino_cache"
+NOTIFY_LABEL = "📣 CACHE NOTIFY"
+COALESCE_SECONDS = 0.5
+MAX_ROW_REFRESHES = 50  # more changed rows than this → one full reload
+RECONNECT_CHECK_SECONDS = 30
+DDL_LOCK_TIMEOUT = "2s"  # never queue behind open transactions on cached tables
+TRIGGER_SUFFIX = "_minccino_cache_notify"
+
+NOTIFY_FUNCTION_SQL = f"""
+CREATE OR REPLACE FUNCTION minccino_cache_notify() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify(
+        '{NOTIFY_CHANNEL}',
+        json_build_object(
+            'table', TG_TABLE_NAME,
+            'key', to_jsonb(COALESCE(NEW, OLD)) ->> TG_ARGV[0],
+            'op', TG_OP
+        )::text
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+# 💠────────────────────────────────────────────
+#   Registrations
+# ─────────────────────────────────────────────
+class RowMirror:
+    """
+    Keeps `cache[key]` equal to `to_entry(row)` for one table row.
+
+    - where: extra SQL filter, e.g. "alert_type = 'captcha'" for shared tables
+    - after(key, entry): keeps secondary indexes in step; entry is None on removal
+    """
+
+    __slots__ = ("cache_name", "cache", "to_entry", "where", "after")
+
+    def __init__(
+        self, cache_name: str, cache: dict, to_entry, where: str = "", after=None
+    ):
+        self.cache_name = cache_name
+        self.cache = cache
+        self.to_entry = to_entry
+        self.where = where
+        self.after = after
+
+
+class NotifyTable:
+    __slots__ = ("key_column", "cache_names", "mirrors")
+
+    def __init__(self, key_column: str):
+        self.key_column = key_column
+        self.cache_names: list[str] = []
+        self.mirrors: list[RowMirror] = []
+
+
+notify_tables: dict[str, NotifyTable] = {}
+
+
+def _notify_table(table: str, key_column: str) -> NotifyTable:
+    entry = notify_tables.setdefault(table, NotifyTable(key_column))
+    entry.key_column = key_column
+    return entry
+
+
+def register_row_mirror(
+    table: str,
+    cache_name: str,
+    cache: dict,
+    to_entry,
+    key_column: str = "user_id",
+    where: str = "",
+    after=None,
+):
+    """A change to one row of `table` re-reads only that row into `cache`."""
+    entry = _notify_table(table, key_column)
+    if cache_name not in entry.cache_names:
+        entry.cache_names.append(cache_name)
+    entry.mirrors.append(RowMirror(cache_name, cache, to_entry, where, after))
+
+
+def register_table_reload(table: str, cache_name: str, key_column: str = "user_id"):
+    """A change to `table` reloads the registered cache `cache_name`."""
+    entry = _notify_table(table, key_column)
+    if cache_name not in entry.cache_names:
+        entry.cache_names.append(cache_name)
+
+
+# 💠────────────────────────────────────────────
+#   Single-key refresh
+# ─────────────────────────────────────────────
+def _swap_rows(key, mirrored_rows: list[tuple[RowMirror, dict | None]]):
+    """Applies freshly read rows to their caches, with no await in between."""
+    for mirror, row in mirrored_rows:
+        if row:
+            value = mirror.to_entry(row)
+            mirror.cache[key] = value
+        else:
+            value = None
+            mirror.cache.pop(key, None)
+        if mirror.after:
+            mirror.after(key, value)
+
+
+def _mirror_select(table: str, key_column: str, mirror: RowMirror) -> str:
+    where = f" AND {mirror.where}" if mirror.where else ""
+    return f"SELECT * FROM {table} WHERE {key_column} = $1{where}"
+
+
+async def refresh_cached_row(bot, table: str, key):
+    """Re-reads one row of `table` into every cache that mirrors it."""
+    entry = notify_tables[table]
+    async with bot.pg_pool.acquire() as conn:
+        rows = []
+        for mirror in entry.mirrors:
+            row = await conn.fetchrow(
+                _mirror_select(table, entry.key_column, mirror), key
+            )
+            rows.append((mirror, dict(row) if row else None))
+    _swap_rows(key, rows)
+
+
+async def refresh_cache_entry(bot, cache_name: str, key):
+    """Fetch-and-swap of `cache[key]` for one registered cache, by its name."""
+    for table, entry in notify_tables.items():
+        for mirror in entry.mirrors:
+            if mirror.cache_name == cache_name:
+                row = await bot.pg_pool.fetchrow(
+                    _mirror_select(table, entry.key_column, mirror), key
+                )
+                _swap_rows(key, [(mirror, dict(row) if row else None)])
+                return
+    raise KeyError(f"No row mirror registered for cache {cache_name!r}")
+
+
+async def refresh_user_rows(bot, user_id: int, cache_names: list[str] | None = None):
+    """
+    Re-reads one user's row of every user-keyed mirrored cache (or just
+    `cache_names`) in ONE round-trip: one scalar subquery per cache.
+    """
+    targets: list[RowMirror] = []
+    selects: list[str] = []
+    for table, entry in notify_tables.items():
+        if entry.key_column != "user_id":
+            continue
+        for mirror in entry.mirrors:
+            if cache_names is not None and mirror.cache_name not in cache_names:
+                continue
+            where = f" AND {mirror.where}" if mirror.where else ""
+            selects.append(
+                f"(SELECT to_jsonb(t) FROM {table} t "
+                f"WHERE t.user_id = $1{where} LIMIT 1) AS m{len(targets)}"
+            )
+            targets.append(mirror)
+    if not targets:
+        return
+
+    row = await bot.pg_pool.fetchrow(f"SELECT {', '.join(selects)}", user_id)
+    rows = []
+    for index, mirror in enumerate(targets):
+        data = row[f"m{index}"] if row else None
+        rows.append((mirror, json.loads(data) if isinstance(data, str) else data))
+    _swap_rows(user_id, rows)
+
+
+# 💠────────────────────────────────────────────
+#   Listener
+# ─────────────────────────────────────────────
+class CacheNotifyListener:
+    def __init__(self):
+        self.bot = None
+        self._conn: asyncpg.Connection | None = None
+        self._pending: dict[str, set] = {}
+        self._flush_task: asyncio.Task | None = None
+        self._watch_task: asyncio.Task | None = None
+        self.received = 0
+
+    def start(self, bot):
+        self.bot = bot
+        if self._watch_task and not self._watch_task.done():
+            return self._watch_task
+        self._watch_task = asyncio.create_task(self._watch())
+        return self._watch_task
+
+    async def stop(self):
+        for task in (self._watch_task, self._flush_task):
+            if task and not task.done():
+                task.cancel()
+        self._watch_task = self._flush_task = None
+        await self._close()
+
+    async def _close(self):
+        if self._conn and not self._conn.is_closed():
+            try:
+                await self._conn.close()
+            except Exception:
+                pass
+        self._conn = None
+
+    async def _connect(self, install: bool = False):
+        pool = self.bot.pg_pool
+        conn = await asyncpg.connect(dsn=pool.dsn, ssl=pool.ssl_context)
+        if install:
+            try:
+                await self._install_triggers(conn)
+            except Exception as e:
+                # 💠 Still listen: notifications may come from triggers installed elsewhere
+                pretty_log(
+                    "warn",
+                    f"Could not install cache notify triggers: {e}",
+                    label=NOTIFY_LABEL,
+                )
+        await conn.add_listener(NOTIFY_CHANNEL, self._on_notify)
+        self._conn = conn
+
+    @staticmethod
+    async def _run_ddl(conn: asyncpg.Connection, sql: str):
+        async with conn.transaction():
+            await conn.execute(f"SET LOCAL lock_timeout = '{DDL_LOCK_TIMEOUT}'")
+            await conn.execute(sql)
+
+    async def _install_triggers(self, conn: asyncpg.Connection):
+        """Creates the function and triggers that are missing or out of date."""
+        function_body = NOTIFY_FUNCTION_SQL.split("$$")[1]
+        current_body = await conn.fetchval(
+            "SELECT prosrc FROM pg_proc WHERE proname = 'minccino_cache_notify'"
+        )
+        if current_body != function_body:
+            await self._run_ddl(conn, NOTIFY_FUNCTION_SQL)
+
+        rows = await conn.fetch(
+            """
+            SELECT c.relname, pg_get_triggerdef(t.oid) AS definition
+            FROM pg_trigger t JOIN pg_class c ON c.oid = t.tgrelid
+            WHERE t.tgname = c.relname || $1 AND NOT t.tgisinternal
+            """,
+            TRIGGER_SUFFIX,
+        )
+        existing = {row["relname"]: row["definition"] for row in rows}
+        for table, entry in notify_tables.items():
+            definition = existing.get(table)
+            call = f"minccino_cache_notify('{entry.key_column}')"
+            if definition and call in definition:
+                continue
+            # 🔹 A stale trigger is replaced in place (PG 14+) rather than dropped
+            create = "CREATE OR REPLACE TRIGGER" if definition else "CREATE TRIGGER"
+            try:
+                await self._run_ddl(
+                    conn,
+                    f"""
+                    {create} {table}{TRIGGER_SUFFIX}
+                    AFTER INSERT OR UPDATE OR DELETE ON {table}
+                    FOR EACH ROW EXECUTE FUNCTION {call}
+                    """,
+                )
+            except asyncpg.exceptions.DuplicateObjectError:
+                pass  # 💠 another process created it first
+            except Exception as e:
+                pretty_log(
+                    "warn",
+                    f"Could not install cache notify trigger on {table}: {e}",
+                    label=NOTIFY_LABEL,
+                )
+
+    async def _watch(self):
+        """Keeps the LISTEN connection alive; resyncs everything after a reconnect."""
+        first = True
+        while True:
+            if self._conn is None or self._conn.is_closed():
+                try:
+                    await self._close()
+                    await self._connect(install=first)
+                    pretty_log(
+                        "info",
+                        f"Listening on '{NOTIFY_CHANNEL}' for {len(notify_tables)} tables",
+                        label=NOTIFY_LABEL,
+                    )
+                    if not first:
+                        await self._reload(set(notify_tables))
+                    first = False
+                except Exception as e:
+                    pretty_log(
+                        "error",
+                        f"LISTEN connection failed, retrying: {e}",
+                        label=NOTIFY_LABEL,
+                    )
+            await asyncio.sleep(RECONNECT_CHECK_SECONDS)
+
+    def _on_notify(self, connection, pid, channel, payload: str):
+        try:
+            data = json.loads(payload)
+        except ValueError:
+            return
+        table = data.get("table")
+        if table not in notify_tables:
+            return
+        self.received += 1
+        self._pending.setdefault(table, set()).add(data.get("key"))
+        if not self._flush_task or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self):
+        # 💠 Keys that arrive while a batch is applied are picked up by the next loop
+        while self._pending:
+            await asyncio.sleep(COALESCE_SECONDS)
+            pending, self._pending = self._pending, {}
+            await self._apply(pending)
+
+    async def _apply(self, pending: dict[str, set]):
+        reload_tables = set()
+        for table, keys in pending.items():
+            entry = notify_tables[table]
+            if not entry.mirrors or None in keys or len(keys) > MAX_ROW_REFRESHES:
+                reload_tables.add(table)
+                continue
+            for key in keys:
+                try:
+                    key = int(key) if key.lstrip("-").isdigit() else key
+                    await refresh_cached_row(self.bot, table, key)
+                except Exception as e:
+                    pretty_log(
+                        "warn",
+                        f"Row refresh {table}[{key}] failed, reloading table: {e}",
+                        label=NOTIFY_LABEL,
+                    )
+                    reload_tables.add(table)
+                    break
+        if reload_tables:
+            await self._reload(reload_tables)
+
+    async def _reload(self, tables: set[str]):
+        names = [name for table in tables for name in notify_tables[table].cache_names]
+        await load_registered_caches(self.bot, names=names, force=True)
+        pretty_log(
+            "info",
+            f"Reloaded {', '.join(names)} after changes to {', '.join(sorted(tables))}",
+            label=NOTIFY_LABEL,
+        )
+
+
+cache_notify_listener = CacheNotifyListener()
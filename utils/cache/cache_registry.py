@@ -0,0 +1,138 @@
+# 🟣────────────────────────────────────────────
+#         🗂️ Cache Registry 🗂️
+# ─────────────────────────────────────────────
+# Every in-memory cache registers its loader here with its own refresh
+# interval. Independent loaders run concurrently (bounded so the pg pool
+# stays usable for listeners), one failing loader does not stop the others,
+# and a periodic tick only reloads the caches whose interval has passed.
+#
+# Loaders swap their dict contents in one await-free step after the fetch,
+# so readers never see a half-cleared cache.
+import asyncio
+import time
+
+from utils.essentials.perf_stats import perf_timer
+from utils.loggers.pretty_logs import pretty_log
+
+CACHE_LABEL = "🥨 CENTRAL CACHE"
+MAX_CONCURRENT_LOADS = 4  # pg pool max_size is 10
+
+
+class RegisteredCache:
+    """
+    One cache loader and its refresh policy.
+
+    - refresh_every: seconds between reloads, None = load once at startup
+    - size: callable returning what the summary log shows (len, state, ...)
+    - cache / on_restore: the dict saved in the warm-start snapshot and a hook
+      that rebuilds derived indexes after it is restored (see cache_snapshot)
+    """
+
+    __slots__ = (
+        "name",
+        "loader",
+        "size",
+        "refresh_every",
+        "cache",
+        "on_restore",
+        "last_loaded",
+        "last_error",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        loader,
+        size=None,
+        refresh_every: float | None = 3600,
+        cache: dict | None = None,
+        on_restore=None,
+    ):
+        self.name = name
+        self.loader = loader
+        self.size = size
+        self.refresh_every = refresh_every
+        self.cache = cache
+        self.on_restore = on_restore
+        self.last_loaded: float | None = None
+        self.last_error: str | None = None
+
+    def is_source_of_truth(self) -> bool:
+        """Load-once caches hold unflushed in-memory state after their first load."""
+        return self.refresh_every is None and self.last_loaded is not None
+
+    def is_due(self, now: float) -> bool:
+        if self.last_loaded is None:
+            return True
+        if self.refresh_every is None:
+            return False
+        return now - self.last_loaded >= self.refresh_every
+
+
+cache_registry: dict[str, RegisteredCache] = {}
+
+
+def register_cache(
+    name: str,
+    loader,
+    size=None,
+    refresh_every: float | None = 3600,
+    cache: dict | None = None,
+    on_restore=None,
+):
+    """Registers (or replaces) a cache loader; loader(bot) is awaited on load."""
+    cache_registry[name] = RegisteredCache(
+        name, loader, size, refresh_every, cache, on_restore
+    )
+
+
+async def _load_one(bot, entry: RegisteredCache, semaphore: asyncio.Semaphore):
+    async with semaphore:
+        try:
+            async with perf_timer(CACHE_LABEL, entry.name):
+                await entry.loader(bot)
+            entry.last_loaded = time.time()
+            entry.last_error = None
+        except Exception as e:
+            entry.last_error = str(e)
+            pretty_log(
+                tag="error",
+                message=f"Error loading {entry.name} cache: {e}",
+                label=CACHE_LABEL,
+            )
+
+
+async def load_registered_caches(
+    bot, names: list[str] | None = None, force: bool = False
+):
+    """
+    Loads the given caches (default: all) concurrently.
+    Without force, only caches whose refresh interval has passed are loaded.
+    Even with force, a load-once cache (e.g. weekly goals) is never reloaded
+    over its in-memory state. Returns the names that were attempted.
+    """
+    now = time.time()
+    entries = [
+        entry
+        for name, entry in cache_registry.items()
+        if (names is None or name in names)
+        and not entry.is_source_of_truth()
+        and (force or entry.is_due(now))
+    ]
+    if not entries:
+        return []
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_LOADS)
+    await asyncio.gather(*(_load_one(bot, entry, semaphore) for entry in entries))
+    return [entry.name for entry in entries]
+
+
+def cache_summary() -> str:
+    """One line of '<name>: <size>' for every registered cache."""
+    parts = []
+    for entry in cache_registry.values():
+        if entry.last_error:
+            parts.append(f"{entry.name}: failed")
+        elif entry.size is not None:
+            parts.append(f"{entry.name}: {entry.size()}")
+    return ", ".join(parts)
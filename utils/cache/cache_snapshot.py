@@ -0,0 +1,116 @@
+# 🟣────────────────────────────────────────────
+#        💾 Warm-Start Cache Snapshot 💾
+# ─────────────────────────────────────────────
+# Registered caches that pass `cache=` to register_cache are periodically
+# pickled into one versioned file. On startup the snapshot is restored
+# before the gateway connects, so spawns that arrive while load_all_caches
+# is still running already see timers, ball recos and held item pings.
+# load_all_caches then reconciles every cache with the DB as usual.
+import asyncio
+import os
+import pickle
+import time
+
+from utils.cache.cache_registry import cache_registry
+from utils.loggers.pretty_logs import pretty_log
+
+SNAPSHOT_LABEL = "💾 CACHE SNAPSHOT"
+# Bump when the shape of any snapshotted cache entry changes
+SNAPSHOT_SCHEMA_VERSION = 1
+SNAPSHOT_PATH = os.getenv("CACHE_SNAPSHOT_PATH", ".cache_snapshot.pkl")
+SNAPSHOT_MAX_AGE_SECONDS = 24 * 3600
+
+
+def _write_snapshot(path: str, data: bytes):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)  # 💠 atomic: a crash never leaves a torn snapshot
+
+
+async def save_cache_snapshot(path: str = SNAPSHOT_PATH) -> int:
+    """Pickles every snapshotted cache; returns the snapshot size in bytes."""
+    caches = {
+        name: entry.cache
+        for name, entry in cache_registry.items()
+        if entry.cache is not None and entry.last_loaded is not None
+    }
+    if not caches:
+        return 0
+
+    # 🔹 Serialize on the loop (one consistent moment), write in a thread
+    data = pickle.dumps(
+        {
+            "version": SNAPSHOT_SCHEMA_VERSION,
+            "saved_at": time.time(),
+            "caches": caches,
+        },
+        protocol=pickle.HIGHEST_PROTOCOL,
+    )
+    try:
+        await asyncio.to_thread(_write_snapshot, path, data)
+    except OSError as e:
+        pretty_log("warn", f"Failed to save cache snapshot: {e}", label=SNAPSHOT_LABEL)
+        return 0
+    return len(data)
+
+
+def restore_cache_snapshot(
+    path: str = SNAPSHOT_PATH,
+    max_age_seconds: float | None = SNAPSHOT_MAX_AGE_SECONDS,
+) -> list[str]:
+    """
+    Fills registered caches from the snapshot, if it is current.
+    Returns the restored cache names. Never raises: a missing, stale or
+    unreadable snapshot just means a cold start.
+    max_age_seconds=None accepts any age (offline replay benchmarks).
+    """
+    try:
+        with open(path, "rb") as f:
+            snapshot = pickle.load(f)
+    except FileNotFoundError:
+        return []
+    except Exception as e:
+        pretty_log(
+            "warn", f"Ignoring unreadable cache snapshot: {e}", label=SNAPSHOT_LABEL
+        )
+        return []
+
+    if (
+        not isinstance(snapshot, dict)
+        or snapshot.get("version") != SNAPSHOT_SCHEMA_VERSION
+    ):
+        pretty_log(
+            "info",
+            "Ignoring cache snapshot from another schema version",
+            label=SNAPSHOT_LABEL,
+        )
+        return []
+    age = time.time() - snapshot.get("saved_at", 0)
+    if max_age_seconds is not None and age > max_age_seconds:
+        pretty_log(
+            "info",
+            f"Ignoring {age / 3600:.1f}h old cache snapshot",
+            label=SNAPSHOT_LABEL,
+        )
+        return []
+
+    restored = []
+    for name, saved in snapshot.get("caches", {}).items():
+        entry = cache_registry.get(name)
+        if entry is None or entry.cache is None or not isinstance(saved, dict):
+            continue
+        entry.cache.clear()
+        entry.cache.update(saved)
+        if entry.on_restore:
+            entry.on_restore()
+        restored.append(name)
+
+    pretty_log(
+        "info",
+        f"Restored {len(restored)} caches from a {age / 60:.0f} min old snapshot",
+        label=SNAPSHOT_LABEL,
+    )
+    return restored
@@ -1,8 +1,12 @@
 # 🟣────────────────────────────────────────────
 #       💜 Centralized Cache Loader 💜
-#       🎀 Calls all individual caches 🎀
+#       🎀 Registers all individual caches 🎀
 # ─────────────────────────────────────────────
-from utils.cache.ball_reco_cache import ball_reco_cache, load_ball_reco_cache
+from utils.cache.ball_reco_cache import (
+    ball_reco_cache,
+    ball_reco_row_to_entry,
+    load_ball_reco_cache,
+)
 from utils.cache.boosted_channels_cache import (
     boosted_channels_cache,
     load_boosted_channels_cache,
@@ -12,6 +16,14 @@ from utils.cache.cache_list import (
     timer_cache,
     webhook_url_cache,
 )
+from utils.cache.cache_notify import register_row_mirror, register_table_reload
+from utils.cache.cache_registry import (
+    CACHE_LABEL,
+    cache_summary,
+    load_registered_caches,
+    register_cache,
+)
+from utils.cache.cache_snapshot import save_cache_snapshot
 from utils.cache.daily_fa_ball_cache import (
     daily_faction_ball_cache,
     load_daily_faction_ball_cache,
@@ -20,7 +32,13 @@ from utils.cache.faction_ball_alert_cache import (
     faction_ball_alert_cache,
     load_faction_ball_alert_cache,
 )
-from utils.cache.fl_cache import feeling_lucky_cache, load_feeling_lucky_cache
+from utils.cache.fl_cache import (
+    feeling_lucky_cache,
+    feeling_lucky_row_to_entry,
+    load_feeling_lucky_cache,
+    on_feeling_lucky_row_change,
+    schedule_feeling_lucky_due_times,
+)
 from utils.cache.halloween_con_top_cache import (
     halloween_con_top_cache,
     load_halloween_con_top_cache,
@@ -29,7 +47,11 @@ from utils.cache.halloween_contest_cache import (
     halloween_contests_alert_cache,
     load_halloween_contest_alert_cache,
 )
-from utils.cache.held_item_cache import held_item_cache, load_held_item_cache
+from utils.cache.held_item_cache import (
+    held_item_cache,
+    held_item_row_to_entry,
+    load_held_item_cache,
+)
 from utils.cache.probation_members_cache import load_probation_members_cache
 from utils.cache.reminders_cache import *
 from utils.cache.res_fossil_cache import (
@@ -39,13 +61,23 @@ from utils.cache.res_fossil_cache import (
 from utils.cache.straymon_member_cache import (
     load_straymon_member_cache,
     straymon_member_cache,
+    straymon_member_name_index,
+)
+from utils.cache.timers_cache import (
+    load_timer_cache,
+    on_timer_row_change,
+    rebuild_timer_indexes,
+    timer_row_to_entry,
 )
-from utils.cache.timers_cache import load_timer_cache
 from utils.cache.user_captcha_alert_cache import (
     load_user_captcha_alert_cache,
     user_captcha_alert_cache,
 )
-from utils.cache.water_state_cache import fetch_latest_water_state, get_water_state
+from utils.cache.water_state_cache import (
+    fetch_latest_water_state,
+    get_water_state,
+    waterstate_cache,
+)
 from utils.cache.wb_battle_alert_cache import (
     load_wb_battle_alert_cache,
     wb_battle_alert_cache,
@@ -57,108 +89,253 @@ from utils.cache.weekly_goal_tracker_cache import (
 )
 from utils.loggers.pretty_logs import pretty_log
 
+HOUR = 3600
+# Caches whose only writer is this bot are kept current by their upsert/remove
+# helpers; the periodic reload is just a drift safety net.
+WRITE_THROUGH_REFRESH = 6 * HOUR
+
 
 # 🐾────────────────────────────────────────────
-#     💜 Load Everything in One Go
+#     💜 Cache Registrations
 # 🐾────────────────────────────────────────────
-async def load_all_caches(bot):
-    """
-    Centralized function to load all caches.
-    Calls each cache loader in order and logs once at the end.
-    """
-    try:
-        # ⌚ Load Timer cache
-        await load_timer_cache(bot)
-
-        # 🐥 Straymon Members cache
-        await load_straymon_member_cache(bot)
-
-        # 💠 Weekly Goal Tracker cache
-        if not weekly_goal_cache:
-            await load_weekly_goal_cache(bot)
-
-        # 🍄 Held Item Users Ping cache
-        await load_held_item_cache(bot)
-
-        # 🍚 Ball Recommendation cache
-        await load_ball_reco_cache(bot)
-
-        # ⚾ User Reminders cache
-        await load_user_reminders_cache(bot)
-
-        # 💒 Boosted Channels cache
-        await load_boosted_channels_cache(bot)
-
-        # 🌊 Fetch latest waterstate
-        await fetch_latest_water_state(bot)
-
-        # 🍀 Feeling Lucky Cooldowns
-        await load_feeling_lucky_cache(bot)
-
-        # 🛡️ User Captcha Alert
-        await load_user_captcha_alert_cache(bot)
+# ⌚ Timer cache
+register_cache(
+    "Timers",
+    load_timer_cache,
+    lambda: len(timer_cache),
+    WRITE_THROUGH_REFRESH,
+    cache=timer_cache,
+    on_restore=rebuild_timer_indexes,
+)
+# 🐥 Straymon Members cache
+register_cache(
+    "Straymon Members",
+    load_straymon_member_cache,
+    lambda: len(straymon_member_cache),
+    HOUR,
+    cache=straymon_member_cache,
+    on_restore=lambda: straymon_member_name_index.rebuild(straymon_member_cache),
+)
+# 💠 Weekly Goal Tracker cache: the cache is the source of truth between flushes,
+# so it is always loaded from the DB and never restored from a snapshot
+register_cache(
+    "Weekly Goal Trackers",
+    load_weekly_goal_cache,
+    lambda: len(weekly_goal_cache),
+    refresh_every=None,
+)
+# 🍄 Held Item Users Ping cache
+register_cache(
+    "Held Items",
+    load_held_item_cache,
+    lambda: len(held_item_cache),
+    WRITE_THROUGH_REFRESH,
+    cache=held_item_cache,
+)
+# 🍚 Ball Recommendation cache
+register_cache(
+    "Ball Recon",
+    load_ball_reco_cache,
+    lambda: len(ball_reco_cache),
+    WRITE_THROUGH_REFRESH,
+    cache=ball_reco_cache,
+)
+# ⚾ User Reminders cache
+register_cache(
+    "Reminders",
+    load_user_reminders_cache,
+    lambda: len(user_reminders_cache),
+    WRITE_THROUGH_REFRESH,
+    cache=user_reminders_cache,
+)
+# 💒 Boosted Channels cache
+register_cache(
+    "Boosted Channels",
+    load_boosted_channels_cache,
+    lambda: len(boosted_channels_cache),
+    WRITE_THROUGH_REFRESH,
+    cache=boosted_channels_cache,
+)
+# 🌊 Latest waterstate (kept live by the fishing listener)
+register_cache(
+    "Waterstate",
+    fetch_latest_water_state,
+    get_water_state,
+    HOUR,
+    cache=waterstate_cache,
+)
+# 🍀 Feeling Lucky Cooldowns
+register_cache(
+    "Feeling Lucky Cooldowns",
+    load_feeling_lucky_cache,
+    lambda: len(feeling_lucky_cache),
+    WRITE_THROUGH_REFRESH,
+    cache=feeling_lucky_cache,
+    on_restore=schedule_feeling_lucky_due_times,
+)
+# 🛡️ User Captcha Alert
+register_cache(
+    "Captcha Alerts",
+    load_user_captcha_alert_cache,
+    lambda: len(user_captcha_alert_cache),
+    WRITE_THROUGH_REFRESH,
+    cache=user_captcha_alert_cache,
+)
+# 🦴 Research Fossils Alert
+register_cache(
+    "Res Fossils Alerts",
+    load_res_fossils_alert_cache,
+    lambda: len(res_fossils_alert_cache),
+    WRITE_THROUGH_REFRESH,
+    cache=res_fossils_alert_cache,
+)
+# ⚔️ World Boss Battle Alert
+register_cache(
+    "World Boss Battle Alerts",
+    load_wb_battle_alert_cache,
+    lambda: len(wb_battle_alert_cache),
+    WRITE_THROUGH_REFRESH,
+    cache=wb_battle_alert_cache,
+)
+# 🎯 Daily Faction Ball Alert
+register_cache(
+    "Daily Faction Balls",
+    load_daily_faction_ball_cache,
+    lambda: len(daily_faction_ball_cache),
+    HOUR,
+    cache=daily_faction_ball_cache,
+)
+# 🎯 Faction Ball Alert
+register_cache(
+    "Faction Ball Alerts",
+    load_faction_ball_alert_cache,
+    lambda: len(faction_ball_alert_cache),
+    WRITE_THROUGH_REFRESH,
+    cache=faction_ball_alert_cache,
+)
+# 🕒 Probation Members Cache
+register_cache(
+    "Probation Members",
+    load_probation_members_cache,
+    lambda: len(probation_members_cache),
+    HOUR,
+    cache=probation_members_cache,
+)
+# 🌐 Webhook URL Cache
+register_cache(
+    "Webhook URLs",
+    load_webhook_url_cache,
+    lambda: len(webhook_url_cache),
+    WRITE_THROUGH_REFRESH,
+    cache=webhook_url_cache,
+)
+# 🎃 Halloween Contest Alert Cache
+# register_cache(
+#     "Halloween Contest Alerts",
+#     load_halloween_contest_alert_cache,
+#     lambda: len(halloween_contests_alert_cache),
+# )
+# 🎃 Halloween Con Top Cache Disabled for now
+# register_cache("Halloween Con Top", load_halloween_con_top_cache)
 
-        # 🦴 Research Fossils Alert
-        await load_res_fossils_alert_cache(bot)
 
-        # ⚔️ World Boss Battle Alert
-        try:
-            await load_wb_battle_alert_cache(bot)
-        except Exception as e:
-            pretty_log(
-                tag="error",
-                message=f"Error loading World Boss Battle Alert Cache: {e}",
-                label="🥨 CENTRAL CACHE",
-            )
+# 🐾────────────────────────────────────────────
+#     📣 Cross-process sync (LISTEN/NOTIFY)
+# 🐾────────────────────────────────────────────
+def _alert_row_to_entry(row: dict) -> dict:
+    return {"user_name": row.get("user_name"), "notify": row.get("notify")}
 
-        # 🎯 Daily Faction Ball Alert
-        await load_daily_faction_ball_cache(bot)
 
-        # 🎯 Faction Ball Alert
-        await load_faction_ball_alert_cache(bot)
+# 🔹 Row mirrors: a changed row is re-read into its cache on its own
+register_row_mirror(
+    "timers", "Timers", timer_cache, timer_row_to_entry, after=on_timer_row_change
+)
+register_row_mirror(
+    "user_item_pings", "Held Items", held_item_cache, held_item_row_to_entry
+)
+register_row_mirror(
+    "user_ball_recommendations", "Ball Recon", ball_reco_cache, ball_reco_row_to_entry
+)
+register_row_mirror(
+    "user_pokemeow_reminders",
+    "Reminders",
+    user_reminders_cache,
+    reminders_row_to_entry,
+)
+register_row_mirror(
+    "feeling_lucky_cd",
+    "Feeling Lucky Cooldowns",
+    feeling_lucky_cache,
+    feeling_lucky_row_to_entry,
+    after=on_feeling_lucky_row_change,
+)
+for _cache_name, _cache, _alert_type in (
+    ("Captcha Alerts", user_captcha_alert_cache, "captcha"),
+    ("Faction Ball Alerts", faction_ball_alert_cache, "faction_ball"),
+    ("Res Fossils Alerts", res_fossils_alert_cache, "res_fossils"),
+    ("World Boss Battle Alerts", wb_battle_alert_cache, "wb_battle"),
+):
+    register_row_mirror(
+        "user_alerts",
+        _cache_name,
+        _cache,
+        _alert_row_to_entry,
+        where=f"alert_type = '{_alert_type}'",
+    )
 
-        # 🕒 Probation Members Cache
-        await load_probation_members_cache(bot)
+# 🔹 Table reloads: caches with derived indexes or non user-keyed rows
+register_table_reload("straymons_members", "Straymon Members")
+register_table_reload("probation_members", "Probation Members")
+register_table_reload("boosted_channels", "Boosted Channels", key_column="channel_id")
+register_table_reload("webhook_url", "Webhook URLs", key_column="channel_id")
 
-        # 🌐 Webhook URL Cache
-        await load_webhook_url_cache(bot)
-        
-        # 🎃 Halloween Contest Alert Cache
-        # await load_halloween_contest_alert_cache(bot)
 
-        # 🎃 Halloween Con Top Cache Disabled for now
-        # await load_halloween_con_top_cache(bot)
+# 🐾────────────────────────────────────────────
+#     💜 Load Everything in One Go
+# 🐾────────────────────────────────────────────
+async def load_all_caches(bot):
+    """
+    Startup load: runs every registered cache loader concurrently
+    (reconciling anything restored from the snapshot) and logs once at the end.
+    """
+    try:
+        await load_registered_caches(bot, force=True)
+        await save_cache_snapshot()
 
         # 🎀 Unified single-line log with all caches
         pretty_log(
             tag="",
-            message=(
-                f"All caches refreshed and loaded "
-                f"Straymon Members: {len(straymon_member_cache)},"
-                f"(Waterstate: {get_water_state()}, Timers: {len(timer_cache)}, "
-                f"Weekly Goal Trackers: {len(weekly_goal_cache)}, "
-                f"Held Items: {len(held_item_cache)}, Ball Recon: {len(ball_reco_cache)}, "
-                f"Reminders: {len(user_reminders_cache)}, "
-                f"Boosted Channels: {len(boosted_channels_cache)}, "
-                f"Daily Faction Balls: {len(daily_faction_ball_cache)},"
-                f"Feeling Lucky Cooldowns: {len(feeling_lucky_cache)},"
-                f"Captcha Alerts: {len(user_captcha_alert_cache)},"
-                f"Faction Ball Alerts: {len(faction_ball_alert_cache)},"
-                f"World Boss Battle Alerts: {len(wb_battle_alert_cache)},"
-                f"Res Fossils Alerts: {len(res_fossils_alert_cache)})"
-                f"Probation Members: {len(probation_members_cache)},"
-                f"Webhook URLs: {len(webhook_url_cache)}"
-                # f"Halloween Contest Alerts: {len(halloween_contests_alert_cache)},"
-                # f"Halloween Con Fourth Place Score: {halloween_con_top_cache.get('fourth_place', {}).get('score', 0)}"
-            ),
-            label="🥨 CENTRAL CACHE",
+            message=f"All caches loaded ({cache_summary()})",
+            label=CACHE_LABEL,
             bot=bot,
         )
     except Exception as e:
         pretty_log(
             tag="",
             message=f"Error loading caches: {e}",
-            label="🥨 CENTRAL CACHE",
+            label=CACHE_LABEL,
             level="error",
             bot=bot,
         )
+
+
+async def refresh_due_caches(bot):
+    """
+    Periodic tick: reloads only the caches whose refresh interval has passed,
+    then saves the warm-start snapshot (caches change between reloads too).
+    """
+    try:
+        refreshed = await load_registered_caches(bot)
+        await save_cache_snapshot()
+        if refreshed:
+            pretty_log(
+                tag="",
+                message=f"Refreshed caches: {', '.join(refreshed)}",
+                label=CACHE_LABEL,
+            )
+    except Exception as e:
+        pretty_log(
+            tag="error",
+            message=f"Error refreshing caches: {e}",
+            label=CACHE_LABEL,
+        )
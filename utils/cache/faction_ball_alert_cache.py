@@ -21,8 +21,9 @@ async def load_faction_ball_alert_cache(bot):
     """
     from utils.database.faction_ball_alert_db_func import fetch_all_faction_ball_alerts
 
-    faction_ball_alert_cache.clear()
     rows = await fetch_all_faction_ball_alerts(bot)
+    # 🔹 Clear only after the fetch, so readers never see an empty cache
+    faction_ball_alert_cache.clear()
     for row in rows:
         faction_ball_alert_cache[row["user_id"]] = {
             "user_name": row.get("user_name"),
@@ -3,6 +3,7 @@
 # ─────────────────────────────────────────────
 
 import time
+from utils.background_task.due_scheduler import FEELING_LUCKY, schedule_due
 from utils.loggers.pretty_logs import pretty_log
 
 
@@ -18,20 +19,43 @@ feeling_lucky_cache: dict[int, dict] = {}
 # }
 
 
+def feeling_lucky_row_to_entry(row: dict) -> dict:
+    return {
+        "user_name": row.get("user_name"),
+        "cooldown_until": row.get("cooldown_until"),
+    }
+
+
+def on_feeling_lucky_row_change(user_id: int, entry: dict | None):
+    """A cooldown written by another process still needs its due time queued."""
+    if entry:
+        schedule_due(FEELING_LUCKY, entry.get("cooldown_until"))
+
+
+def schedule_feeling_lucky_due_times():
+    """Queues every cached cooldown with the due scheduler (e.g. after a restore)."""
+    for entry in feeling_lucky_cache.values():
+        schedule_due(FEELING_LUCKY, entry.get("cooldown_until"))
+
+
+async def fetch_pending_feeling_lucky_cooldowns(bot) -> list[int]:
+    """Cached cooldown ends; the cache is the due scheduler's pending view."""
+    return [entry.get("cooldown_until") for entry in feeling_lucky_cache.values()]
+
+
 async def load_feeling_lucky_cache(bot):
     """
     Load all feeling lucky cooldowns into memory cache.
     Uses the fetch_all_feeling_lucky DB function.
     """
-    feeling_lucky_cache.clear()
     from utils.database.fl_cd_db_func import fetch_all_feeling_lucky_cd
 
     rows = await fetch_all_feeling_lucky_cd(bot)
+    # 🔹 Clear only after the fetch, so readers never see an empty cache
+    feeling_lucky_cache.clear()
     for row in rows:
-        feeling_lucky_cache[row["user_id"]] = {
-            "user_name": row.get("user_name"),
-            "cooldown_until": row.get("cooldown_until"),
-        }
+        feeling_lucky_cache[row["user_id"]] = feeling_lucky_row_to_entry(row)
+        schedule_due(FEELING_LUCKY, row.get("cooldown_until"))
 
     pretty_log(
         message=f"Loaded {len(feeling_lucky_cache)} users' feeling lucky cooldowns into cache",
@@ -55,6 +79,7 @@ def upsert_feeling_lucky_cache(user_id: int, user_name: str, cooldown_until: int
         "user_name": user_name,
         "cooldown_until": cooldown_until,
     }
+    schedule_due(FEELING_LUCKY, cooldown_until)
     pretty_log(
         "info",
         f"Upserted cooldown for {user_name} ({user_id}) until {cooldown_until}",
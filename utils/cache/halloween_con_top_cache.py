@@ -15,8 +15,9 @@ async def load_halloween_con_top_cache(bot):
     """
     Load halloween top fourth place into cache
     """
-    halloween_con_top_cache.clear()
     row = await get_halloween_con_top(bot, "fourth_place")
+    # 🔹 Clear only after the fetch, so readers never see an empty cache
+    halloween_con_top_cache.clear()
     if row:
         halloween_con_top_cache["fourth_place"] = row
 
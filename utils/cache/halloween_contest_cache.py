@@ -21,8 +21,9 @@ async def load_halloween_contest_alert_cache(bot):
     """
     from utils.database.halloween_contest_alert import fetch_all_halloween_contest_alerts
 
-    halloween_contests_alert_cache.clear()
     rows = await fetch_all_halloween_contest_alerts(bot)
+    # 🔹 Clear only after the fetch, so readers never see an empty cache
+    halloween_contests_alert_cache.clear()
     for row in rows:
         halloween_contests_alert_cache[row["user_id"]] = {
             "user_name": row.get("user_name"),
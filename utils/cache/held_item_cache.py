@@ -33,40 +33,44 @@ held_item_cache: dict[int, dict] = {}
 # }
 
 
+def held_item_row_to_entry(row: dict) -> dict:
+    held_item_pings = row.get("held_item_pings") or {}
+
+    # If it's a string from DB, parse JSON
+    if isinstance(held_item_pings, str):
+        held_item_pings = json.loads(held_item_pings)
+
+    # Extract "all_held_items" separately from JSON or DB column
+    all_flag = (
+        held_item_pings.get("all_held_items", False)
+        if isinstance(held_item_pings, dict)
+        else bool(row.get("all_held_items", False))
+    )
+
+    # Build a set of subscribed items, excluding the all_held_items key
+    subscribed_items = {
+        item
+        for item, sub in held_item_pings.items()
+        if sub and item != "all_held_items"
+    }
+
+    return {
+        "user_name": row.get("user_name"),
+        "subscribed_items": subscribed_items,
+        "all_held_items": all_flag,
+    }
+
+
 async def load_held_item_cache(bot):
     """
     Load all user held item subscriptions into memory cache.
     Uses the fetch_all_user_item_pings DB function.
     """
-    held_item_cache.clear()
-
     rows = await fetch_all_user_item_pings(bot)
+    # 🔹 Clear only after the fetch, so readers never see an empty cache
+    held_item_cache.clear()
     for row in rows:
-        held_item_pings = row.get("held_item_pings") or {}
-
-        # If it's a string from DB, parse JSON
-        if isinstance(held_item_pings, str):
-            held_item_pings = json.loads(held_item_pings)
-
-        # Extract "all_held_items" separately from JSON or DB column
-        all_flag = (
-            held_item_pings.get("all_held_items", False)
-            if isinstance(held_item_pings, dict)
-            else bool(row.get("all_held_items", False))
-        )
-
-        # Build a set of subscribed items, excluding the all_held_items key
-        subscribed_items = {
-            item
-            for item, sub in held_item_pings.items()
-            if sub and item != "all_held_items"
-        }
-
-        held_item_cache[row["user_id"]] = {
-            "user_name": row.get("user_name"),
-            "subscribed_items": subscribed_items,
-            "all_held_items": all_flag,
-        }
+        held_item_cache[row["user_id"]] = held_item_row_to_entry(row)
 
     pretty_log(
         message=f"Loaded {len(held_item_cache)} users' held item subscriptions into cache",
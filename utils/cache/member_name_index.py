@@ -0,0 +1,138 @@
+import discord
+
+from utils.loggers.debug_log import debug_log
+from utils.loggers.pretty_logs import pretty_log
+
+# 🌸_________________________________________________________
+# 🔎 Member Name Index (per guild)
+# _________________________________________________________
+member_name_index: dict[int, dict[str, dict[str, set[int]]]] = {}
+# Structure:
+# member_name_index = {
+#     guild_id: {
+#         "name": {"lowered username": {member_id, ...}},
+#         "display": {"lowered display name": {member_id, ...}},
+#     },
+# }
+
+# (guild_id, member_id) → (lowered username, lowered display name) as indexed,
+# so an update can remove the old keys without scanning the guild
+_indexed_keys: dict[tuple[int, int], tuple[str, str]] = {}
+
+# Guilds indexed before member chunking finished; rebuilt once by the first
+# lookup after guild.chunked turns true (or by on_guild_available). Until
+# then lookups use the partial index, which member events keep current.
+_partial_guilds: set[int] = set()
+
+
+# 🤍💫────────────────────────────────────────────💫🤍
+#        🔎 Member Name Index Functions
+# 🤍💫────────────────────────────────────────────💫🤍
+def _add_key(bucket: dict[str, set[int]], key: str, member_id: int):
+    bucket.setdefault(key, set()).add(member_id)
+
+
+def _remove_key(bucket: dict[str, set[int]], key: str, member_id: int):
+    ids = bucket.get(key)
+    if not ids:
+        return
+    ids.discard(member_id)
+    if not ids:
+        del bucket[key]
+
+
+def build_guild_member_index(guild: discord.Guild):
+    """(Re)builds the name index of one guild from guild.members."""
+    for key in [key for key in _indexed_keys if key[0] == guild.id]:
+        del _indexed_keys[key]
+
+    member_name_index[guild.id] = {"name": {}, "display": {}}
+    for member in guild.members:
+        index_member(member)
+
+    if guild.chunked:
+        _partial_guilds.discard(guild.id)
+    else:
+        _partial_guilds.add(guild.id)
+
+    pretty_log(
+        "cache",
+        f"Indexed {len(guild.members)} member names for guild {guild.name}",
+    )
+
+
+def index_member(member: discord.Member):
+    """Adds or refreshes one member; no-op if the names did not change."""
+    guild_index = member_name_index.setdefault(
+        member.guild.id, {"name": {}, "display": {}}
+    )
+    keys = (member.name.lower(), member.display_name.lower())
+    old_keys = _indexed_keys.get((member.guild.id, member.id))
+    if old_keys == keys:
+        return
+    if old_keys:
+        _remove_key(guild_index["name"], old_keys[0], member.id)
+        _remove_key(guild_index["display"], old_keys[1], member.id)
+
+    _add_key(guild_index["name"], keys[0], member.id)
+    _add_key(guild_index["display"], keys[1], member.id)
+    _indexed_keys[(member.guild.id, member.id)] = keys
+
+
+def unindex_member(member: discord.Member):
+    old_keys = _indexed_keys.pop((member.guild.id, member.id), None)
+    guild_index = member_name_index.get(member.guild.id)
+    if not old_keys or not guild_index:
+        return
+    _remove_key(guild_index["name"], old_keys[0], member.id)
+    _remove_key(guild_index["display"], old_keys[1], member.id)
+
+
+def drop_guild_member_index(guild_id: int):
+    member_name_index.pop(guild_id, None)
+    _partial_guilds.discard(guild_id)
+    for key in [key for key in _indexed_keys if key[0] == guild_id]:
+        del _indexed_keys[key]
+
+
+def find_member_by_name(
+    guild: discord.Guild | None, member_name: str | None
+) -> discord.Member | None:
+    """
+    Case-insensitive lookup of a guild member by username or display name.
+
+    A username match wins over a display name match, because usernames are
+    unique. When several members share the same display name, the one whose
+    display name matches exactly (including case) is returned; if that is
+    still not unique the name is ambiguous and None is returned.
+    """
+    if not guild or not member_name:
+        return None
+    if guild.id not in member_name_index or (
+        guild.id in _partial_guilds and guild.chunked
+    ):
+        build_guild_member_index(guild)
+
+    guild_index = member_name_index[guild.id]
+    target = member_name.strip().lower()
+
+    for bucket, attr in (("name", "name"), ("display", "display_name")):
+        ids = guild_index[bucket].get(target)
+        if not ids:
+            continue
+        if len(ids) == 1:
+            return guild.get_member(next(iter(ids)))
+
+        members = [m for m in map(guild.get_member, ids) if m]
+        exact = [m for m in members if getattr(m, attr) == member_name.strip()]
+        if len(exact) == 1:
+            return exact[0]
+        debug_log(
+            "Ambiguous %s '%s' in %s: %s members",
+            bucket,
+            member_name,
+            guild.name,
+            len(members),
+        )
+        return None
+    return None
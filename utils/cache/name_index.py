@@ -0,0 +1,67 @@
+# 🌸_________________________________________________________
+# 🔎 Normalized Name → User ID Secondary Index
+# _________________________________________________________
+# Kept next to a user_id-keyed cache and updated in the same (await-free)
+# step as the primary dict, so name lookups are O(1) instead of a scan over
+# every cached user.
+
+
+def normalize_name(name) -> str:
+    """Strips whitespace and lowercases; the key used by every name index."""
+    return str(name).strip().lower() if name else ""
+
+
+class NameIndex:
+    """
+    normalized user_name → user_id, mirroring one cache dict.
+
+    If two users share a normalized name, lookups return the one indexed
+    first, matching the order a scan over the cache dict would return.
+    """
+
+    __slots__ = ("_ids_by_name", "_name_by_id")
+
+    def __init__(self):
+        self._ids_by_name: dict[str, dict[int, None]] = {}  # ordered id set
+        self._name_by_id: dict[int, str] = {}
+
+    def __len__(self):
+        return len(self._name_by_id)
+
+    def set(self, user_id: int, user_name):
+        """Indexes (or re-indexes) a user under their current name."""
+        key = normalize_name(user_name)
+        old_key = self._name_by_id.get(user_id)
+        if old_key == key:
+            return
+        if old_key is not None:
+            self.remove(user_id)
+        if not key:
+            return
+        self._ids_by_name.setdefault(key, {})[user_id] = None
+        self._name_by_id[user_id] = key
+
+    def remove(self, user_id: int):
+        key = self._name_by_id.pop(user_id, None)
+        if key is None:
+            return
+        ids = self._ids_by_name.get(key)
+        if ids is not None:
+            ids.pop(user_id, None)
+            if not ids:
+                del self._ids_by_name[key]
+
+    def clear(self):
+        self._ids_by_name.clear()
+        self._name_by_id.clear()
+
+    def rebuild(self, cache: dict[int, dict]):
+        """Re-indexes every entry of a user_id → {"user_name": ...} cache."""
+        self.clear()
+        for user_id, data in cache.items():
+            if isinstance(data, dict):
+                self.set(user_id, data.get("user_name"))
+
+    def get(self, user_name) -> int | None:
+        ids = self._ids_by_name.get(normalize_name(user_name))
+        return next(iter(ids)) if ids else None
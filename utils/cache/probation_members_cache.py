@@ -12,8 +12,9 @@ async def load_probation_members_cache(bot: discord.Client):
     """
     Loads all probation members from the database into the in-memory cache.
     """
-    probation_members_cache.clear()
     members = await fetch_all_probation_members(bot)
+    # 🔹 Clear only after the fetch, so readers never see an empty cache
+    probation_members_cache.clear()
 
     for member in members:
         probation_members_cache[member["user_id"]] = {
@@ -41,31 +41,35 @@ import json
 import json
 
 
+def reminders_row_to_entry(row: dict) -> dict:
+    reminders = row.get("reminders") or {}
+    if isinstance(reminders, str):
+        reminders = json.loads(reminders)
+
+    # Ensure the structure is consistent
+    relics = reminders.get("relics", {})
+    relics.setdefault("has_exchanged", False)
+    relics.setdefault("enabled", True)
+    relics.setdefault("mode", "off")
+
+    catchbot = reminders.get("catchbot", {})
+    catchbot.setdefault("enabled", True)
+    catchbot.setdefault("mode", "off")
+    catchbot.setdefault("repeating", None)
+
+    return {"relics": relics, "catchbot": catchbot}
+
+
 async def load_user_reminders_cache(bot):
     """
     Load all user reminders into memory.
     """
-    user_reminders_cache.clear()
     try:
         rows = await fetch_all_rows(bot)
-
-        for row in rows:
-            reminders = row.get("reminders", {})
-            # Ensure the structure is consistent
-            relics = reminders.get("relics", {})
-            relics.setdefault("has_exchanged", False)
-            relics.setdefault("enabled", True)
-            relics.setdefault("mode", "off")
-
-            catchbot = reminders.get("catchbot", {})
-            catchbot.setdefault("enabled", True)
-            catchbot.setdefault("mode", "off")
-            catchbot.setdefault("repeating", None)
-
-            user_reminders_cache[row["user_id"]] = {
-                "relics": relics,
-                "catchbot": catchbot,
-            }
+        loaded = {row["user_id"]: reminders_row_to_entry(row) for row in rows}
+        # 🔹 Swap only after the fetch, so readers never see an empty cache
+        user_reminders_cache.clear()
+        user_reminders_cache.update(loaded)
 
         pretty_log(
             tag="",
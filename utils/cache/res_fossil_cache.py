@@ -21,8 +21,9 @@ async def load_res_fossils_alert_cache(bot):
     """
     from utils.database.res_fossil_alert_db_func import fetch_all_res_fossils_alerts
 
-    res_fossils_alert_cache.clear()
     rows = await fetch_all_res_fossils_alerts(bot)
+    # 🔹 Clear only after the fetch, so readers never see an empty cache
+    res_fossils_alert_cache.clear()
     for row in rows:
         res_fossils_alert_cache[row["user_id"]] = {
             "user_name": row.get("user_name"),
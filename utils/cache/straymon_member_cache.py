@@ -2,6 +2,7 @@ import time
 
 import discord
 
+from utils.cache.name_index import NameIndex
 from utils.loggers.pretty_logs import pretty_log
 
 straymon_member_cache: dict[int, dict] = {}
@@ -12,6 +13,9 @@ straymon_member_cache: dict[int, dict] = {}
 #   "faction": str
 # }
 
+# normalized user_name -> user_id, kept in step with straymon_member_cache
+straymon_member_name_index = NameIndex()
+
 
 async def load_straymon_member_cache(bot):
     """
@@ -20,14 +24,20 @@ async def load_straymon_member_cache(bot):
     """
     from utils.database.straymon_info_db_func import fetch_all_straymon_members
 
-    straymon_member_cache.clear()
     rows = await fetch_all_straymon_members(bot)
-    for row in rows:
-        straymon_member_cache[row["user_id"]] = {
+    loaded = {
+        row["user_id"]: {
             "user_name": row.get("user_name"),
             "channel_id": row.get("channel_id"),
             "faction": row.get("faction"),
         }
+        for row in rows
+    }
+
+    # 🔹 Swap cache and name index together, with no await in between
+    straymon_member_cache.clear()
+    straymon_member_cache.update(loaded)
+    straymon_member_name_index.rebuild(straymon_member_cache)
 
     try:
         pretty_log(
@@ -58,20 +68,8 @@ def fetch_straymon_member_cache_by_name(user_name: str) -> dict | None:
     Fetch a member's info from the Straymon cache by their user_name.
     Strips whitespace and compares case-insensitively.
     """
-    if not user_name:
-        return None
-
-    lowered_name = user_name.strip().lower()
-
-    for user_id, data in straymon_member_cache.items():
-        if not data or not isinstance(data, dict):
-            continue
-
-        cached_user_name = data.get("user_name")
-        if cached_user_name and str(cached_user_name).strip().lower() == lowered_name:
-            return data
-
-    return None
+    user_id = straymon_member_name_index.get(user_name)
+    return straymon_member_cache.get(user_id) if user_id is not None else None
 
 
 def fetch_straymon_member_cache_by_username(user_name: str) -> tuple[int, dict] | None:
@@ -79,20 +77,10 @@ def fetch_straymon_member_cache_by_username(user_name: str) -> tuple[int, dict]
     Fetch a member's info and user_id from the Straymon cache by their user_name.
     Strips whitespace and compares case-insensitively.
     """
-    if not user_name:
+    user_id = straymon_member_name_index.get(user_name)
+    if user_id is None or user_id not in straymon_member_cache:
         return None
-
-    lowered_name = user_name.strip().lower()
-
-    for user_id, data in straymon_member_cache.items():
-        if not data or not isinstance(data, dict):
-            continue
-
-        cached_user_name = data.get("user_name")
-        if cached_user_name and str(cached_user_name).strip().lower() == lowered_name:
-            return user_id, data
-
-    return None
+    return user_id, straymon_member_cache[user_id]
 
 
 def fetch_straymon_user_id_by_username(user_name: str) -> int | None:
@@ -100,20 +88,7 @@ def fetch_straymon_user_id_by_username(user_name: str) -> int | None:
     Fetch a member's user_id from the Straymon cache by their user_name.
     Strips whitespace and compares case-insensitively.
     """
-    if not user_name:
-        return None
-
-    lowered_name = user_name.strip().lower()
-
-    for user_id, data in straymon_member_cache.items():
-        if not data or not isinstance(data, dict):
-            continue
-
-        cached_user_name = data.get("user_name")
-        if cached_user_name and str(cached_user_name).strip().lower() == lowered_name:
-            return user_id
-
-    return None
+    return straymon_member_name_index.get(user_name)
 
 
 def get_user_id_by_name(user_name: str) -> int | None:
@@ -1,7 +1,11 @@
 from group_func.toggle.timer.timer_db_func import fetch_all_timers
 from utils.cache.cache_list import timer_cache
+from utils.cache.name_index import NameIndex
 from utils.loggers.pretty_logs import pretty_log
 
+# normalized user_name -> user_id, kept in step with timer_cache
+timer_name_index = NameIndex()
+
 
 # 🟣────────────────────────────────────────────
 #       🐭 Timer Cache Loader 🐭
@@ -11,16 +15,13 @@ async def load_timer_cache(bot):
     Load all user timer settings into memory cache.
     Uses the fetch_all_timers DB function.
     """
-    timer_cache.clear()
-
     rows = await fetch_all_timers(bot)
-    for row in rows:
-        timer_cache[row["user_id"]] = {
-            "user_name": row.get("user_name"),
-            "pokemon_setting": row.get("pokemon_setting"),
-            "fish_setting": row.get("fish_setting"),
-            "battle_setting": row.get("battle_setting"),
-        }
+    loaded = {row["user_id"]: timer_row_to_entry(row) for row in rows}
+
+    # 🔹 Swap cache and name index together, with no await in between
+    timer_cache.clear()
+    timer_cache.update(loaded)
+    timer_name_index.rebuild(timer_cache)
 
     # 🐭 Debug log
     pretty_log(
@@ -32,6 +33,30 @@ async def load_timer_cache(bot):
     return timer_cache
 
 
+def timer_row_to_entry(row: dict) -> dict:
+    return {
+        "user_name": row.get("user_name"),
+        "pokemon_setting": row.get("pokemon_setting"),
+        "fish_setting": row.get("fish_setting"),
+        "battle_setting": row.get("battle_setting"),
+    }
+
+
+def rebuild_timer_indexes():
+    """Rebuilds the name index and battle timer users from timer_cache."""
+    timer_name_index.rebuild(timer_cache)
+    load_battle_timer_users_cache()
+
+
+def on_timer_row_change(user_id: int, entry: dict | None):
+    """Keeps the name index and battle timer users in step after a row refresh."""
+    if entry is None:
+        timer_name_index.remove(user_id)
+    else:
+        timer_name_index.set(user_id, entry.get("user_name"))
+    load_battle_timer_users_cache()
+
+
 def load_battle_timer_users_cache():
     """
     Load users with Battle timer enabled into battle_timer_users_cache.
@@ -66,6 +91,7 @@ def set_timer_cache(
         "fish_setting": fish_setting,
         "battle_setting": battle_setting,
     }
+    timer_name_index.set(user_id, user_name)
     pretty_log(
         message=f"Updated timer cache for user {user_id} ({user_name})",
         label="⌚ TIMER CACHE",
@@ -74,12 +100,10 @@ def set_timer_cache(
 def fetch_id_by_user_name(user_name: str) -> int | None:
     """
     Fetch a user ID from the timer cache based on the user name.
+    Strips whitespace and compares case-insensitively.
     Returns None if not found.
     """
-    for user_id, settings in timer_cache.items():
-        if settings.get("user_name") == user_name:
-            return user_id
-    return None
+    return timer_name_index.get(user_name)
 
 def update_pokemon_setting_in_cache(user_id: int, pokemon_setting: str):
     """
@@ -21,8 +21,9 @@ async def load_user_captcha_alert_cache(bot):
     """
     from utils.database.captcha_alert_db_func import fetch_all_captcha_alerts
 
-    user_captcha_alert_cache.clear()
     rows = await fetch_all_captcha_alerts(bot)
+    # 🔹 Clear only after the fetch, so readers never see an empty cache
+    user_captcha_alert_cache.clear()
     for row in rows:
         user_captcha_alert_cache[row["user_id"]] = {
             "user_name": row.get("user_name"),
@@ -17,8 +17,9 @@ async def load_wb_battle_alert_cache(bot: discord.Client):
     This function should be called during bot startup.
     """
 
-    wb_battle_alert_cache.clear()
     rows = await fetch_all_wb_battle_alerts(bot)
+    # 🔹 Clear only after the fetch, so readers never see an empty cache
+    wb_battle_alert_cache.clear()
     for row in rows:
         wb_battle_alert_cache[row["user_id"]] = {
             "user_name": row.get("user_name"),
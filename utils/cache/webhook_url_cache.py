@@ -9,8 +9,9 @@ async def load_webhook_url_cache(bot: discord.Client):
     """
     Loads all webhook URLs from the database into the cache.
     """
-    webhook_url_cache.clear()
     webhook_urls = await fetch_all_webhook_urls(bot)
+    # 🔹 Clear only after the fetch, so readers never see an empty cache
+    webhook_url_cache.clear()
     webhook_url_cache.update(webhook_urls)
 
     pretty_log(
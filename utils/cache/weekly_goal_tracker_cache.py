@@ -1,6 +1,7 @@
 import time
 
 import discord
+from utils.cache.name_index import NameIndex
 from utils.loggers.pretty_logs import pretty_log
 
 weekly_goal_cache: dict[int, dict] = {}
@@ -17,6 +18,9 @@ weekly_goal_cache: dict[int, dict] = {}
 #   "weekly_guardian_mark": bool,
 # }
 
+# normalized user_name -> user_id, kept in step with weekly_goal_cache
+weekly_goal_name_index = NameIndex()
+
 async def load_weekly_goal_cache(bot):
     """
     Load all weekly goal tracker stats into memory cache.
@@ -24,10 +28,10 @@ async def load_weekly_goal_cache(bot):
     """
     from utils.database.weekly_goal_tracker_db_func import fetch_all_weekly_goals
 
-    weekly_goal_cache.clear()
     rows = await fetch_all_weekly_goals(bot)
+    loaded = {}
     for row in rows:
-        weekly_goal_cache[row["user_id"]] = {
+        loaded[row["user_id"]] = {
             "user_name": row.get("user_name"),
             "pokemon_caught": row.get("pokemon_caught", 0),
             "fish_caught": row.get("fish_caught", 0),
@@ -39,6 +43,11 @@ async def load_weekly_goal_cache(bot):
             "weekly_guardian_mark": row.get("weekly_guardian_mark", False),
         }
 
+    # 🔹 Swap cache and name index together, with no await in between
+    weekly_goal_cache.clear()
+    weekly_goal_cache.update(loaded)
+    weekly_goal_name_index.rebuild(weekly_goal_cache)
+
     pretty_log(
         message=f"Loaded {len(weekly_goal_cache)} users' weekly goal stats into cache",
         label="💠 WEEKLY GOAL CACHE",
@@ -87,6 +96,8 @@ def upsert_weekly_goal_cache(
             "weekly_guardian_mark": False,
         }
 
+    weekly_goal_name_index.set(user_id, user_name)
+
     # Mark this user as dirty for flushing
     mark_weekly_goal_dirty(user_id)
 
@@ -115,6 +126,7 @@ def update_weekly_requirement_mark(user_id: int, value: bool = True):
             "weekly_angler_mark": False,
             "weekly_guardian_mark": False,
         }
+        weekly_goal_name_index.set(user_id, weekly_goal_cache[user_id]["user_name"])
     else:
         weekly_goal_cache[user_id]["weekly_requirement_mark"] = value
 
@@ -135,6 +147,7 @@ def update_weekly_grinder_mark(user_id: int, value: bool = True):
             "weekly_angler_mark": False,
             "weekly_guardian_mark": False,
         }
+        weekly_goal_name_index.set(user_id, weekly_goal_cache[user_id]["user_name"])
     else:
         weekly_goal_cache[user_id]["weekly_grinder_mark"] = value
 
@@ -155,6 +168,7 @@ def update_weekly_angler_mark(user_id: int, value: bool = True):
             "weekly_angler_mark": value,
             "weekly_guardian_mark": False,
         }
+        weekly_goal_name_index.set(user_id, weekly_goal_cache[user_id]["user_name"])
     else:
         weekly_goal_cache[user_id]["weekly_angler_mark"] = value
 
@@ -175,6 +189,7 @@ def update_weekly_guardian_mark(user_id: int, value: bool = True):
             "weekly_angler_mark": False,
             "weekly_guardian_mark": value,
         }
+        weekly_goal_name_index.set(user_id, weekly_goal_cache[user_id]["user_name"])
     else:
         weekly_goal_cache[user_id]["weekly_guardian_mark"] = value
 
@@ -266,54 +281,66 @@ def increment_battles_won(user_name:str, user_id: int, amount: int = 1):
 # Dictionary to track which users have updated stats
 weekly_goal_cache_dirty: dict[int, bool] = {}
 
+# Users marked dirty while a flush is writing; their flag survives the flush
+_weekly_goal_flush_in_flight: set[int] = set()
+_weekly_goal_changed_during_flush: set[int] = set()
+
+WEEKLY_GOAL_UPSERT_QUERY = """
+    INSERT INTO weekly_goal_tracker (
+        user_id, user_name, channel_id, pokemon_caught, fish_caught, battles_won,
+        weekly_requirement_mark, weekly_grinder_mark, weekly_angler_mark, weekly_guardian_mark
+    )
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
+    ON CONFLICT(user_id) DO UPDATE SET
+        user_name = EXCLUDED.user_name,
+        channel_id = EXCLUDED.channel_id,
+        pokemon_caught = EXCLUDED.pokemon_caught,
+        fish_caught = EXCLUDED.fish_caught,
+        battles_won = EXCLUDED.battles_won,
+        weekly_requirement_mark = EXCLUDED.weekly_requirement_mark,
+        weekly_grinder_mark = EXCLUDED.weekly_grinder_mark,
+        weekly_angler_mark = EXCLUDED.weekly_angler_mark,
+        weekly_guardian_mark = EXCLUDED.weekly_guardian_mark;
+"""
+
 
 async def flush_weekly_goal_cache(bot: discord.Client):
     """
     Bulk upsert only dirty entries from weekly_goal_cache into the database.
     Call periodically (e.g., every 5 minutes) to persist cache.
+
+    All dirty rows are snapshotted up front and sent in one executemany
+    inside a single transaction. Dirty flags are cleared only after the
+    commit, and users marked dirty again while the write was in flight keep
+    their flag for the next flush. On failure every flag is left as-is.
     """
     if not weekly_goal_cache:
         return  # nothing to flush
 
     # Filter only dirty users
-    dirty_users = [uid for uid, dirty in weekly_goal_cache_dirty.items() if dirty]
+    dirty_users = [
+        uid
+        for uid, dirty in weekly_goal_cache_dirty.items()
+        if dirty and uid in weekly_goal_cache
+    ]
 
     # ── Exit early if nothing changed ──
     if not dirty_users:
         return  # nothing to flush
 
-    query = """
-        INSERT INTO weekly_goal_tracker (
-            user_id, user_name, channel_id, pokemon_caught, fish_caught, battles_won,
-            weekly_requirement_mark, weekly_grinder_mark, weekly_angler_mark, weekly_guardian_mark
+    # 🔹 Snapshot values before the first await so rows match one moment in time
+    records = []
+    for user_id in dirty_users:
+        stats = weekly_goal_cache[user_id]
+        user_obj = bot.get_user(user_id)
+        user_name = stats.get("user_name") or (
+            user_obj.name if user_obj else f"User {user_id}"
         )
-        VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
-        ON CONFLICT(user_id) DO UPDATE SET
-            user_name = EXCLUDED.user_name,
-            channel_id = EXCLUDED.channel_id,
-            pokemon_caught = EXCLUDED.pokemon_caught,
-            fish_caught = EXCLUDED.fish_caught,
-            battles_won = EXCLUDED.battles_won,
-            weekly_requirement_mark = EXCLUDED.weekly_requirement_mark,
-            weekly_grinder_mark = EXCLUDED.weekly_grinder_mark,
-            weekly_angler_mark = EXCLUDED.weekly_angler_mark,
-            weekly_guardian_mark = EXCLUDED.weekly_guardian_mark;
-    """
-
-    async with bot.pg_pool.acquire() as conn:
-        for user_id in dirty_users:
-            stats = weekly_goal_cache[user_id]
-            user_obj = bot.get_user(user_id)
-            user_name = stats.get("user_name") or (
-                user_obj.name if user_obj else f"User {user_id}"
-            )
-            channel_id = stats.get("channel_id")
-
-            await conn.execute(
-                query,
+        records.append(
+            (
                 user_id,
                 user_name,
-                channel_id,
+                stats.get("channel_id"),
                 stats.get("pokemon_caught", 0),
                 stats.get("fish_caught", 0),
                 stats.get("battles_won", 0),
@@ -322,9 +349,31 @@ async def flush_weekly_goal_cache(bot: discord.Client):
                 stats.get("weekly_angler_mark", False),
                 stats.get("weekly_guardian_mark", False),
             )
+        )
 
-            # Clear dirty flag after writing
-            weekly_goal_cache_dirty[user_id] = False
+    _weekly_goal_flush_in_flight.update(dirty_users)
+    try:
+        async with bot.pg_pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.executemany(WEEKLY_GOAL_UPSERT_QUERY, records)
+    except Exception as e:
+        # Flags were never cleared, so every row is retried as-is
+        _weekly_goal_changed_during_flush.difference_update(dirty_users)
+        pretty_log(
+            "warn",
+            f"Weekly goal flush of {len(records)} rows failed, will retry next tick: {e}",
+            label="💠 WEEKLY GOAL CACHE",
+        )
+        return
+    finally:
+        _weekly_goal_flush_in_flight.difference_update(dirty_users)
+
+    # Clear dirty flag after the commit, unless the user changed mid-flush
+    for user_id in dirty_users:
+        if user_id in _weekly_goal_changed_during_flush:
+            _weekly_goal_changed_during_flush.discard(user_id)
+            continue
+        weekly_goal_cache_dirty[user_id] = False
 
 
 # ── Helper to mark a user as dirty whenever stats change ──
@@ -332,6 +381,8 @@ def mark_weekly_goal_dirty(user_id: int):
     """Mark a user's weekly goal stats as dirty so they will be flushed to the DB.
     Exit early if already marked dirty.
     """
+    if user_id in _weekly_goal_flush_in_flight:
+        _weekly_goal_changed_during_flush.add(user_id)
     if weekly_goal_cache_dirty.get(user_id):
         return  # already dirty, no need to set again
     weekly_goal_cache_dirty[user_id] = True
@@ -389,19 +440,33 @@ async def old_flush_weekly_goal_cache(bot: discord.Client):
 def fetch_weekly_goal_cache_by_name(user_name: str):
     """
     Fetch a user's weekly goal stats from cache by Discord username.
+    Strips whitespace and compares case-insensitively.
     Returns a dict with user_id, pokemon_caught, fish_caught, battles_won, channel_id.
     """
-    for user_id, stats in weekly_goal_cache.items():
-        if stats.get("user_name") == user_name:
-            return {
-                "user_id": user_id,
-                "pokemon_caught": stats.get("pokemon_caught", 0),
-                "fish_caught": stats.get("fish_caught", 0),
-                "battles_won": stats.get("battles_won", 0),
-                "channel_id": stats.get("channel_id"),
+    user_id = weekly_goal_name_index.get(user_name)
+    stats = weekly_goal_cache.get(user_id) if user_id is not None else None
+    if stats is None:
+        return None
+    return {
+        "user_id": user_id,
+        "pokemon_caught": stats.get("pokemon_caught", 0),
+        "fish_caught": stats.get("fish_caught", 0),
+        "battles_won": stats.get("battles_won", 0),
+        "channel_id": stats.get("channel_id"),
+    }
+
+
+# 💠────────────────────────────────────────────
+# [📦 HELPER] Clear Weekly Goal Cache
+# 💠────────────────────────────────────────────
+def clear_weekly_goal_cache():
+    """Empties the cache, its dirty flags and its name index together."""
+    weekly_goal_cache.clear()
+    weekly_goal_cache_dirty.clear()
+    _weekly_goal_changed_during_flush.clear()
+    weekly_goal_name_index.clear()
+
 
-            }
-    return None
 # 💠────────────────────────────────────────────
 # [📦 HELPER] Fetch All Weekly Goal Cache
 # 💠────────────────────────────────────────────
@@ -3,6 +3,7 @@ import time
 import discord
 
 from config.aesthetic import Emojis
+from utils.background_task.due_scheduler import BERRY_GROWTH, BERRY_WATER, schedule_due
 from utils.loggers.pretty_logs import pretty_log
 
 # SQL TABLE
@@ -227,6 +228,8 @@ async def upsert_berry_reminder(
                 notified,
                 moisture_dries_on,
             )
+        schedule_due(BERRY_GROWTH, grows_on)
+        schedule_due(BERRY_WATER, moisture_dries_on)
         pretty_log(
             "db",
             f"Upserted berry reminder for {user_name} (user_id: {user_id}) in slot {slot_number}, "
@@ -308,6 +311,7 @@ async def update_growth_stage(
                 user_id,
                 slot_number,
             )
+        schedule_due(BERRY_GROWTH, grows_on)
         pretty_log(
             "db",
             f"Updated growth stage to {stage} and grows_on to {grows_on} for user_id {user_id} in slot {slot_number}",
@@ -447,6 +451,7 @@ async def update_moisture_dries_on(
                 user_id,
                 slot_number,
             )
+        schedule_due(BERRY_WATER, moisture_dries_on)
         pretty_log(
             "db",
             f"Updated moisture_dries_on to {moisture_dries_on} for user_id {user_id} in slot {slot_number}",
@@ -484,6 +489,27 @@ async def update_moisture_and_grows_on(
         )
 
 
+async def fetch_all_pending_grows_on(bot: discord.Client) -> list[int]:
+    """Fetches every distinct grows_on still set; seeds the due scheduler at startup."""
+    async with bot.pg_pool.acquire() as conn:
+        rows = await conn.fetch(
+            "SELECT DISTINCT grows_on FROM berry_reminder WHERE grows_on IS NOT NULL"
+        )
+    return [row["grows_on"] for row in rows]
+
+
+async def fetch_all_pending_moisture_dries_on(bot: discord.Client) -> list[int]:
+    """Fetches every distinct moisture_dries_on still set; seeds the due scheduler at startup."""
+    async with bot.pg_pool.acquire() as conn:
+        rows = await conn.fetch(
+            """
+            SELECT DISTINCT moisture_dries_on FROM berry_reminder
+            WHERE moisture_dries_on IS NOT NULL
+            """
+        )
+    return [row["moisture_dries_on"] for row in rows]
+
+
 async def fetch_all_due_moisture_dries_on(bot: discord.Client):
     """
     Fetches all berry reminders where moisture_dries_on is due"""
@@ -1,5 +1,13 @@
+from utils.essentials.get_pg_pool import register_query
 from utils.loggers.pretty_logs import pretty_log
 
+FETCH_PERSONAL_CHANNEL = register_query(
+    "personal_channels.fetch_channel_id",
+    "SELECT channel_id FROM personal_channels WHERE user_id = $1",
+    kind="fetchval",
+    timeout=5.0,
+)
+
 
 # 🍭 Get a registered personal channel
 import discord
@@ -8,11 +16,7 @@ async def get_registered_personal_channel(
     bot: discord.Client, user_id: int
 ) -> int | None:
     try:
-        async with bot.pg_pool.acquire() as conn:
-            row = await conn.fetchrow(
-                "SELECT channel_id FROM personal_channels WHERE user_id = $1", user_id
-            )
-            return row["channel_id"] if row else None
+        return await bot.pg_pool.run(FETCH_PERSONAL_CHANNEL, user_id)
     except Exception as e:
         pretty_log("warn", f"Failed to fetch personal channel for user {user_id}: {e}")
         return None
@@ -6,8 +6,23 @@ import time
 
 import asyncpg
 
+from utils.essentials.get_pg_pool import register_query
 from utils.loggers.pretty_logs import pretty_log
 
+UPSERT_FEELING_LUCKY_CD = register_query(
+    "feeling_lucky_cd.upsert",
+    """
+    INSERT INTO feeling_lucky_cd (user_id, user_name, cooldown_until)
+    VALUES ($1, $2, $3)
+    ON CONFLICT (user_id)
+    DO UPDATE SET
+        user_name = EXCLUDED.user_name,
+        cooldown_until = EXCLUDED.cooldown_until
+    """,
+    timeout=5.0,
+)
+
+
 # ⛄ Upsert cooldown row (6 hours from now)
 async def upsert_feeling_lucky_cd(bot, user_id: int, user_name: str):
     from utils.cache.fl_cache import upsert_feeling_lucky_cache
@@ -16,20 +31,9 @@ async def upsert_feeling_lucky_cd(bot, user_id: int, user_name: str):
     cooldown_until = int(time.time()) + 6 * 3600
 
     try:
-        async with bot.pg_pool.acquire() as conn:
-            await conn.execute(
-                """
-                INSERT INTO feeling_lucky_cd (user_id, user_name, cooldown_until)
-                VALUES ($1, $2, $3)
-                ON CONFLICT (user_id)
-                DO UPDATE SET
-                    user_name = EXCLUDED.user_name,
-                    cooldown_until = EXCLUDED.cooldown_until
-                """,
-                user_id,
-                user_name,
-                cooldown_until,
-            )
+        await bot.pg_pool.run(
+            UPSERT_FEELING_LUCKY_CD, user_id, user_name, cooldown_until
+        )
         upsert_feeling_lucky_cache(
             user_id=user_id, user_name=user_name, cooldown_until=cooldown_until
         )
@@ -1,4 +1,5 @@
 import asyncpg
+from utils.background_task.due_scheduler import SPECIAL_BATTLE, schedule_due
 from utils.loggers.pretty_logs import pretty_log
 
 
@@ -21,6 +22,7 @@ async def upsert_special_battle_timer(
                 ends_on,
                 channel_id,
             )
+            schedule_due(SPECIAL_BATTLE, ends_on)
             pretty_log(
                 "info",
                 f"Upserted special battle timer for {user_name}, npc {npc_name}, ends_on {ends_on}",
@@ -115,6 +117,16 @@ async def clear_expired_special_battle_timers(bot, current_unix: int):
         pretty_log("warn", f"Failed to clear expired special battle timers: {e}")
 
 
+# 💙─────────────────────────────────────────────💙
+#       ⏰ Fetch Pending Special Battle Ends On
+# 💙─────────────────────────────────────────────💙
+async def fetch_all_special_battle_ends_on(bot) -> list[int]:
+    """Fetches every distinct ends_on; seeds the due scheduler at startup."""
+    async with bot.pg_pool.acquire() as conn:
+        rows = await conn.fetch("SELECT DISTINCT ends_on FROM special_battle_timers")
+    return [row["ends_on"] for row in rows]
+
+
 # 💙─────────────────────────────────────────────💙
 #       ⏰ Fetch Due Special Battle Timers
 # 💙─────────────────────────────────────────────💙
@@ -293,3 +293,49 @@ async def remove_wb_reminder(bot: discord.Client, user_id: int):
             f"Failed to remove WB battle reminder for user_id {user_id}: {e}",
             bot=bot,
         )
+
+
+# Pending fight times, to seed the due scheduler at startup
+async def fetch_all_wb_remind_on(bot: discord.Client) -> list[int]:
+    """Fetches every distinct remind_on; one due time per boss fight."""
+    async with bot.pg_pool.acquire() as conn:
+        rows = await conn.fetch("SELECT DISTINCT remind_on FROM wb_battle_reminders")
+    return [row["remind_on"] for row in rows]
+
+
+# Delete many world boss battle reminders in one statement
+async def remove_wb_reminders(
+    bot: discord.Client, keys: list[tuple[int, str, int]]
+):
+    """
+    Remove the given (user_id, wb_name, remind_on) reminders in one statement.
+    remind_on is matched too: a re-registration made meanwhile updates the
+    row in place with a new time, and that row must survive.
+    """
+    if not keys:
+        return
+    query = """
+    DELETE FROM wb_battle_reminders
+    WHERE (user_id, wb_name, remind_on) IN (
+        SELECT * FROM unnest($1::bigint[], $2::text[], $3::bigint[])
+    );
+    """
+    try:
+        async with bot.pg_pool.acquire() as conn:
+            await conn.execute(
+                query,
+                [user_id for user_id, _, _ in keys],
+                [wb_name for _, wb_name, _ in keys],
+                [remind_on for _, _, remind_on in keys],
+            )
+        pretty_log(
+            "db",
+            f"Removed {len(keys)} WB battle reminders",
+            bot=bot,
+        )
+    except Exception as e:
+        pretty_log(
+            "error",
+            f"Failed to remove {len(keys)} WB battle reminders: {e}",
+            bot=bot,
+        )
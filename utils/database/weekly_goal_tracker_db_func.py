@@ -4,6 +4,25 @@
 from typing import List
 import discord
 
+from utils.essentials.get_pg_pool import register_query
+
+UPSERT_WEEKLY_GOAL = register_query(
+    "weekly_goal.upsert",
+    """
+    INSERT INTO weekly_goal_tracker (
+        user_id, user_name, channel_id, pokemon_caught, fish_caught, battles_won
+    )
+    VALUES ($1, $2, $3, $4, $5, $6)
+    ON CONFLICT(user_id) DO UPDATE SET
+        user_name = EXCLUDED.user_name,
+        channel_id = EXCLUDED.channel_id,
+        pokemon_caught = EXCLUDED.pokemon_caught,
+        fish_caught = EXCLUDED.fish_caught,
+        battles_won = EXCLUDED.battles_won
+    """,
+    timeout=5.0,
+)
+
 
 async def upsert_weekly_goal(
     bot: discord.Client,
@@ -18,28 +37,15 @@ async def upsert_weekly_goal(
     user_id = user.id
     user_name = user.name
 
-    query = """
-        INSERT INTO weekly_goal_tracker (
-            user_id, user_name, channel_id, pokemon_caught, fish_caught, battles_won
-        )
-        VALUES ($1, $2, $3, $4, $5, $6)
-        ON CONFLICT(user_id) DO UPDATE SET
-            user_name = EXCLUDED.user_name,
-            channel_id = EXCLUDED.channel_id,
-            pokemon_caught = EXCLUDED.pokemon_caught,
-            fish_caught = EXCLUDED.fish_caught,
-            battles_won = EXCLUDED.battles_won;
-    """
-    async with bot.pg_pool.acquire() as conn:
-        await conn.execute(
-            query,
-            user_id,
-            user_name,
-            channel_id,
-            pokemon_caught,
-            fish_caught,
-            battles_won,
-        )
+    await bot.pg_pool.run(
+        UPSERT_WEEKLY_GOAL,
+        user_id,
+        user_name,
+        channel_id,
+        pokemon_caught,
+        fish_caught,
+        battles_won,
+    )
     # Also update cache
     upsert_weekly_goal_cache(
         user,
@@ -0,0 +1,94 @@
+# 🟣────────────────────────────────────────────
+#        🔗 Reply Correlation Registry 🔗
+# ─────────────────────────────────────────────
+# For listeners that have to wait for PokeMeow's next message about the
+# same user (e.g. the battle follow-up with the enemy ID). Instead of one
+# bot.wait_for(check=...) per wait, which discord.py evaluates against every
+# incoming message, waits are filed under (channel_id, key). The message
+# router hands the relevant messages to the owning listener, which looks at
+# the waits of that one channel only and resolves the matching future.
+#
+# Timeouts go through the shared timer wheel; an expired wait raises
+# asyncio.TimeoutError in the waiter, like wait_for did.
+import asyncio
+from typing import Hashable
+
+from utils.background_task.timer_wheel import TimerHandle, timer_wheel
+
+
+class PendingReply:
+    __slots__ = ("future", "data", "handle")
+
+    def __init__(self, future: asyncio.Future, data):
+        self.future = future
+        self.data = data
+        self.handle: TimerHandle | None = None
+
+
+# 💠────────────────────────────────────────────
+# [🟣 CLASS] CorrelationRegistry
+# ─────────────────────────────────────────────
+class CorrelationRegistry:
+    def __init__(self, name: str):
+        self.name = name
+        self._pending: dict[int, dict[Hashable, PendingReply]] = {}
+        self.resolved = 0
+        self.expired = 0
+
+    def __len__(self):
+        return sum(len(waits) for waits in self._pending.values())
+
+    def expect(
+        self, channel_id: int, key: Hashable, timeout: float, data=None
+    ) -> asyncio.Future:
+        """
+        Files a wait for the next reply matching `key` in the channel.
+        `data` is kept with the wait for the matcher (e.g. the opponent name).
+        A newer wait for the same key cancels the older one.
+        """
+        self.discard(channel_id, key)
+        pending = PendingReply(asyncio.get_running_loop().create_future(), data)
+        pending.handle = timer_wheel.schedule(
+            (self.name, channel_id, key),
+            timeout,
+            lambda: self._expire(channel_id, key, pending),
+        )
+        self._pending.setdefault(channel_id, {})[key] = pending
+        return pending.future
+
+    def waiting_in(self, channel_id: int) -> dict[Hashable, PendingReply]:
+        """The open waits of one channel, keyed by correlation key."""
+        return self._pending.get(channel_id, {})
+
+    def resolve(self, channel_id: int, key: Hashable, value) -> bool:
+        pending = self._pop(channel_id, key)
+        if pending is None:
+            return False
+        pending.handle.cancel()
+        if not pending.future.done():
+            pending.future.set_result(value)
+        self.resolved += 1
+        return True
+
+    def discard(self, channel_id: int, key: Hashable):
+        pending = self._pop(channel_id, key)
+        if pending is not None:
+            pending.handle.cancel()
+            pending.future.cancel()
+
+    def _pop(self, channel_id: int, key: Hashable) -> PendingReply | None:
+        waits = self._pending.get(channel_id)
+        if not waits:
+            return None
+        pending = waits.pop(key, None)
+        if not waits:
+            del self._pending[channel_id]
+        return pending
+
+    def _expire(self, channel_id: int, key: Hashable, pending: PendingReply):
+        if self.waiting_in(channel_id).get(key) is not pending:
+            return
+        self._pop(channel_id, key)
+        if not pending.future.done():
+            pending.future.set_exception(asyncio.TimeoutError())
+        self.expired += 1
@@ -281,3 +281,191 @@ async def merge_json_fields(
             label="JSONB",
             bot=bot,
         )
+
+
+# 💠────────────────────────────────────────────
+# [🟣 HELPER] Atomic JSONB patch
+# ─────────────────────────────────────────────
+# patch_json_fields applies a whole patch (set, remove, fill-in defaults) in
+# ONE statement and returns the resulting document, so callers can refresh
+# their cache from what the DB actually stored instead of doing
+# SELECT → merge in Python → write the whole document back (which loses
+# concurrent updates to other keys). Values are stored as real JSON (numbers
+# stay numbers, None is null), unlike update_json_key / merge_json_fields.
+#
+# Each patch step is one LATERAL select over the previous document, so the
+# SQL grows linearly with the number of paths. Missing or non-object parents
+# are created as {} first, like _deep_set does in Python.
+def _flatten_json_paths(data: dict, prefix: tuple = ()) -> list[tuple[tuple, Any]]:
+    """{'relics': {'mode': 'off'}} -> [(('relics', 'mode'), 'off')]"""
+    paths = []
+    for key, value in data.items():
+        path = prefix + (str(key),)
+        if isinstance(value, dict) and value:
+            paths.extend(_flatten_json_paths(value, path))
+        else:
+            paths.append((path, value))
+    return paths
+
+
+def _apply_json_patch(
+    doc: dict, updates: dict, removals=(), defaults: Optional[dict] = None
+) -> dict:
+    """The same patch as patch_json_fields, in Python (used for new rows)."""
+
+    def parent_of(parts: list[str]) -> dict:
+        d = doc
+        for p in parts[:-1]:
+            if not isinstance(d.get(p), dict):
+                d[p] = {}
+            d = d[p]
+        return d
+
+    for path, value in _flatten_json_paths(defaults or {}):
+        parent_of(list(path)).setdefault(path[-1], value)
+    for field_path, value in updates.items():
+        parts = field_path.split(".")
+        parent_of(parts)[parts[-1]] = value
+    for field_path in removals:
+        parts = field_path.split(".")
+        d = doc
+        for p in parts[:-1]:
+            d = d.get(p) if isinstance(d, dict) else None
+        if isinstance(d, dict):
+            d.pop(parts[-1], None)
+    return doc
+
+
+async def patch_json_fields(
+    bot,
+    table: str,
+    key_column: str,
+    key_value: Any,
+    json_column: str,
+    updates: dict,
+    removals=(),
+    defaults: Optional[dict] = None,
+    upsert: bool = False,
+    extra_columns: Optional[dict] = None,
+) -> Optional[dict]:
+    """
+    Atomically patch nested keys of a JSONB column and return the new document.
+
+    - updates: dotted path → value to set
+    - removals: dotted paths to delete
+    - defaults: nested dict of values filled in only where the key is missing
+    - upsert: insert the row if it does not exist (with extra_columns, which
+      are also overwritten on conflict); otherwise a missing row returns None
+
+    Usage:
+    ```python
+    reminders = await patch_json_fields(
+        bot,
+        "user_pokemeow_reminders",
+        "user_id",
+        123,
+        "reminders",
+        {"catchbot.returns_on": 1757217600},
+        removals=["catchbot.reminds_next_on"],
+    )
+    ```
+    """
+    extra_columns = extra_columns or {}
+    params: list[Any] = [key_value]
+
+    def param(value, cast: str) -> str:
+        params.append(value)
+        return f"${len(params)}::{cast}"
+
+    steps: list[str] = []
+    ensured: set[tuple] = set()
+
+    def ensure_parents(parts: tuple):
+        for i in range(1, len(parts)):
+            prefix = parts[:i]
+            if prefix in ensured:
+                continue
+            ensured.add(prefix)
+            p = param(list(prefix), "text[]")
+            steps.append(
+                f"CASE WHEN jsonb_typeof(DOC #> {p}) = 'object' THEN DOC "
+                f"ELSE jsonb_set(DOC, {p}, '{{}}'::jsonb, true) END"
+            )
+
+    for path, value in _flatten_json_paths(defaults or {}):
+        ensure_parents(path)
+        p = param(list(path), "text[]")
+        v = param(json.dumps(value), "jsonb")
+        steps.append(
+            f"CASE WHEN DOC #> {p} IS NULL THEN jsonb_set(DOC, {p}, {v}, true) "
+            f"ELSE DOC END"
+        )
+    for field_path, value in updates.items():
+        path = tuple(field_path.split("."))
+        ensure_parents(path)
+        p = param(list(path), "text[]")
+        v = param(json.dumps(value), "jsonb")
+        steps.append(f"jsonb_set(DOC, {p}, {v}, true)")
+    for field_path in removals:
+        steps.append(f"DOC #- {param(field_path.split('.'), 'text[]')}")
+
+    current = f"{table}.{json_column}"
+    patched = (
+        f"(SELECT step_{len(steps)}.doc FROM (SELECT CASE WHEN "
+        f"jsonb_typeof({current}) = 'object' THEN {current} "
+        f"ELSE '{{}}'::jsonb END AS doc) step_0"
+    )
+    for i, step in enumerate(steps, start=1):
+        expression = step.replace("DOC", f"step_{i - 1}.doc")
+        patched += f" CROSS JOIN LATERAL (SELECT {expression} AS doc) step_{i}"
+    patched += ")"
+
+    if upsert:
+        new_doc = _apply_json_patch({}, updates, removals, defaults)
+        columns = [key_column, *extra_columns, json_column]
+        values = ["$1"]
+        for value in extra_columns.values():
+            params.append(value)
+            values.append(f"${len(params)}")
+        values.append(param(json.dumps(new_doc), "jsonb"))
+        assignments = [f"{column} = EXCLUDED.{column}" for column in extra_columns]
+        assignments.append(f"{json_column} = {patched}")
+        query = f"""
+            INSERT INTO {table} ({", ".join(columns)})
+            VALUES ({", ".join(values)})
+            ON CONFLICT ({key_column}) DO UPDATE
+            SET {", ".join(assignments)}
+            RETURNING {json_column}
+        """
+    else:
+        query = f"""
+            UPDATE {table}
+            SET {json_column} = {patched}
+            WHERE {key_column} = $1
+            RETURNING {json_column}
+        """
+
+    try:
+        async with bot.pg_pool.acquire() as conn:
+            result = await conn.fetchval(query, *params)
+    except Exception as e:
+        pretty_log(
+            tag="error",
+            message=f"Failed to patch {json_column} in {table}.{key_column}={key_value}: {e}",
+            label="JSONB",
+            bot=bot,
+        )
+        return None
+
+    if isinstance(result, str):
+        result = json.loads(result)
+    pretty_log(
+        tag="db",
+        message=(
+            f"Patched {json_column} for {table}.{key_column}={key_value} → "
+            f"set {list(updates)}, removed {list(removals)}"
+        ),
+        label="JSONB",
+        bot=bot,
+    )
+    return result
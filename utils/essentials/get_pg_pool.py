@@ -1,14 +1,128 @@
 import os
 import ssl
+import time
 import asyncio
 import asyncpg
 from asyncpg.pool import Pool
+from utils.essentials.pool_telemetry import call_site, pool_telemetry
 from utils.loggers.pretty_logs import pretty_log
 from dotenv import load_dotenv
 
 load_dotenv()
 
 
+# -------------------- [🩵 NAMED QUERY GATEWAY] --------------------
+# Hot queries are registered once by name (usually at import time of their
+# db module) and run with `await bot.pg_pool.run(NAME, *args)`:
+#
+# - each pool connection prepares a named query the first time it runs it
+#   and keeps the statement, so later runs skip parse/plan
+# - every named query has its own timeout (the statement is cancelled)
+# - transient failures and statement timeouts are retried on a pool
+#   connection; only connection failures rebuild the pool, once no matter
+#   how many callers hit them at the same time
+#
+# Ad-hoc SQL keeps working through acquire() / fetch() / execute().
+QUERY_KINDS = ("fetch", "fetchrow", "fetchval", "execute")
+DEFAULT_QUERY_TIMEOUT = 10.0
+RETRY_BACKOFF_SECONDS = 0.5
+
+# 🔹 The connection (or the whole pool) is gone: retry after a reconnect
+CONNECTION_ERRORS = (
+    asyncpg.exceptions.ConnectionDoesNotExistError,
+    asyncpg.exceptions.CannotConnectNowError,
+    ConnectionResetError,
+    OSError,
+)
+# 🔹 The statement lost a race or the server is busy: retrying is enough
+RETRYABLE_ERRORS = (
+    asyncpg.exceptions.SerializationError,
+    asyncpg.exceptions.DeadlockDetectedError,
+    asyncpg.exceptions.TooManyConnectionsError,
+)
+
+
+class NamedQuery:
+    __slots__ = ("name", "sql", "kind", "timeout")
+
+    def __init__(self, name: str, sql: str, kind: str, timeout: float):
+        self.name = name
+        self.sql = sql
+        self.kind = kind
+        self.timeout = timeout
+
+
+named_queries: dict[str, NamedQuery] = {}
+_names_by_sql: dict[str, str] = {}
+
+
+def register_query(
+    name: str, sql: str, kind: str = "execute", timeout: float = DEFAULT_QUERY_TIMEOUT
+) -> str:
+    """
+    Registers a named query for SafePool.run and returns its name.
+    kind picks what run() returns: fetch → rows, fetchrow → row | None,
+    fetchval → first column | None, execute → status string.
+    """
+    if kind not in QUERY_KINDS:
+        raise ValueError(f"Unknown query kind {kind!r} for {name}")
+    named_queries[name] = NamedQuery(name, sql, kind, timeout)
+    _names_by_sql[sql] = name
+    return name
+
+
+def named_query_for_sql(sql: str) -> str | None:
+    return _names_by_sql.get(sql)
+
+
+class GatewayConnection(asyncpg.Connection):
+    """
+    Pool connection that keeps the statements of the named queries it ran
+    and remembers which call site acquired it (for pool telemetry).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._named_statements: dict[str, asyncpg.prepared_stmt.PreparedStatement] = {}
+        self.call_site = "unknown"
+
+    def set_call_site(self, site: str):
+        self.call_site = site
+
+    async def run_named(self, query: NamedQuery, args: tuple):
+        # 🔹 Prepared statements bypass asyncpg's query loggers: time them here
+        start = time.perf_counter()
+        error = None
+        try:
+            return await self._run_prepared(query, args)
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            pool_telemetry.record_query(
+                query.name, time.perf_counter() - start, error, self.call_site
+            )
+
+    async def _run_prepared(self, query: NamedQuery, args: tuple):
+        for attempt in range(2):
+            statement = self._named_statements.get(query.name)
+            if statement is None:
+                statement = await self.prepare(query.sql, timeout=query.timeout)
+                self._named_statements[query.name] = statement
+            try:
+                if query.kind == "fetchrow":
+                    return await statement.fetchrow(*args, timeout=query.timeout)
+                if query.kind == "fetchval":
+                    return await statement.fetchval(*args, timeout=query.timeout)
+                rows = await statement.fetch(*args, timeout=query.timeout)
+                return rows if query.kind == "fetch" else statement.get_statusmsg()
+            except asyncpg.exceptions.InvalidCachedStatementError:
+                # 💠 Schema changed under the statement: prepare it again once
+                self._named_statements.pop(query.name, None)
+                if attempt:
+                    raise
+
+
 # -------------------- [💙 SAFE POOL WRAPPER WITH RETRY] --------------------
 class SafePool:
     def __init__(
@@ -25,54 +139,95 @@ class SafePool:
         self.max_size = max_size
         self.retry_count = retry_count
         self._pool: Pool | None = None
+        self._generation = 0  # bumped on every (re)connect
+        self._reconnect_lock = asyncio.Lock()
 
-    async def connect(self):
-        self._pool = await asyncpg.create_pool(
+    async def _create_pool(self) -> Pool:
+        return await asyncpg.create_pool(
             dsn=self.dsn,
             ssl=self.ssl_context,
             min_size=self.min_size,
             max_size=self.max_size,
+            connection_class=GatewayConnection,
+            init=self._init_connection,
         )
 
+    @staticmethod
+    async def _init_connection(conn):
+        # 🔹 asyncpg < 0.29 has no query loggers; pool telemetry still works
+        if hasattr(conn, "add_query_logger"):
+            conn.add_query_logger(
+                lambda logged: pool_telemetry.on_query(logged, conn.call_site)
+            )
+
+    async def connect(self):
+        self._pool = await self._create_pool()
+        self._generation += 1
+
     def acquire(self):
         if not self._pool:
             raise RuntimeError("SafePool not connected. Call connect() first.")
         return SafeConnection(self._pool)
 
-
-    async def _retry(self, method, *args, **kwargs):
+    async def _retry(self, method, *args, retry_timeouts=True, **kwargs):
         last_exc = None
         for attempt in range(1, self.retry_count + 2):
+            generation = self._generation
             try:
                 async with self.acquire() as conn:
                     return await method(conn, *args, **kwargs)
-            except (
-                asyncpg.exceptions.ConnectionDoesNotExistError,
-                ConnectionResetError,
-                OSError,
-                asyncio.TimeoutError,  # <— added
-            ) as e:
+            except (*CONNECTION_ERRORS, *RETRYABLE_ERRORS, asyncio.TimeoutError) as e:
+                if isinstance(e, asyncio.TimeoutError) and not retry_timeouts:
+                    raise
                 last_exc = e
+                # 🔹 A timeout cancelled the statement only; the pool is fine
+                # (TimeoutError is an OSError, so it is excluded explicitly)
+                reconnect = isinstance(e, CONNECTION_ERRORS) and not isinstance(
+                    e, asyncio.TimeoutError
+                )
                 pretty_log(
                     tag="warn",
-                    message=f"[Retry {attempt}/{self.retry_count + 1}] {method.__name__} failed: {e}. Reconnecting...",
+                    message=(
+                        f"[Retry {attempt}/{self.retry_count + 1}] "
+                        f"{method.__name__} failed: {e}."
+                        + (" Reconnecting..." if reconnect else "")
+                    ),
                     include_trace=False,
                 )
-                await asyncio.sleep(0.5)
-                await self._reconnect()
+                await asyncio.sleep(RETRY_BACKOFF_SECONDS * attempt)
+                if reconnect:
+                    await self._reconnect(generation)
         raise last_exc
 
-    async def _reconnect(self):
-        if self._pool:
-            try:
-                await self._pool.close()
-            except Exception:
-                pass
-        self._pool = await asyncpg.create_pool(
-            dsn=self.dsn,
-            ssl=self.ssl_context,
-            min_size=self.min_size,
-            max_size=self.max_size,
+    async def _reconnect(self, generation: int | None = None):
+        """
+        Rebuilds the pool. Callers pass the generation they failed on; if the
+        pool was rebuilt since, they reuse it instead of rebuilding again.
+        """
+        async with self._reconnect_lock:
+            if generation is not None and generation != self._generation:
+                return
+            old_pool = self._pool
+            if old_pool:
+                try:
+                    await asyncio.wait_for(old_pool.close(), timeout=5)
+                except Exception:
+                    old_pool.terminate()
+            self._pool = await self._create_pool()
+            self._generation += 1
+
+    async def run(self, name: str, *args):
+        """Runs a query registered with register_query (see above)."""
+        query = named_queries[name]
+
+        async def run_query(conn):
+            return await conn.run_named(query, args)
+
+        run_query.__name__ = f"run({name})"
+        return await self._retry(
+            run_query,
+            # 🔹 A timed-out write may still have been applied; don't repeat it
+            retry_timeouts=query.kind != "execute",
         )
 
     async def fetch(self, *args, **kwargs):
@@ -100,15 +255,29 @@ class SafeConnection:
     def __init__(self, pool: Pool):
         self.pool = pool
         self.conn = None
+        self.site = None
+        self.acquired_at = 0.0
 
     async def __aenter__(self):
-        self.conn = await self.pool.acquire()
+        self.site = call_site()
+        pool_telemetry.acquire_started()
+        start = time.perf_counter()
+        ok = False
+        try:
+            self.conn = await self.pool.acquire()
+            self.conn.set_call_site(self.site)
+            ok = True
+        finally:
+            self.acquired_at = time.perf_counter()
+            pool_telemetry.acquire_finished(self.acquired_at - start, ok)
         return self.conn
 
     async def __aexit__(self, exc_type, exc, tb):
+        if not self.conn:
+            return
+        pool_telemetry.released(time.perf_counter() - self.acquired_at, self.site)
         try:
-            if self.conn:
-                await self.pool.release(self.conn)
+            await self.pool.release(self.conn)
         except Exception:
             pass
 
@@ -0,0 +1,204 @@
+# 🟣────────────────────────────────────────────
+#       🎥 Listener Traffic Capture 🎥
+# ─────────────────────────────────────────────
+# Records raw gateway MESSAGE_CREATE / MESSAGE_UPDATE payloads to a gzip
+# JSONL file so the listener pipeline can be replayed offline as a
+# benchmark (see listener_replay). Started/stopped with /owner capture.
+#
+# File layout, one JSON object per line:
+#   {"t": "GUILD_SNAPSHOT", "d": {...}}              members/channels/roles
+#   {"t": "MESSAGE_CREATE", "ts": 1.234, "d": {...}}  ts = seconds since start
+#
+# Capturing wraps the two entries of the connection's parser table and puts
+# them back on stop, so it costs nothing while it is off. Captures contain
+# message content and member names: keep them out of git and share with care.
+import asyncio
+import gzip
+import json
+import os
+import time
+
+import discord
+
+from utils.loggers.pretty_logs import pretty_log
+
+CAPTURE_LABEL = "🎥 LISTENER CAPTURE"
+CAPTURE_DIR = os.getenv("LISTENER_CAPTURE_DIR", "captures")
+CAPTURED_EVENTS = ("MESSAGE_CREATE", "MESSAGE_UPDATE")
+FLUSH_EVERY_SECONDS = 2.0
+DEFAULT_MAX_EVENTS = 50_000
+
+
+# 💠────────────────────────────────────────────
+# [🟣 HELPER] Guild snapshot (enough for discord.Guild(data=...))
+# ─────────────────────────────────────────────
+def _user_payload(user: discord.abc.User) -> dict:
+    return {
+        "id": str(user.id),
+        "username": user.name,
+        "global_name": user.global_name,
+        "discriminator": user.discriminator,
+        "avatar": None,
+        "bot": user.bot,
+    }
+
+
+def guild_snapshot(guild: discord.Guild) -> dict:
+    return {
+        "id": str(guild.id),
+        "name": guild.name,
+        "owner_id": str(guild.owner_id),
+        "member_count": guild.member_count,
+        "roles": [
+            {
+                "id": str(role.id),
+                "name": role.name,
+                "position": role.position,
+                "permissions": str(role.permissions.value),
+                "color": role.color.value,
+            }
+            for role in guild.roles
+        ],
+        "channels": [
+            {
+                "id": str(channel.id),
+                "name": channel.name,
+                "type": channel.type.value,
+                "position": channel.position,
+                "parent_id": str(channel.category_id) if channel.category_id else None,
+            }
+            for channel in guild.channels
+        ],
+        "members": [
+            {
+                "user": _user_payload(member),
+                "nick": member.nick,
+                "roles": [str(role.id) for role in member.roles[1:]],
+                "joined_at": member.joined_at.isoformat() if member.joined_at else None,
+            }
+            for member in guild.members
+        ],
+    }
+
+
+# 💠────────────────────────────────────────────
+# [🟣 CLASS] ListenerCapture
+# ─────────────────────────────────────────────
+class ListenerCapture:
+    def __init__(self):
+        self.path: str | None = None
+        self.events = 0
+        self.max_events = DEFAULT_MAX_EVENTS
+        self._started_at = 0.0
+        self._lines: list[str] = []
+        self._originals: dict[str, object] = {}
+        self._parsers: dict | None = None
+        self._flush_task: asyncio.Task | None = None
+        self._stop_task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._parsers is not None
+
+    def start(
+        self,
+        bot: discord.Client,
+        max_minutes: float | None = None,
+        max_events: int = DEFAULT_MAX_EVENTS,
+    ) -> str:
+        """Starts capturing into a new file and returns its path."""
+        if self.running:
+            return self.path
+
+        os.makedirs(CAPTURE_DIR, exist_ok=True)
+        self.path = os.path.join(
+            CAPTURE_DIR, f"listeners_{time.strftime('%Y%m%d_%H%M%S')}.jsonl.gz"
+        )
+        self.events = 0
+        self.max_events = max_events
+        self._started_at = time.monotonic()
+        self._lines = [
+            json.dumps({"t": "GUILD_SNAPSHOT", "d": guild_snapshot(guild)})
+            for guild in bot.guilds
+        ]
+
+        self._parsers = bot._connection.parsers
+        for event in CAPTURED_EVENTS:
+            original = self._parsers[event]
+            self._originals[event] = original
+            self._parsers[event] = self._wrap(event, original)
+
+        self._flush_task = asyncio.create_task(self._flush_loop())
+        if max_minutes:
+            self._stop_task = asyncio.create_task(self._stop_after(max_minutes * 60))
+        pretty_log(
+            "info", f"Capturing listener traffic to {self.path}", label=CAPTURE_LABEL
+        )
+        return self.path
+
+    def _wrap(self, event: str, original):
+        def capture_then_parse(data):
+            if self.events < self.max_events:
+                self._lines.append(
+                    json.dumps(
+                        {
+                            "t": event,
+                            "ts": round(time.monotonic() - self._started_at, 4),
+                            "d": data,
+                        }
+                    )
+                )
+                self.events += 1
+            return original(data)
+
+        return capture_then_parse
+
+    async def stop(self) -> tuple[str | None, int]:
+        """Restores the parsers, writes what is left; returns (path, events)."""
+        if not self.running:
+            return self.path, self.events
+        for event, original in self._originals.items():
+            self._parsers[event] = original
+        self._originals.clear()
+        self._parsers = None
+
+        current = asyncio.current_task()
+        for task in (self._flush_task, self._stop_task):
+            if task and task is not current and not task.done():
+                task.cancel()
+        self._flush_task = self._stop_task = None
+        await self._flush()
+        pretty_log(
+            "info",
+            f"Captured {self.events} message events to {self.path}",
+            label=CAPTURE_LABEL,
+        )
+        return self.path, self.events
+
+    async def _stop_after(self, seconds: float):
+        await asyncio.sleep(seconds)
+        await self.stop()
+
+    async def _flush_loop(self):
+        while True:
+            await asyncio.sleep(FLUSH_EVERY_SECONDS)
+            await self._flush()
+
+    async def _flush(self):
+        lines, self._lines = self._lines, []
+        if not lines:
+            return
+        data = ("\n".join(lines) + "\n").encode()
+        try:
+            await asyncio.to_thread(self._append, self.path, data)
+        except OSError as e:
+            pretty_log("warn", f"Failed to write capture: {e}", label=CAPTURE_LABEL)
+
+    @staticmethod
+    def _append(path: str, data: bytes):
+        # 🔹 Each flush adds a gzip member; gzip.open reads them back as one stream
+        with gzip.open(path, "ab") as f:
+            f.write(data)
+
+
+listener_capture = ListenerCapture()
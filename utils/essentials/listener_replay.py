@@ -0,0 +1,324 @@
+# 🟣────────────────────────────────────────────
+#       📼 Listener Replay Benchmark 📼
+# ─────────────────────────────────────────────
+# Feeds a capture from /owner capture (see listener_capture) through the
+# real MessageCreateListener / MessageEditListener cogs, offline:
+#
+# - payloads go through discord.py's own MESSAGE_CREATE / MESSAGE_UPDATE
+#   parsers, so cogs receive the same Message objects as live
+# - Discord HTTP and webhooks are stubbed: every call is counted by route
+#   and answered with a minimal fake payload
+# - bot.pg_pool is an in-memory stand-in that records statements and
+#   returns empty results; caches can be warmed from a cache snapshot
+#
+# Reports messages/sec, per-handler latency (the routers' perf_stats) and,
+# with --allocations, tracemalloc peak and top allocation sites.
+#
+#   python -m utils.essentials.listener_replay captures/listeners_x.jsonl.gz \
+#       [--cache-snapshot .cache_snapshot.pkl] [--speed 0] [--allocations]
+import argparse
+import asyncio
+import gzip
+import itertools
+import json
+import time
+import tracemalloc
+from collections import Counter
+from datetime import datetime, timezone
+
+import discord
+from discord.ext import commands
+
+REPLAY_COGS = (
+    "cogs.events.message_create_listener",
+    "cogs.events.message_edit_listener",
+)
+REPLAY_BOT_USER_ID = 1  # never a real snowflake, so no listener mistakes it for a user
+_snowflakes = itertools.count(1 << 40)
+
+
+def load_capture(path: str) -> tuple[list[dict], list[dict]]:
+    """Returns (guild snapshots, message events) from a capture file."""
+    guilds, events = [], []
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if record["t"] == "GUILD_SNAPSHOT":
+                guilds.append(record["d"])
+            else:
+                events.append(record)
+    return guilds, events
+
+
+# 💠────────────────────────────────────────────
+# [🟣 STUB] In-memory pg pool
+# ─────────────────────────────────────────────
+class ReplayConnection:
+    """Answers every query with an empty result and counts the statements."""
+
+    def __init__(self, statements: Counter):
+        self.statements = statements
+
+    def _count(self, query: str):
+        self.statements[" ".join(query.split()[:3]).upper()] += 1
+
+    async def fetch(self, query, *args, **kwargs):
+        self._count(query)
+        return []
+
+    async def fetchrow(self, query, *args, **kwargs):
+        self._count(query)
+        return None
+
+    async def fetchval(self, query, *args, **kwargs):
+        self._count(query)
+        return None
+
+    async def execute(self, query, *args, **kwargs):
+        self._count(query)
+        return "OK"
+
+    async def executemany(self, query, args, **kwargs):
+        self._count(query)
+
+    def transaction(self):
+        return _NullContext(self)
+
+
+class _NullContext:
+    def __init__(self, value):
+        self.value = value
+
+    async def __aenter__(self):
+        return self.value
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class ReplayPool(ReplayConnection):
+    def __init__(self):
+        super().__init__(Counter())
+
+    def acquire(self):
+        return _NullContext(ReplayConnection(self.statements))
+
+    async def run(self, name: str, *args):
+        from utils.essentials.get_pg_pool import named_queries
+
+        self.statements[f"RUN {name}"] += 1
+        kind = named_queries[name].kind
+        return [] if kind == "fetch" else "OK" if kind == "execute" else None
+
+
+# 💠────────────────────────────────────────────
+# [🟣 STUB] Discord HTTP
+# ─────────────────────────────────────────────
+def _fake_message(channel_id, payload: dict | None) -> dict:
+    payload = payload or {}
+    return {
+        "id": str(next(_snowflakes)),
+        "channel_id": str(channel_id),
+        "author": {
+            "id": str(REPLAY_BOT_USER_ID),
+            "username": "replay",
+            "discriminator": "0",
+            "avatar": None,
+            "bot": True,
+        },
+        "content": payload.get("content") or "",
+        "embeds": payload.get("embeds") or [],
+        "attachments": [],
+        "mentions": [],
+        "mention_roles": [],
+        "mention_everyone": False,
+        "pinned": False,
+        "tts": False,
+        "type": 0,
+        "flags": 0,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "edited_timestamp": None,
+    }
+
+
+def install_http_stubs(bot: commands.Bot, calls: Counter):
+    async def fake_request(route, *, files=None, form=None, **kwargs):
+        calls[f"{route.method} {route.path}"] += 1
+        if route.method == "POST" and route.path.endswith("/messages"):
+            return _fake_message(route.channel_id, kwargs.get("json"))
+        if route.method == "POST" and route.path.endswith("/webhooks"):
+            return {
+                "id": str(next(_snowflakes)),
+                "type": 1,
+                "token": "replay",
+                "channel_id": str(route.channel_id),
+                "name": (kwargs.get("json") or {}).get("name", "replay"),
+            }
+        if route.method == "GET" and "/messages/" in route.path:
+            return _fake_message(route.channel_id, None)
+        return None
+
+    async def fake_webhook_request(adapter, route, session, *, payload=None, **kwargs):
+        calls[f"WEBHOOK {route.method} {route.webhook_id}"] += 1
+        if route.method == "POST" and (kwargs.get("params") or {}).get("wait"):
+            return _fake_message(0, payload)
+        return None
+
+    bot.http.request = fake_request
+    discord.webhook.async_.AsyncWebhookAdapter.request = fake_webhook_request
+
+
+# 💠────────────────────────────────────────────
+# [🟣 FUNC] Replay
+# ─────────────────────────────────────────────
+async def replay(
+    path: str,
+    cache_snapshot: str | None = None,
+    speed: float = 0.0,
+    allocations: bool = False,
+) -> dict:
+    from utils.essentials.perf_stats import reset_perf_stats
+
+    guilds, events = load_capture(path)
+
+    intents = discord.Intents.default()
+    intents.message_content = True
+    intents.members = True
+    bot = commands.Bot(command_prefix="!", intents=intents, help_command=None)
+    http_calls: Counter = Counter()
+
+    async with bot:
+        state = bot._connection
+        state.user = discord.ClientUser(
+            state=state,
+            data={
+                "id": str(REPLAY_BOT_USER_ID),
+                "username": "replay",
+                "discriminator": "0",
+                "avatar": None,
+                "bot": True,
+            },
+        )
+        for data in guilds:
+            state._add_guild(discord.Guild(data=data, state=state))
+        bot.pg_pool = ReplayPool()
+        install_http_stubs(bot, http_calls)
+
+        if cache_snapshot:
+            import utils.cache.centralized_cache  # 🔹 registers every cache
+            from utils.cache.cache_snapshot import restore_cache_snapshot
+
+            restore_cache_snapshot(cache_snapshot, max_age_seconds=None)
+
+        for extension in REPLAY_COGS:
+            await bot.load_extension(extension)
+
+        # 🔹 Track the listener tasks discord.py schedules for each event
+        pending: set[asyncio.Task] = set()
+        schedule_event = bot._schedule_event
+
+        def tracked_schedule_event(*args, **kwargs):
+            task = schedule_event(*args, **kwargs)
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+            return task
+
+        bot._schedule_event = tracked_schedule_event
+
+        reset_perf_stats()
+        if allocations:
+            tracemalloc.start(10)
+
+        started = time.perf_counter()
+        for event in events:
+            if speed > 0:
+                delay = event.get("ts", 0) / speed - (time.perf_counter() - started)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            data = event["d"]
+            if event["t"] == "MESSAGE_UPDATE" and not state._get_message(
+                int(data["id"])
+            ):
+                # 💠 Live, the edited message is usually cached; seed "before"
+                channel, _ = state._get_guild_channel(data)
+                state._messages.append(
+                    discord.Message(state=state, channel=channel, data=data)
+                )
+            state.parsers[event["t"]](data)
+            if len(pending) > 200:
+                await asyncio.sleep(0)  # 🔹 let handlers run between bursts
+        while pending:
+            await asyncio.gather(*list(pending), return_exceptions=True)
+        elapsed = time.perf_counter() - started
+
+        result = {
+            "events": len(events),
+            "seconds": elapsed,
+            "events_per_second": len(events) / elapsed if elapsed else 0.0,
+            "http_calls": http_calls,
+            "db_statements": bot.pg_pool.statements,
+        }
+        if allocations:
+            current, peak = tracemalloc.get_traced_memory()
+            result["alloc_peak_bytes"] = peak
+            result["alloc_top"] = tracemalloc.take_snapshot().statistics("lineno")[:15]
+            tracemalloc.stop()
+        return result
+
+
+def print_report(result: dict):
+    from group_func.owner.top_level.perf_stats import build_perf_table
+
+    print(
+        f"📼 Replayed {result['events']} events in {result['seconds']:.2f}s "
+        f"→ {result['events_per_second']:.0f} msg/s"
+    )
+    print()
+    print(build_perf_table(sort_by="p99", limit=30))
+    print()
+    print("HTTP calls (stubbed):")
+    for route, count in result["http_calls"].most_common(15):
+        print(f"  {count:>7}  {route}")
+    print("DB statements (in-memory):")
+    for statement, count in result["db_statements"].most_common(15):
+        print(f"  {count:>7}  {statement}")
+    if "alloc_peak_bytes" in result:
+        per_event = result["alloc_peak_bytes"] / max(1, result["events"])
+        print()
+        print(
+            f"Allocation peak: {result['alloc_peak_bytes'] / 1024:.0f} KiB "
+            f"({per_event:.0f} B/event)"
+        )
+        for stat in result["alloc_top"]:
+            print(f"  {stat}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a listener capture offline")
+    parser.add_argument("capture", help="Capture file from /owner capture")
+    parser.add_argument("--cache-snapshot", help="Warm caches from this snapshot")
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=0.0,
+        help="0 = as fast as possible, 1 = captured pace, 2 = twice as fast...",
+    )
+    parser.add_argument(
+        "--allocations", action="store_true", help="Trace allocations (slower)"
+    )
+    args = parser.parse_args()
+    result = asyncio.run(
+        replay(
+            args.capture,
+            cache_snapshot=args.cache_snapshot,
+            speed=args.speed,
+            allocations=args.allocations,
+        )
+    )
+    print_report(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# 🟣────────────────────────────────────────────
+#        🧷 Bounded TTL Message Dedupe 🧷
+# ─────────────────────────────────────────────
+# Drop-in replacement for the module-level `processed_*` sets. Entries expire
+# a fixed time after the message was created (read from the snowflake id),
+# and the oldest entries are evicted once capacity is reached, so memory stays
+# flat without a periodic clear() that would reopen the duplicate window.
+import time
+from collections import OrderedDict
+
+DISCORD_EPOCH_MS = 1420070400000
+
+
+def snowflake_time(snowflake: int) -> float:
+    """Unix timestamp (seconds) a Discord snowflake id was created at."""
+    return ((int(snowflake) >> 22) + DISCORD_EPOCH_MS) / 1000
+
+
+class MessageDedupe:
+    """
+    Set-like store of recently processed message ids.
+
+    - `message_id in dedupe` / `dedupe.add(message_id)` like the old sets
+    - `dedupe.check_and_add(message_id)` returns True only the first time
+    - ids expire `ttl_seconds` after their message was created
+    - at most `max_size` ids are kept; the oldest added are evicted first
+    """
+
+    __slots__ = ("name", "ttl_seconds", "max_size", "_expires_at")
+
+    def __init__(self, name: str, ttl_seconds: float = 3600, max_size: int = 10000):
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._expires_at: OrderedDict[int, float] = OrderedDict()
+
+    def __len__(self):
+        return len(self._expires_at)
+
+    def __contains__(self, message_id: int) -> bool:
+        expires_at = self._expires_at.get(message_id)
+        if expires_at is None:
+            return False
+        if expires_at <= time.time():
+            del self._expires_at[message_id]
+            return False
+        return True
+
+    def add(self, message_id: int):
+        now = time.time()
+        self._expires_at[message_id] = snowflake_time(message_id) + self.ttl_seconds
+        self._expires_at.move_to_end(message_id)
+        self._prune(now)
+
+    def check_and_add(self, message_id: int) -> bool:
+        """Returns True (and records the id) if it was not processed yet."""
+        if message_id in self:
+            return False
+        self.add(message_id)
+        return True
+
+    def discard(self, message_id: int):
+        self._expires_at.pop(message_id, None)
+
+    def clear(self):
+        self._expires_at.clear()
+
+    def _prune(self, now: float):
+        # 💠 Ids arrive roughly in creation order, so expired ones sit at the front
+        entries = self._expires_at
+        while entries:
+            expires_at = next(iter(entries.values()))
+            if expires_at > now and len(entries) <= self.max_size:
+                break
+            entries.popitem(last=False)
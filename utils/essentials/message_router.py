@@ -0,0 +1,297 @@
+# 🟣────────────────────────────────────────────
+#       💜 Compiled Message Trigger Router 💜
+# ─────────────────────────────────────────────
+# Every listener registers its trigger strings once. At dispatch time the
+# router scans each message field a single time with one compiled
+# multi-pattern regex and returns exactly the routes whose triggers matched.
+#
+# Usage:
+#
+#   router = MessageRouter()
+#
+#   @router.route("detect_pokemeow_reply", all_of=[Trigger("description", "found a wild")])
+#   async def _pokemon_timer(bot, parsed):
+#       await detect_pokemeow_reply(parsed.message, parsed=parsed)
+#
+#   @router.route("recommend_ball", all_of=[...], after=("detect_pokemeow_reply",))
+#   async def _recommend_ball(bot, parsed):
+#       ...
+#
+#   await router.dispatch(bot, ParsedPokeMeowMessage(message))
+import asyncio
+import re
+import time
+
+from utils.essentials.parsed_message import ParsedPokeMeowMessage
+from utils.essentials.perf_stats import record
+from utils.loggers.pretty_logs import pretty_log
+
+MESSAGE_FIELDS = ("content", "author", "title", "description", "footer", "fields")
+DEFAULT_HANDLER_TIMEOUT = 30.0  # seconds
+
+
+# 💠────────────────────────────────────────────
+# [🟣 CLASS] Trigger
+# ─────────────────────────────────────────────
+class Trigger:
+    """A literal string that must appear in one message field."""
+
+    __slots__ = ("field", "text", "ignore_case", "key")
+
+    def __init__(self, field: str, text: str, ignore_case: bool = False):
+        if field not in MESSAGE_FIELDS:
+            raise ValueError(f"Unknown message field for trigger: {field}")
+        self.field = field
+        self.text = text
+        self.ignore_case = ignore_case
+        self.key = (field, text.lower())
+
+    def __repr__(self):
+        flag = ", ignore_case=True" if self.ignore_case else ""
+        return f"Trigger({self.field!r}, {self.text!r}{flag})"
+
+
+# 💠────────────────────────────────────────────
+# [🟣 CLASS] Route
+# ─────────────────────────────────────────────
+class Route:
+    """
+    One handler plus the conditions that select it.
+
+    - all_of: every trigger must match
+    - any_of: at least one trigger must match (ignored when empty)
+    - none_of: no trigger may match
+    - pattern: (field, compiled regex) searched only after the triggers pass
+    - check: callable(message) -> bool for non-text conditions (channel, author, colour)
+    - announce: if set, a "Matched ..." line is logged before the handler runs
+    - after: names of earlier routes that must finish first when both match
+    - timeout: seconds before the handler is cancelled (None = no limit)
+    """
+
+    __slots__ = (
+        "name",
+        "handler",
+        "all_of",
+        "any_of",
+        "none_of",
+        "pattern",
+        "check",
+        "announce",
+        "after",
+        "timeout",
+        "required",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        handler,
+        *,
+        all_of=(),
+        any_of=(),
+        none_of=(),
+        pattern: tuple[str, re.Pattern] | None = None,
+        check=None,
+        announce: str | None = None,
+        after=(),
+        timeout: float | None = DEFAULT_HANDLER_TIMEOUT,
+    ):
+        self.name = name
+        self.handler = handler
+        self.all_of = tuple(all_of)
+        self.any_of = tuple(any_of)
+        self.none_of = tuple(none_of)
+        self.pattern = pattern
+        self.check = check
+        self.announce = announce
+        self.after = tuple(after)
+        self.timeout = timeout
+        # 🔹 Cheap subset test before any per-trigger verification
+        self.required = frozenset(trigger.key for trigger in self.all_of)
+
+    def __repr__(self):
+        return f"Route({self.name!r})"
+
+
+# 💠────────────────────────────────────────────
+# [🟣 CLASS] MessageRouter
+# ─────────────────────────────────────────────
+class MessageRouter:
+    """
+    Ordered set of routes with a compiled trigger scanner.
+
+    With concurrent=True, matched handlers run at the same time and only
+    wait on the routes they list in `after`; otherwise they run one by one
+    in registration order. Either way every handler gets its own timeout
+    and exception capture, so one failing or slow handler never blocks or
+    aborts the others.
+    """
+
+    def __init__(self, label: str = "ROUTER", concurrent: bool = True):
+        self.label = label
+        self.concurrent = concurrent
+        self.routes: list[Route] = []
+        self._scanners: dict[str, tuple[re.Pattern, dict[str, frozenset]]] | None = (
+            None
+        )
+
+    # 🔹 Registration
+    def add(self, route: Route) -> Route:
+        names = {existing.name for existing in self.routes}
+        if route.name in names:
+            raise ValueError(f"Duplicate route name: {route.name}")
+        # 🔹 Dependencies must already be registered, which also rules out cycles
+        for dependency in route.after:
+            if dependency not in names:
+                raise ValueError(
+                    f"Route {route.name} depends on unknown or later route {dependency}"
+                )
+        self.routes.append(route)
+        self._scanners = None  # 💤 recompile lazily on next match
+        return route
+
+    def route(self, name: str, **conditions):
+        """Decorator form of add(); returns the handler unchanged."""
+
+        def decorator(handler):
+            self.add(Route(name, handler, **conditions))
+            return handler
+
+        return decorator
+
+    # 🔹 Compilation
+    def compile(self):
+        """
+        Builds one case-insensitive scanner per field.
+
+        Each scanner is a lookahead alternation of every trigger for that
+        field, longest first, so one finditer pass reports a hit at every
+        position. Shorter triggers that are contained in a reported hit are
+        added through a precomputed containment closure, which keeps the scan
+        exact even when triggers overlap ("captcha" vs "captcha forgiveness
+        centre"). Every trigger has its own capture group and hits are mapped
+        back by group index, since the matched text may not lower() to the
+        trigger (e.g. "K" KELVIN SIGN matches "k").
+        """
+        by_field: dict[str, set[str]] = {}
+        for route in self.routes:
+            for trigger in (*route.all_of, *route.any_of, *route.none_of):
+                by_field.setdefault(trigger.field, set()).add(trigger.key[1])
+
+        scanners = {}
+        for field, texts in by_field.items():
+            ordered = sorted(texts, key=len, reverse=True)
+            regex = re.compile(
+                "(?=(?:" + "|".join(f"({re.escape(text)})" for text in ordered) + "))",
+                re.IGNORECASE,
+            )
+            # 🔹 implied[group index - 1] = keys present when that group matched
+            implied = [
+                frozenset((field, other) for other in ordered if other in text)
+                for text in ordered
+            ]
+            scanners[field] = (regex, implied)
+
+        self._scanners = scanners
+        return scanners
+
+    # 🔹 Matching
+    def scan(self, fields: dict[str, str]) -> set[tuple[str, str]]:
+        """Returns the (field, lowered trigger) keys present in the fields."""
+        scanners = self._scanners if self._scanners is not None else self.compile()
+        hits: set[tuple[str, str]] = set()
+        for field, (regex, implied) in scanners.items():
+            text = fields.get(field)
+            if not text:
+                continue
+            for match in regex.finditer(text):
+                hits |= implied[match.lastindex - 1]
+        return hits
+
+    @staticmethod
+    def _trigger_hit(trigger: Trigger, hits: set, fields: dict[str, str]) -> bool:
+        if trigger.key not in hits:
+            return False
+        # 🔹 Case-sensitive triggers are confirmed only after a scanner hit
+        return trigger.ignore_case or trigger.text in fields[trigger.field]
+
+    def match(self, parsed: ParsedPokeMeowMessage):
+        """Returns the routes to invoke for this message, in registration order."""
+        fields = parsed.fields
+        hits = self.scan(fields)
+
+        matched = []
+        for route in self.routes:
+            if not route.required <= hits:
+                continue
+            if not all(self._trigger_hit(t, hits, fields) for t in route.all_of):
+                continue
+            if route.any_of and not any(
+                self._trigger_hit(t, hits, fields) for t in route.any_of
+            ):
+                continue
+            if any(self._trigger_hit(t, hits, fields) for t in route.none_of):
+                continue
+            if route.pattern:
+                field, pattern = route.pattern
+                if not fields[field] or not pattern.search(fields[field]):
+                    continue
+            if route.check and not route.check(parsed.message):
+                continue
+            matched.append(route)
+        return matched
+
+    # 🔹 Dispatch
+    async def _run_route(self, bot, parsed: ParsedPokeMeowMessage, route: Route):
+        """
+        Runs one handler with its timeout and records its latency in
+        perf_stats; never raises except on cancellation.
+        """
+        message = parsed.message
+        if route.announce:
+            pretty_log(
+                "info",
+                f"Matched {route.announce} | Message ID: {message.id} | Channel: {message.channel.name}",
+            )
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(route.handler(bot, parsed), timeout=route.timeout)
+        except asyncio.TimeoutError:
+            record(self.label, route.name, time.perf_counter() - start, timeout=True)
+            pretty_log(
+                "warn",
+                f"{route.name} timed out after {route.timeout}s | Message ID: {message.id}",
+                label=self.label,
+            )
+        except Exception as e:
+            record(self.label, route.name, time.perf_counter() - start, error=True)
+            pretty_log(
+                "error",
+                f"Unhandled exception in {route.name} | Message ID: {message.id} | {e}",
+                label=self.label,
+            )
+        else:
+            record(self.label, route.name, time.perf_counter() - start)
+
+    async def dispatch(self, bot, parsed: ParsedPokeMeowMessage) -> list[Route]:
+        """Matches and runs every handler for this message, returns the routes run."""
+        routes = self.match(parsed)
+        if not self.concurrent or len(routes) <= 1:
+            for route in routes:
+                await self._run_route(bot, parsed, route)
+            return routes
+
+        finished = {route.name: asyncio.Event() for route in routes}
+
+        async def run_in_order(route: Route):
+            try:
+                for dependency in route.after:
+                    event = finished.get(dependency)
+                    if event:  # 💤 only wait on dependencies that matched too
+                        await event.wait()
+                await self._run_route(bot, parsed, route)
+            finally:
+                finished[route.name].set()
+
+        await asyncio.gather(*(run_in_order(route) for route in routes))
+        return routes
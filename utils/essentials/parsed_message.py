@@ -0,0 +1,239 @@
+# 🟣────────────────────────────────────────────
+#     💜 Shared Parsed PokeMeow Message 💜
+# ─────────────────────────────────────────────
+# Built once per gateway event by the create/edit listeners and passed to
+# every routed handler, so the first embed is read and each regex is run
+# at most once per message instead of once per handler.
+import re
+
+import discord
+
+from utils.essentials.pokemeow_helpers import is_pokemeow_reply
+
+FISHING_COLOR = 0x87CEFA  # sky blue
+HALLOWEEN_COLOR = 0xFFA500  # orange
+RARITY_BY_COLOR = {
+    546299: "common",
+    1291495: "uncommon",
+    16484616: "rare",
+    16315399: "superrare",
+    10487800: "legendary",
+    16751052: "shiny",
+    14940164: "golden",
+}
+
+TRAINER_NAME_PATTERN = re.compile(r"\*\*(.+?)\*\*\s+found a wild")
+FOOTER_RARITY_PATTERN = re.compile(r"([A-Za-z ]+)")
+
+_UNSET = object()
+
+
+# 💠────────────────────────────────────────────
+# [🟣 HELPER] Message field extraction
+# ─────────────────────────────────────────────
+def extract_message_fields(message: discord.Message) -> dict[str, str]:
+    """
+    Returns the raw text of every routable field of a message.
+    Missing fields are returned as empty strings.
+    """
+    embed = message.embeds[0] if message.embeds else None
+    if not embed:
+        return {
+            "content": message.content or "",
+            "author": "",
+            "title": "",
+            "description": "",
+            "footer": "",
+            "fields": "",
+        }
+
+    return {
+        "content": message.content or "",
+        "author": (embed.author.name or "") if embed.author else "",
+        "title": embed.title or "",
+        "description": embed.description or "",
+        "footer": (embed.footer.text or "") if embed.footer else "",
+        "fields": "\n".join(
+            f"{field.name or ''}\n{field.value or ''}" for field in embed.fields
+        ),
+    }
+
+
+# 💠────────────────────────────────────────────
+# [🟣 HELPER] Spawn rarity from embed colour/footer
+# ─────────────────────────────────────────────
+def rarity_from_embed(embed: discord.Embed | None) -> str | None:
+    """
+    Returns the spawn rarity key (common, rare, shiny, full_odds, ...) of a
+    PokeMeow spawn embed, using the embed colour first and the footer text
+    for the Halloween colour.
+    """
+    if not embed:
+        return None
+
+    footer_text = embed.footer.text if embed.footer else None
+    rarity = None
+    if embed.color and embed.color.value != HALLOWEEN_COLOR:
+        rarity = RARITY_BY_COLOR.get(embed.color.value)
+    elif footer_text and embed.color and embed.color.value not in RARITY_BY_COLOR:
+        match = FOOTER_RARITY_PATTERN.match(footer_text)
+        if match:
+            rarity = match.group(1).strip().lower().replace(" ", "")
+
+    # Special case: Shiny embeds
+    if rarity == "shiny" and footer_text:
+        footer_lower = footer_text.lower()
+        if "full-odds" in footer_lower:
+            rarity = "full_odds"
+    return rarity
+
+
+# 💠────────────────────────────────────────────
+# [🟣 CLASS] ParsedPokeMeowMessage
+# ─────────────────────────────────────────────
+class ParsedPokeMeowMessage:
+    """
+    Immutable, lazily computed view of one PokeMeow message.
+
+    `message` is the current message (the edited one for edit events) and
+    `before` is the pre-edit message, or the same message for create events.
+    Every derived attribute is computed on first access and then cached.
+    """
+
+    __slots__ = (
+        "message",
+        "before",
+        "_fields",
+        "_lower",
+        "_trainer_name",
+        "_reply_member",
+        "_rarity",
+    )
+
+    def __init__(
+        self, message: discord.Message, before: discord.Message | None = None
+    ):
+        object.__setattr__(self, "message", message)
+        object.__setattr__(self, "before", before if before is not None else message)
+        for slot in ("_fields", "_lower", "_trainer_name", "_reply_member", "_rarity"):
+            object.__setattr__(self, slot, _UNSET)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __repr__(self):
+        return f"<ParsedPokeMeowMessage id={self.message.id}>"
+
+    def _cache(self, slot: str, value):
+        object.__setattr__(self, slot, value)
+        return value
+
+    # 🔹 Raw fields
+    @property
+    def embed(self) -> discord.Embed | None:
+        embeds = self.message.embeds
+        return embeds[0] if embeds else None
+
+    @property
+    def fields(self) -> dict[str, str]:
+        if self._fields is _UNSET:
+            return self._cache("_fields", extract_message_fields(self.message))
+        return self._fields
+
+    @property
+    def content(self) -> str:
+        return self.fields["content"]
+
+    @property
+    def author(self) -> str:
+        return self.fields["author"]
+
+    @property
+    def title(self) -> str:
+        return self.fields["title"]
+
+    @property
+    def description(self) -> str:
+        return self.fields["description"]
+
+    @property
+    def footer(self) -> str:
+        return self.fields["footer"]
+
+    # 🔹 Lowercased fields
+    @property
+    def lower(self) -> dict[str, str]:
+        if self._lower is _UNSET:
+            return self._cache(
+                "_lower", {key: text.lower() for key, text in self.fields.items()}
+            )
+        return self._lower
+
+    @property
+    def content_lower(self) -> str:
+        return self.lower["content"]
+
+    @property
+    def author_lower(self) -> str:
+        return self.lower["author"]
+
+    @property
+    def title_lower(self) -> str:
+        return self.lower["title"]
+
+    @property
+    def description_lower(self) -> str:
+        return self.lower["description"]
+
+    @property
+    def footer_lower(self) -> str:
+        return self.lower["footer"]
+
+    # 🔹 Embed colour
+    @property
+    def embed_color(self) -> int | None:
+        embed = self.embed
+        return embed.color.value if embed and embed.color else None
+
+    @property
+    def is_fishing(self) -> bool:
+        return self.embed_color == FISHING_COLOR
+
+    # 🔹 Spawn flags
+    @property
+    def has_held_item(self) -> bool:
+        return "<:held_item:" in self.description
+
+    @property
+    def has_team_logo(self) -> bool:
+        return "<:team_logo:" in self.description
+
+    @property
+    def rarity(self) -> str | None:
+        if self._rarity is _UNSET:
+            return self._cache("_rarity", rarity_from_embed(self.embed))
+        return self._rarity
+
+    # 🔹 Trainer resolution
+    @property
+    def trainer_name(self) -> str | None:
+        """Trainer name from '**name** found a wild', embed first then content."""
+        if self._trainer_name is _UNSET:
+            match = TRAINER_NAME_PATTERN.search(
+                self.description
+            ) or TRAINER_NAME_PATTERN.search(self.content)
+            return self._cache(
+                "_trainer_name", match.group(1).strip() if match else None
+            )
+        return self._trainer_name
+
+    @property
+    def reply_member(self) -> discord.Member | None:
+        """The member PokeMeow replied to, or None."""
+        if self._reply_member is _UNSET:
+            return self._cache("_reply_member", is_pokemeow_reply(self.before) or None)
+        return self._reply_member
+
@@ -0,0 +1,138 @@
+# 🟣────────────────────────────────────────────
+#        💜 Handler & Checker Perf Stats 💜
+# ─────────────────────────────────────────────
+# Every routed listener handler and every CentralLoop checker records one
+# sample per call here. Latencies go into a fixed-size log-bucket histogram
+# so memory never grows with traffic, and p50/p95/p99 are read back from the
+# bucket counts. Rendered by /owner perf.
+#
+# Usage:
+#
+#   async with perf_timer("CENTRAL LOOP", "fl_cd_checker"):
+#       await fl_cd_checker(bot=bot)
+#
+#   record("💜 CREATE ROUTER", "recommend_ball", elapsed, error=False)
+import bisect
+import time
+from contextlib import asynccontextmanager
+
+# 🔹 Bucket upper bounds in seconds: 0.1 ms → ~3 min, ×1.25 per step
+_MIN_BUCKET = 0.0001
+_BUCKET_GROWTH = 1.25
+_BUCKET_COUNT = 64
+BUCKET_BOUNDS = tuple(_MIN_BUCKET * _BUCKET_GROWTH**i for i in range(_BUCKET_COUNT))
+
+
+# 💠────────────────────────────────────────────
+# [🟣 CLASS] LatencyHistogram
+# ─────────────────────────────────────────────
+class LatencyHistogram:
+    """Call/error/timeout counters plus a fixed-memory latency histogram."""
+
+    __slots__ = ("calls", "errors", "timeouts", "total", "max", "buckets")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (_BUCKET_COUNT + 1)  # last slot = overflow
+
+    def record(self, seconds: float, error: bool = False, timeout: bool = False):
+        self.calls += 1
+        if error:
+            self.errors += 1
+        if timeout:
+            self.timeouts += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.buckets[bisect.bisect_left(BUCKET_BOUNDS, seconds)] += 1
+
+    def percentile(self, pct: float) -> float:
+        """Upper bound of the bucket holding the pct-th sample (0 if empty)."""
+        if not self.calls:
+            return 0.0
+        rank = max(1, round(self.calls * pct / 100))
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank:
+                if index >= _BUCKET_COUNT:
+                    return self.max
+                return min(BUCKET_BOUNDS[index], self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.calls if self.calls else 0.0
+
+
+# 💠────────────────────────────────────────────
+# [🟣 REGISTRY] Stats by (group, name)
+# ─────────────────────────────────────────────
+perf_stats: dict[tuple[str, str], LatencyHistogram] = {}
+perf_started_at = time.time()
+
+
+def record(
+    group: str,
+    name: str,
+    seconds: float,
+    error: bool = False,
+    timeout: bool = False,
+):
+    """Records one call of `name` under `group` (router label, loop name)."""
+    stats = perf_stats.get((group, name))
+    if stats is None:
+        stats = perf_stats[(group, name)] = LatencyHistogram()
+    stats.record(seconds, error=error, timeout=timeout)
+
+
+@asynccontextmanager
+async def perf_timer(group: str, name: str):
+    """Times the wrapped block and records it; exceptions are counted and re-raised."""
+    start = time.perf_counter()
+    error = False
+    try:
+        yield
+    except BaseException:
+        error = True
+        raise
+    finally:
+        record(group, name, time.perf_counter() - start, error=error)
+
+
+def perf_window_seconds() -> float:
+    """Seconds since stats started (bot start or last reset)."""
+    return time.time() - perf_started_at
+
+
+def reset_perf_stats():
+    global perf_started_at
+    perf_stats.clear()
+    perf_started_at = time.time()
+
+
+def top_offenders(sort_by: str = "p99", limit: int = 15):
+    """
+    Returns [(group, name, stats)] sorted by the given key, worst first.
+    sort_by: p50, p95, p99, max, mean, calls, errors
+    """
+    if sort_by in ("p50", "p95", "p99"):
+        pct = float(sort_by[1:])
+        key = lambda item: item[1].percentile(pct)
+    elif sort_by == "errors":
+        key = lambda item: (item[1].errors + item[1].timeouts, item[1].calls)
+    else:
+        key = lambda item: getattr(item[1], sort_by)
+
+    ranked = sorted(perf_stats.items(), key=key, reverse=True)
+    return [(group, name, stats) for (group, name), stats in ranked[:limit]]
+
+
+def format_seconds(seconds: float) -> str:
+    if seconds >= 1:
+        return f"{seconds:.2f}s"
+    return f"{seconds * 1000:.1f}ms"
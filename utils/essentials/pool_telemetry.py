@@ -0,0 +1,182 @@
+# 🟣────────────────────────────────────────────
+#        🗄️ Postgres Pool Telemetry 🗄️
+# ─────────────────────────────────────────────
+# SafePool reports into the singleton below:
+#
+# - acquire wait: time from acquire() until a connection was handed out
+# - hold time: time a connection stayed checked out, also per call site, so
+#   handlers that keep a connection across Discord awaits stand out
+# - in use / waiting: current and peak concurrent holders and acquirers
+# - per-query latency, labelled by named query or by the start of the SQL:
+#   named queries are timed by GatewayConnection.run_named, ad-hoc SQL by
+#   the asyncpg query logger (which never sees prepared statements)
+# - a bounded log of the most recent slow queries with their call site,
+#   the site that acquired the connection (loggers run from the event loop,
+#   where the stack says nothing about the caller)
+#
+# Rendered by /owner db-pool and summarized by the central loop every
+# SUMMARY_EVERY_SECONDS. Histograms are perf_stats' fixed-memory ones.
+import os
+import sys
+import time
+from collections import deque
+
+from utils.essentials.perf_stats import LatencyHistogram, format_seconds
+
+POOL_LABEL = "🗄️ DB POOL"
+SLOW_QUERY_SECONDS = 0.5
+LONG_HOLD_SECONDS = 1.0
+SLOW_QUERY_LOG_SIZE = 50
+MAX_QUERY_LABELS = 200  # 🔹 dynamic SQL beyond this lands in "other"
+SUMMARY_EVERY_SECONDS = 600
+
+# 🔹 Frames skipped when looking for the code that asked for the connection
+_INTERNAL_PATHS = (
+    f"{os.sep}asyncpg{os.sep}",
+    f"{os.sep}asyncio{os.sep}",
+    "contextlib.py",
+    "get_pg_pool.py",
+    "pool_telemetry.py",
+)
+_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def call_site() -> str:
+    """'utils/listener_func/x.py:42 handler' of the first frame outside the pool."""
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if not any(part in filename for part in _INTERNAL_PATHS):
+            if filename.startswith(_ROOT):
+                filename = os.path.relpath(filename, _ROOT)
+            return f"{filename}:{frame.f_lineno} {frame.f_code.co_name}"
+        frame = frame.f_back
+    return "unknown"
+
+
+def _sql_label(sql: str) -> str:
+    return " ".join(sql.split())[:60]
+
+
+class SlowQuery:
+    __slots__ = ("at", "label", "seconds", "site", "error")
+
+    def __init__(self, label: str, seconds: float, site: str, error: str | None):
+        self.at = time.time()
+        self.label = label
+        self.seconds = seconds
+        self.site = site
+        self.error = error
+
+
+# 💠────────────────────────────────────────────
+# [🟣 CLASS] PoolTelemetry
+# ─────────────────────────────────────────────
+class PoolTelemetry:
+    def __init__(self):
+        self.reset()
+        self._last_summary = time.monotonic()
+
+    def reset(self):
+        self.started_at = time.time()
+        self.acquire_wait = LatencyHistogram()
+        self.hold = LatencyHistogram()
+        self.holds_by_site: dict[str, LatencyHistogram] = {}
+        self.queries: dict[str, LatencyHistogram] = {}
+        self.slow_queries: deque[SlowQuery] = deque(maxlen=SLOW_QUERY_LOG_SIZE)
+        self.in_use = getattr(self, "in_use", 0)
+        self.waiting = getattr(self, "waiting", 0)
+        self.peak_in_use = self.in_use
+        self.peak_waiting = self.waiting
+
+    # 🔹 SafeConnection: around pool.acquire() / pool.release()
+    def acquire_started(self):
+        self.waiting += 1
+        self.peak_waiting = max(self.peak_waiting, self.waiting)
+
+    def acquire_finished(self, seconds: float, ok: bool):
+        self.waiting -= 1
+        self.acquire_wait.record(seconds, error=not ok)
+        if ok:
+            self.in_use += 1
+            self.peak_in_use = max(self.peak_in_use, self.in_use)
+
+    def released(self, seconds: float, site: str):
+        self.in_use -= 1
+        self.hold.record(seconds)
+        # 🔹 Per call site, "timeouts" counts holds over LONG_HOLD_SECONDS
+        stats = self.holds_by_site.get(site)
+        if stats is None:
+            stats = self.holds_by_site[site] = LatencyHistogram()
+        stats.record(seconds, timeout=seconds >= LONG_HOLD_SECONDS)
+
+    # 🔹 asyncpg query logger (installed on every pool connection)
+    def on_query(self, logged, site: str):
+        from utils.essentials.get_pg_pool import named_query_for_sql
+
+        label = named_query_for_sql(logged.query) or _sql_label(logged.query)
+        self.record_query(label, logged.elapsed, logged.exception, site)
+
+    def record_query(
+        self, label: str, elapsed: float, exception: BaseException | None, site: str
+    ):
+        stats = self.queries.get(label)
+        if stats is None:
+            if len(self.queries) >= MAX_QUERY_LABELS:
+                label = "other"
+                stats = self.queries.setdefault(label, LatencyHistogram())
+            else:
+                stats = self.queries[label] = LatencyHistogram()
+        stats.record(
+            elapsed,
+            error=exception is not None,
+            timeout=isinstance(exception, TimeoutError),
+        )
+        if elapsed >= SLOW_QUERY_SECONDS:
+            error = type(exception).__name__ if exception else None
+            self.slow_queries.append(SlowQuery(label, elapsed, site, error))
+
+    # 🔹 Reports
+    def top_queries(self, limit: int = 10):
+        ranked = sorted(
+            self.queries.items(), key=lambda item: item[1].percentile(99), reverse=True
+        )
+        return ranked[:limit]
+
+    def top_holders(self, limit: int = 10):
+        ranked = sorted(
+            self.holds_by_site.items(), key=lambda item: item[1].max, reverse=True
+        )
+        return ranked[:limit]
+
+    def summary_line(self, pool=None) -> str:
+        size = ""
+        if pool is not None and getattr(pool, "_pool", None) is not None:
+            size = f"size {pool._pool.get_size()}/{pool.max_size} • "
+        return (
+            f"{size}in use {self.in_use} (peak {self.peak_in_use}) • "
+            f"waiting {self.waiting} (peak {self.peak_waiting}) • "
+            f"acquire p95 {format_seconds(self.acquire_wait.percentile(95))} "
+            f"max {format_seconds(self.acquire_wait.max)} • "
+            f"hold p95 {format_seconds(self.hold.percentile(95))} "
+            f"max {format_seconds(self.hold.max)} • "
+            f"{sum(s.calls for s in self.queries.values())} queries, "
+            f"{len(self.slow_queries)} slow"
+        )
+
+    def maybe_log_summary(self, bot):
+        """Logs summary_line once every SUMMARY_EVERY_SECONDS (central loop tick)."""
+        now = time.monotonic()
+        if now - self._last_summary < SUMMARY_EVERY_SECONDS:
+            return
+        self._last_summary = now
+        from utils.loggers.pretty_logs import pretty_log
+
+        pretty_log(
+            "db",
+            self.summary_line(getattr(bot, "pg_pool", None)),
+            label=POOL_LABEL,
+        )
+
+
+pool_telemetry = PoolTelemetry()
@@ -0,0 +1,192 @@
+# 🟣────────────────────────────────────────────
+#        📤 Outbound Send Queue 📤
+# ─────────────────────────────────────────────
+# Listener pings (timers, ball recos, held items, fossils, weekly goals...)
+# go through one dispatcher instead of calling channel.send directly:
+#
+# - per-channel token buckets keep each channel under Discord's REST limits
+#   instead of finding out from a 429 (see rate_limit_logger)
+# - plain-text messages on the normal lane wait a short window, then pending
+#   plain-text messages of the same channel and lane are merged into one
+# - reactions and time-critical pings use the priority lane: never held back
+#   by the window and always sent before queued normal messages (priority
+#   pings still merge with each other while waiting for a token)
+#
+# queue_send / queue_reaction return a future that resolves to the sent
+# discord.Message (or None on failure; failures are logged here), so callers
+# can fire and forget or await delivery.
+import asyncio
+import time
+from collections import deque
+
+from utils.essentials.perf_stats import perf_timer
+from utils.essentials.retry_function import _retry_discord_call
+from utils.loggers.pretty_logs import pretty_log
+
+SEND_QUEUE_LABEL = "📤 SEND QUEUE"
+
+PRIORITY = "priority"
+NORMAL = "normal"
+
+COALESCE_WINDOW_SECONDS = 0.35
+MAX_MESSAGE_LENGTH = 2000
+# Discord: ~5 messages / 5s per channel, reactions ~1 / 0.25s per channel
+CHANNEL_MESSAGE_RATE = 1.0
+CHANNEL_MESSAGE_BURST = 5
+CHANNEL_REACTION_RATE = 4.0
+CHANNEL_REACTION_BURST = 1
+GLOBAL_RATE = 40.0  # below the 50 req/s global limit, leaving room for commands
+
+
+class TokenBucket:
+    __slots__ = ("rate", "capacity", "tokens", "updated_at")
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+
+    async def acquire(self):
+        while True:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated_at) * self.rate
+            )
+            self.updated_at = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class _Outbound:
+    __slots__ = ("send", "content", "kwargs", "futures", "ready_at", "is_reaction")
+
+    def __init__(self, send, content, kwargs, ready_at, is_reaction=False):
+        self.send = send
+        self.content = content
+        self.kwargs = kwargs
+        self.futures = [asyncio.get_running_loop().create_future()]
+        self.ready_at = ready_at
+        self.is_reaction = is_reaction
+
+    @property
+    def mergeable(self) -> bool:
+        return not self.is_reaction and not self.kwargs and bool(self.content)
+
+
+class _ChannelLane:
+    __slots__ = ("priority", "normal", "messages", "reactions", "task")
+
+    def __init__(self):
+        self.priority: deque[_Outbound] = deque()
+        self.normal: deque[_Outbound] = deque()
+        self.messages = TokenBucket(CHANNEL_MESSAGE_RATE, CHANNEL_MESSAGE_BURST)
+        self.reactions = TokenBucket(CHANNEL_REACTION_RATE, CHANNEL_REACTION_BURST)
+        self.task: asyncio.Task | None = None
+
+
+# 💠────────────────────────────────────────────
+# [🟣 CLASS] OutboundDispatcher
+# ─────────────────────────────────────────────
+class OutboundDispatcher:
+    def __init__(self):
+        self._lanes: dict[int, _ChannelLane] = {}
+        self._global = TokenBucket(GLOBAL_RATE, int(GLOBAL_RATE))
+        self.sent = 0
+        self.merged = 0
+
+    def queue_send(self, channel, content=None, *, priority: str = NORMAL, **kwargs):
+        """Queues channel.send(content, **kwargs); returns a future of the Message."""
+        ready_at = time.monotonic()
+        if priority != PRIORITY:
+            ready_at += COALESCE_WINDOW_SECONDS
+        item = _Outbound(channel.send, content, kwargs, ready_at)
+        return self._enqueue(channel.id, item, priority)
+
+    def queue_reaction(self, message, emoji):
+        """Queues message.add_reaction(emoji) on the priority lane."""
+        item = _Outbound(
+            message.add_reaction, emoji, {}, time.monotonic(), is_reaction=True
+        )
+        return self._enqueue(message.channel.id, item, PRIORITY)
+
+    def pending(self) -> int:
+        return sum(len(l.priority) + len(l.normal) for l in self._lanes.values())
+
+    def _enqueue(self, channel_id: int, item: _Outbound, priority: str):
+        lane = self._lanes.get(channel_id)
+        if lane is None:
+            lane = self._lanes[channel_id] = _ChannelLane()
+        (lane.priority if priority == PRIORITY else lane.normal).append(item)
+        if lane.task is None or lane.task.done():
+            lane.task = asyncio.create_task(self._drain(channel_id, lane))
+        return item.futures[0]
+
+    def _take_merged(self, queue: deque) -> _Outbound:
+        """Pops the next item, merging the plain-text items queued behind it."""
+        item = queue.popleft()
+        if not item.mergeable:
+            return item
+        while queue and queue[0].mergeable:
+            following = queue[0]
+            merged = f"{item.content}\n{following.content}"
+            if len(merged) > MAX_MESSAGE_LENGTH:
+                break
+            queue.popleft()
+            item.content = merged
+            item.futures.extend(following.futures)
+            self.merged += 1
+        return item
+
+    async def _drain(self, channel_id: int, lane: _ChannelLane):
+        while lane.priority or lane.normal:
+            if not lane.priority:
+                wait = lane.normal[0].ready_at - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                    continue  # 💠 re-check the priority lane first
+
+            # 🔹 Wait for tokens before merging so the backlog merges into one send
+            queue = lane.priority or lane.normal
+            await (lane.reactions if queue[0].is_reaction else lane.messages).acquire()
+            await self._global.acquire()
+            item = self._take_merged(queue)
+            result = None
+            try:
+                async with perf_timer(
+                    SEND_QUEUE_LABEL, "reaction" if item.is_reaction else "send"
+                ):
+                    if item.is_reaction:
+                        await _retry_discord_call(item.send, item.content)
+                    else:
+                        result = await _retry_discord_call(
+                            item.send, item.content, **item.kwargs
+                        )
+                self.sent += 1
+            except Exception as e:
+                pretty_log(
+                    "warn",
+                    f"Failed to deliver queued {'reaction' if item.is_reaction else 'message'} "
+                    f"to channel {channel_id}: {e}",
+                    label=SEND_QUEUE_LABEL,
+                )
+            for future in item.futures:
+                if not future.done():
+                    future.set_result(result)
+
+        # 🔹 Idle channels do not keep a lane around
+        if self._lanes.get(channel_id) is lane and not (lane.priority or lane.normal):
+            del self._lanes[channel_id]
+
+
+outbound = OutboundDispatcher()
+
+
+def queue_send(channel, content=None, *, priority: str = NORMAL, **kwargs):
+    return outbound.queue_send(channel, content, priority=priority, **kwargs)
+
+
+def queue_reaction(message, emoji):
+    return outbound.queue_reaction(message, emoji)
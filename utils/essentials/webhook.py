@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime
 
 import discord
@@ -10,6 +11,7 @@ from utils.loggers.pretty_logs import pretty_log
 async def create_webhook_func(
     bot, channel: discord.TextChannel, name: str
 ) -> str | None:
+    webhook = None
     try:
 
         avatar_bytes = await bot.user.avatar.read()
@@ -29,41 +31,176 @@ async def create_webhook_func(
     return webhook.url if webhook else None
 
 
+# 🟣────────────────────────────────────────────
+#        🌐 Webhook Manager 🌐
+# ─────────────────────────────────────────────
+# One discord.Webhook per channel, built once over the bot's HTTP session.
+# Fire-and-forget sends are buffered per channel for a short window and
+# packed into as few POSTs as Discord allows (10 embeds, 6000 embed chars,
+# 2000 content chars). A cached webhook that returns 404 was deleted in
+# Discord: it is re-created and the send is retried once.
+WEBHOOK_LABEL = "🌐 WEBHOOK SEND"
+WEBHOOK_BATCH_WINDOW_SECONDS = 1.0
+MAX_WEBHOOK_EMBEDS = 10
+MAX_WEBHOOK_EMBED_CHARS = 6000
+MAX_WEBHOOK_CONTENT_LENGTH = 2000
+
+
+def _webhook_name(channel: discord.TextChannel) -> str:
+    channel_name = channel.name.lower()
+    if "goal" in channel_name:
+        return "Minccino Goal Tracker 🧀"
+    elif "lucky" in channel_name:
+        return "Minccino 🍀"
+    elif "log" or "report" in channel_name:
+        return "Minccino Logs 🐀"
+    return f"Minccino 🐭"
+
+
+def _pack_webhook_batches(
+    items: list[tuple[str | None, discord.Embed | None]],
+) -> list[tuple[str | None, list[discord.Embed]]]:
+    """Packs queued (content, embed) pairs, in order, into as few payloads as fit."""
+    batches = []
+    content, embeds, embed_chars = None, [], 0
+    for item_content, item_embed in items:
+        joined = "\n".join(c for c in (content, item_content) if c) or None
+        item_chars = len(item_embed) if item_embed else 0
+        fits = (
+            len(joined or "") <= MAX_WEBHOOK_CONTENT_LENGTH
+            and len(embeds) + (item_embed is not None) <= MAX_WEBHOOK_EMBEDS
+            and embed_chars + item_chars <= MAX_WEBHOOK_EMBED_CHARS
+        )
+        if not fits and (content or embeds):
+            batches.append((content, embeds))
+            content, embeds, embed_chars = None, [], 0
+            joined = item_content
+        content = joined
+        if item_embed is not None:
+            embeds.append(item_embed)
+            embed_chars += item_chars
+    if content or embeds:
+        batches.append((content, embeds))
+    return batches
+
+
+class WebhookManager:
+    def __init__(self):
+        self._webhooks: dict[int, discord.Webhook] = {}
+        self._locks: dict[int, asyncio.Lock] = {}
+        self._pending: dict[int, list] = {}
+        self._flush_tasks: dict[int, asyncio.Task] = {}
+        self.posts = 0
+        self.queued = 0
+
+    async def _get_webhook(
+        self, bot, channel: discord.TextChannel, recreate: bool = False
+    ) -> discord.Webhook | None:
+        lock = self._locks.setdefault(channel.id, asyncio.Lock())
+        async with lock:  # 💠 concurrent first sends must not create two webhooks
+            row = webhook_url_cache.get(channel.id)
+            url = row["url"] if row and not recreate else None
+            webhook = self._webhooks.get(channel.id)
+            if url and webhook and webhook.url == url:
+                return webhook
+
+            if not url:
+                url = await create_webhook_func(bot, channel, _webhook_name(channel))
+                if not url:
+                    return None
+                # Update cache for immediate use
+                webhook_url_cache[channel.id] = {
+                    "channel_name": channel.name,
+                    "url": url,
+                }
+
+            webhook = discord.Webhook.from_url(url, client=bot)
+            self._webhooks[channel.id] = webhook
+            return webhook
+
+    async def _post(
+        self,
+        bot,
+        channel: discord.TextChannel,
+        content: str | None,
+        embeds: list[discord.Embed],
+        wait: bool = False,
+    ):
+        kwargs = {"content": content}
+        if embeds:
+            kwargs["embeds"] = embeds
+
+        for attempt in range(2):
+            webhook = await self._get_webhook(bot, channel, recreate=attempt > 0)
+            if webhook is None:
+                pretty_log(
+                    tag="info",
+                    message=f"⚠️ Falling back to direct channel send for channel '{channel.name}' (ID: {channel.id}) due to webhook creation failure",
+                    label=WEBHOOK_LABEL,
+                )
+                return await channel.send(**kwargs)
+            try:
+                message = await webhook.send(**kwargs, wait=wait)
+                self.posts += 1
+                return message
+            except discord.NotFound:
+                self._webhooks.pop(channel.id, None)
+                pretty_log(
+                    tag="warn",
+                    message=f"Webhook for channel '{channel.name}' (ID: {channel.id}) no longer exists, re-creating it",
+                    label=WEBHOOK_LABEL,
+                )
+        return None
+
+    def queue(
+        self,
+        bot,
+        channel: discord.TextChannel,
+        content: str | None = None,
+        embed: discord.Embed | None = None,
+    ):
+        self._pending.setdefault(channel.id, []).append((content, embed))
+        self.queued += 1
+        task = self._flush_tasks.get(channel.id)
+        if task is None or task.done():
+            self._flush_tasks[channel.id] = asyncio.create_task(
+                self._flush_later(bot, channel)
+            )
+
+    async def _flush_later(self, bot, channel: discord.TextChannel):
+        # 💠 Items queued while a batch is posting go out with the next loop
+        while self._pending.get(channel.id):
+            await asyncio.sleep(WEBHOOK_BATCH_WINDOW_SECONDS)
+            pending = self._pending.pop(channel.id, [])
+            for content, embeds in _pack_webhook_batches(pending):
+                try:
+                    await self._post(bot, channel, content, embeds)
+                except Exception as e:
+                    pretty_log(
+                        tag="error",
+                        message=f"Failed to send webhook message to '{channel.name}' (ID: {channel.id}): {e}",
+                        label=WEBHOOK_LABEL,
+                    )
+
+
+webhook_manager = WebhookManager()
+
+
 async def send_webhook(
     bot: discord.Client,
     channel: discord.TextChannel,
     content: str = None,
     embed: discord.Embed = None,
+    wait: bool = False,
 ):
-    channel_id = channel.id
-    webhook_url_row = webhook_url_cache.get(channel_id)
-    if not webhook_url_row:
-        channel_name = channel.name
-        if "goal" in channel_name.lower():
-            webhook_name = "Minccino Goal Tracker 🧀"
-        elif "lucky" in channel_name.lower():
-            webhook_name = "Minccino 🍀"
-        elif "log" or "report" in channel_name.lower():
-            webhook_name = "Minccino Logs 🐀"
-        else:
-            webhook_name = f"Minccino 🐭"
-        webhook_url = await create_webhook_func(bot, channel, webhook_name)
-        if not webhook_url:
-            pretty_log(
-                tag="info",
-                message=f"⚠️ Falling back to direct channel send for channel '{channel.name}' (ID: {channel.id}) due to webhook creation failure",
-                label="🌐 WEBHOOK SEND",
-            )
-            await channel.send(content=content, embed=embed)
-            return
-        # Update cache for immediate use
-        webhook_url_cache[channel_id] = {
-            "channel_name": channel_name,
-            "url": webhook_url,
-        }
-        webhook_url_row = webhook_url_cache[channel_id]
-
-    webhook_url = webhook_url_row["url"]
-    if webhook_url:
-        webhook = discord.Webhook.from_url(webhook_url, client=bot)
-        await webhook.send(content=content, embed=embed, wait=True)
+    """
+    Sends through the channel's webhook.
+    By default the message is batched and sent in the background (returns None);
+    wait=True sends right away and returns the WebhookMessage.
+    """
+    if not wait:
+        webhook_manager.queue(bot, channel, content, embed)
+        return None
+    return await webhook_manager._post(
+        bot, channel, content, [embed] if embed else [], wait=True
+    )
@@ -9,13 +9,20 @@ from utils.cache.daily_fa_ball_cache import daily_faction_ball_cache
 from utils.cache.faction_ball_alert_cache import faction_ball_alert_cache
 from utils.cache.straymon_member_cache import straymon_member_cache
 from utils.cache.water_state_cache import get_water_state, update_water_state
-from utils.essentials.pokemeow_helpers import get_pokemeow_reply_member
+from utils.essentials.message_dedupe import MessageDedupe
+from utils.essentials.parsed_message import (
+    FISHING_COLOR,
+    HALLOWEEN_COLOR,
+    RARITY_BY_COLOR,
+    ParsedPokeMeowMessage,
+)
+from utils.essentials.send_queue import queue_send
 from utils.listener_func.catch_rate import *
 from utils.loggers.debug_log import debug_log, enable_debug
 from utils.loggers.pretty_logs import pretty_log
 
 
-processed_pokemon_spawns = set()
+processed_pokemon_spawns = MessageDedupe("processed_pokemon_spawns")
 # -------------------- Regex + constants --------------------
 HELD_ITEM_PATTERN = re.compile(
     r"(?:<:[^:]+:\d+>\s*)?"  # optional NPC emoji
@@ -27,18 +34,10 @@ HELD_ITEM_PATTERN = re.compile(
 # enable_debug(f"{__name__}.extract_water_state_from_author")
 # enable_debug(f"{__name__}.parse_pokemeow_spawn")
 # enable_debug(f"{__name__}.recommend_ball")
-FISHING_COLOR = 0x87CEFA  # sky blue
-HALLOWEEN_COLOR = 0xFFA500  # orange
 EVENT_EXCL_COLOR = 0xEA260B  # red
-embed_rarity_color = {
-    "common": 546299,
-    "uncommon": 1291495,
-    "rare": 16484616,
-    "superrare": 16315399,
-    "legendary": 10487800,
-    "shiny": 16751052,
-    "golden": 14940164,
-}
+embed_rarity_color = {rarity: color for color, rarity in RARITY_BY_COLOR.items()}
+
+
 def extract_trainer_name_from_description(description: str) -> str | None:
     """
     Extracts the trainer name (e.g. 'khy.09') from a PokéMeow embed description.
@@ -72,33 +71,34 @@ def extract_water_state_from_author(author_name: str) -> str:
 
 
 # -------------------- Parser --------------------
-def parse_pokemeow_spawn(message: discord.Message):
+def parse_pokemeow_spawn(
+    message: discord.Message, parsed: ParsedPokeMeowMessage | None = None
+):
     """Parses a PokeMeow spawn embed and returns dict with rarity/type, trainer_id, and water_state for fishing."""
 
     try:
+        if parsed is None:
+            parsed = ParsedPokeMeowMessage(message)
+
         # --- Ignore "robot return" messages by content ---
-        if (
-            message.content
-            and "i have returned with some pokemon for you!" in message.content.lower()
-        ):
+        if "i have returned with some pokemon for you!" in parsed.content_lower:
             return None
 
-        if not message.embeds:
+        embed = parsed.embed
+        if not embed:
             return None
-        embed = message.embeds[0]
 
         # --- Ignore captcha messages ---
-        title_text = embed.title or ""
-        description_text = embed.description or ""
-        if "captcha" in title_text.lower() or "captcha" in description_text.lower():
+        description_text = parsed.description
+        if "captcha" in parsed.title_lower or "captcha" in parsed.description_lower:
             return None
 
         # -------------------- CHECKING WATER STATE --------------------
         water_state = None
-        if embed.color and embed.color.value == FISHING_COLOR:
+        if parsed.is_fishing:
             pretty_log("debug", "Embed color indicates fishing spawn, checking water state")
-            if "cast a " in description_text.lower():
-                author_text = embed.author.name if embed.author else ""
+            if "cast a " in parsed.description_lower:
+                author_text = parsed.author
                 debug_log(f"Author text for cast detection: '{author_text}'")
 
                 current_state = extract_water_state_from_author(author_text)
@@ -132,55 +132,19 @@ def parse_pokemeow_spawn(message: discord.Message):
             return
 
         # -------------------- MUST BE A SPAWN --------------------
-        if description_text and "found a wild" not in description_text.lower():
+        if description_text and "found a wild" not in parsed.description_lower:
             debug_log("Embed description does not indicate a spawn, exiting parser")
             debug_log(f"Description text: {description_text!r}")
             return None
 
         # --- Ignore Research Lab messages ---
-        if embed.author and getattr(embed.author, "name", None):
-            if "pokemeow research lab" in embed.author.name.lower():
-                return None
+        if "pokemeow research lab" in parsed.author_lower:
+            return None
 
         footer_text = embed.footer.text if embed.footer else None
 
-        # -------------------- Rarity by color --------------------
-        rarity = None
-        if embed.color and embed.color.value != HALLOWEEN_COLOR:
-            # pretty_log("debug", f"Embed color value: {embed.color.value}")
-            for r, c in embed_rarity_color.items():
-                if embed.color.value == c:
-                    rarity = r
-                    break
-
-        # --- Fallback: parse rarity from footer if color not recognized ---
-        elif (
-            not rarity
-            and footer_text
-            and embed.color
-            and embed.color.value not in embed_rarity_color.values()
-        ):
-            pretty_log(
-                "debug",
-                f"Using footer text for rarity parsing, embed color: {embed.color.value if embed.color else 'None'}, footer_text: {footer_text!r}",
-            )
-            match = re.match(r"([A-Za-z ]+)", footer_text)
-            if match:
-                rarity = match.group(1).strip().lower().replace(" ", "")
-                pretty_log("debug", f"Parsed rarity from footer: {rarity}")
-            else:
-                pretty_log(
-                    "debug", f"Rarity regex did not match. Footer text: {footer_text!r}"
-                )
-
-        # Special case: Shiny embeds
-        if rarity == "shiny" and footer_text:
-            footer_lower = footer_text.lower()
-            if "full-odds" in footer_lower:
-                rarity = "full_odds"
-            elif "event" in footer_lower:
-                rarity = "shiny"
-            # pretty_log("debug", f"Refined shiny rarity to: {rarity}")
+        # -------------------- Rarity by color / footer --------------------
+        rarity = parsed.rarity
 
         # --- get trainer id from reply ---
         trainer_id = None
@@ -189,23 +153,17 @@ def parse_pokemeow_spawn(message: discord.Message):
             trainer_id = trainer_obj.id if trainer_obj else None
 
         # --- Spawn type ---
-        spawn_type = (
-            "fishing"
-            if embed.color and embed.color.value == FISHING_COLOR
-            else "pokemon"
-        )
+        spawn_type = "pokemon"
 
-        # --- Held item ---
         # --- Held item ---
         held_pokemon = None
-        if description_text:
+        if parsed.has_held_item:
             # Simple check: if held item emoji is in description, it's a held item spawn
-            if "<:held_item:" in description_text:
-                spawn_type = "held_item"
-                # You can still extract the pokemon name if needed with a simpler regex
-                pokemon_match = re.search(r"\*\*([A-Za-z_]+)\*\*", description_text)
-                if pokemon_match:
-                    held_pokemon = pokemon_match.group(1)
+            spawn_type = "held_item"
+            # You can still extract the pokemon name if needed with a simpler regex
+            pokemon_match = re.search(r"\*\*([A-Za-z_]+)\*\*", description_text)
+            if pokemon_match:
+                held_pokemon = pokemon_match.group(1)
 
         return {
             "type": spawn_type,
@@ -222,7 +180,9 @@ def parse_pokemeow_spawn(message: discord.Message):
 
 
 # -------------------- Recommender --------------------
-async def recommend_ball(message: discord.Message, bot):
+async def recommend_ball(
+    message: discord.Message, bot, parsed: ParsedPokeMeowMessage | None = None
+):
     from utils.cache.ball_reco_cache import ball_reco_cache
 
     try:
@@ -231,15 +191,14 @@ async def recommend_ball(message: discord.Message, bot):
                 f"recommend_ball: No embeds found in message in {message.channel.name}"
             )
             return None
-        embed = message.embeds[0]
-        embed_footer_text = embed.footer.text if embed.footer else ""
-        embed_description = embed.description or ""
-        if "PokeMeow | Egg Hatch" in embed_footer_text:
+        if parsed is None:
+            parsed = ParsedPokeMeowMessage(message)
+        if "PokeMeow | Egg Hatch" in parsed.footer:
             debug_log("recommend_ball: Detected egg hatch message, exiting recommender")
             return None  # 🚪 early exit for egg hatches
 
         user_id = None
-        member = await get_pokemeow_reply_member(message)
+        member = parsed.reply_member
         if member:
             user_id = member.id
 
@@ -247,7 +206,7 @@ async def recommend_ball(message: discord.Message, bot):
             debug_log(
                 f"No replied member found in {message.channel.name} tryin to extract trainer name as fallback"
             )
-            trainer_name = extract_trainer_name_from_description(embed_description)
+            trainer_name = parsed.trainer_name
             if trainer_name:
                 # Try to find user_id by name in cache
                 from utils.cache.ball_reco_cache import get_user_id_by_name
@@ -286,7 +245,7 @@ async def recommend_ball(message: discord.Message, bot):
             return
         processed_pokemon_spawns.add(message.id)
 
-        spawn_info = parse_pokemeow_spawn(message)
+        spawn_info = parse_pokemeow_spawn(message, parsed)
         if not spawn_info:
             debug_log("No valid spawn info parsed, exiting recommender")
             return None
@@ -323,7 +282,6 @@ async def recommend_ball(message: discord.Message, bot):
             return None
 
         # --- Masterball bypass ---
-        embed = message.embeds[0]
         """if embed.color and embed.color.value == 15345163:
 
             rarity = spawn_info.get("rarity")  # can be None
@@ -336,7 +294,7 @@ async def recommend_ball(message: discord.Message, bot):
             ball_emoji = ball_emojis.get("masterball")
 
             msg = f"{user_name} {Emojis_Balls.small_pokeball} {rarity_emoji} __Event Exclusive__ → {ball_emoji} ({rate}%)"
-            await message.channel.send(msg)
+            queue_send(message.channel, msg)
 
             return {
                 "user_id": user_id,
@@ -350,11 +308,7 @@ async def recommend_ball(message: discord.Message, bot):
         spawn_type = spawn_info.get("type")
         rarity = spawn_info.get("rarity")  # can be None
 
-        spawn_info = parse_pokemeow_spawn(message)
-        if not spawn_info:
-            return None
-
-        if spawn_info.get("type") == "fishing":
+        if spawn_type == "fishing":
             return None  # 🚪 hard exit for fishing spawns
 
         # --- Determine category and rarity key map ---
@@ -432,32 +386,25 @@ async def recommend_ball(message: discord.Message, bot):
 
         display_all = display_mode == "All Balls"
 
-        ball, rate, all_rates, all_balls_str = best_ball(
+        reco = lookup_best_ball(
             category,
             rarity_key,
             boost=boost,
             is_patreon=is_patreon,
             channel_boost=channel_boost,
-            display_all=display_all,  # <-- pass display preference
         )
+        ball, rate = reco.ball, reco.rate
 
         # --- Build recommendation message ---
         rarity_emoji = rarity_emojis.get(rarity.lower(), "") if rarity else ""
-        ball_emoji = ball_emojis.get(ball.lower(), "") if ball else ""
         user_name = user_settings["user_name"]
         # {Emojis.held_item}
         if spawn_type == "held_item":
-            if display_all and all_balls_str:
-                msg = f"{Emojis.pokespawn} **{user_name}** {Emojis.held_item} {rarity_emoji} → {all_balls_str}"
-            else:
-                msg = f"{Emojis.pokespawn} **{user_name}** {Emojis.held_item} {rarity_emoji} → {ball_emoji} ({rate}%)"
+            msg = f"{Emojis.pokespawn} **{user_name}** {Emojis.held_item} {rarity_emoji} → {reco.fragment(display_all)}"
         else:
-            if display_all and all_balls_str:
-                msg = f"{Emojis.pokespawn} **{user_name}** {rarity_emoji} → {all_balls_str}"
-            else:
-                msg = f"{Emojis.pokespawn} **{user_name}** {rarity_emoji} → {ball_emoji} ({rate}%)"
+            msg = f"{Emojis.pokespawn} **{user_name}** {rarity_emoji} → {reco.fragment(display_all)}"
 
-        await message.channel.send(msg)
+        queue_send(message.channel, msg)
 
         return {
             "user_id": user_id,
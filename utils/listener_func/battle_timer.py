@@ -7,18 +7,27 @@ from discord.ext import commands
 
 from config.aesthetic import Emojis
 from config.current_setup import MINCCINO_COLOR, POKEMEOW_APPLICATION_ID
+from utils.background_task.timer_wheel import timer_wheel
 from utils.cache.cache_list import (
     timer_cache,
 )
+from utils.cache.member_name_index import find_member_by_name
+from utils.essentials.correlation_registry import CorrelationRegistry
+from utils.essentials.send_queue import PRIORITY, queue_reaction, queue_send
 from utils.loggers.debug_log import debug_log, enable_debug
 from utils.loggers.pretty_logs import pretty_log
 
-battle_ready_tasks = {}
+BATTLE_TIMER = 60.0
+BATTLE_READY = "battle_ready"  # timer wheel key: (member_id, BATTLE_READY)
+# Follow-up waits still running; kept referenced until done
+_followup_tasks: set[asyncio.Task] = set()
+FOLLOWUP_TIMEOUT_SECONDS = 10.0
 FOLLOWUP_REJECT_LOG_COOLDOWN_SECONDS = 10.0
+# Challenges waiting for their follow-up, keyed by (channel_id, challenger name)
+battle_followups = CorrelationRegistry("battle_followup")
 followup_reject_log_cache: dict[str, float] = {}
 """enable_debug(f"{__name__}._wait_for_enemy_id")
 enable_debug(f"{__name__}._send_battle_ready_notification")
-enable_debug(f"{__name__}._cancel_existing_timer_task")
 enable_debug(f"{__name__}.detect_pokemeow_battle")"""
 # BATTLE TOWER NPC IDS 400 TO 407
 BATTLE_TOWER_NPC_IDS = [400, 401, 402, 403, 404, 405, 406, 407]
@@ -145,6 +154,12 @@ IGNORE_BATTLE_FOLLOWUP_LIST = [
     "Mega Chamber",
     "Enemy ID: 970",
 ]
+# Footer text of every message handle_battle_followup needs to see
+BATTLE_FOLLOWUP_FOOTERS = [
+    "Enemy ID:",
+    "Battle Pike Round",
+    *IGNORE_BATTLE_FOLLOWUP_LIST,
+]
 
 
 CHALLENGE_REGEX = re.compile(
@@ -183,11 +198,7 @@ def _parse_challenge_names(description: str) -> Optional[tuple[str, str]]:
 def _find_member_by_name(
     guild: discord.Guild, member_name: str
 ) -> Optional[discord.Member]:
-    target = member_name.lower()
-    return discord.utils.find(
-        lambda m: m.name.lower() == target or m.display_name.lower() == target,
-        guild.members,
-    )
+    return find_member_by_name(guild, member_name)
 
 
 def _is_ignored_battle_followup(footer_text: str) -> bool:
@@ -240,49 +251,13 @@ async def _wait_for_enemy_id(
     opponent_name: str,
     source_channel_id: int,
 ) -> tuple[Optional[str], bool]:
-    def check(m: discord.Message) -> bool:
-        if m.author.id != POKEMEOW_APPLICATION_ID or not m.embeds:
-            return False
-
-        embed = m.embeds[0]
-        footer_text = embed.footer.text if embed.footer else ""
-        is_enemy_followup = "Enemy ID:" in footer_text or (
-            "Battle Pike Round" in footer_text and "Moves taken" in footer_text
-        )
-
-        if m.channel.id != source_channel_id:
-            if is_enemy_followup:
-                reason_key = (
-                    "channel_mismatch:"
-                    f"{source_channel_id}:{m.channel.id}:{challenger_name.lower()}:{opponent_name.lower()}"
-                )
-                if _should_log_rejected_followup(reason_key):
-                    pretty_log(
-                        "info",
-                        "Ignored battle follow-up from different channel "
-                        f"(expected={source_channel_id}, got={m.channel.id}) "
-                        f"for challenger={challenger_name}, opponent={opponent_name}",
-                    )
-            return False
-
-        is_relevant = _is_relevant_enemy_followup(embed, challenger_name, opponent_name)
-        if not is_relevant and is_enemy_followup:
-            reason_key = (
-                "name_mismatch:"
-                f"{source_channel_id}:{challenger_name.lower()}:{opponent_name.lower()}"
-            )
-            if _should_log_rejected_followup(reason_key):
-                pretty_log(
-                    "info",
-                    "Ignored battle follow-up due to challenger/opponent mismatch "
-                    f"for challenger={challenger_name}, opponent={opponent_name}",
-                )
-        return is_relevant
-
     try:
         debug_log("Waiting for follow-up battle message")
-        followup: discord.Message = await bot.wait_for(
-            "message", timeout=10, check=check
+        followup: discord.Message = await battle_followups.expect(
+            source_channel_id,
+            challenger_name.lower(),
+            timeout=FOLLOWUP_TIMEOUT_SECONDS,
+            data=opponent_name,
         )
         followup_embed = followup.embeds[0]
         footer_text = followup_embed.footer.text if followup_embed.footer else ""
@@ -309,6 +284,35 @@ async def _wait_for_enemy_id(
         return None, False
 
 
+def handle_battle_followup(message: discord.Message) -> None:
+    """
+    Router entry for PokeMeow battle follow-ups (enemy ID / ignored footers).
+    Resolves the matching challenger's wait in this channel, if any.
+    """
+    waits = battle_followups.waiting_in(message.channel.id)
+    if not waits or not message.embeds:
+        return
+
+    embed = message.embeds[0]
+    for challenger_key, pending in list(waits.items()):
+        opponent_name = pending.data
+        if _is_relevant_enemy_followup(embed, challenger_key, opponent_name):
+            battle_followups.resolve(message.channel.id, challenger_key, message)
+            return
+
+    footer_text = embed.footer.text if embed.footer else ""
+    is_enemy_followup = "Enemy ID:" in footer_text or (
+        "Battle Pike Round" in footer_text and "Moves taken" in footer_text
+    )
+    reason_key = f"name_mismatch:{message.channel.id}"
+    if is_enemy_followup and _should_log_rejected_followup(reason_key):
+        pretty_log(
+            "info",
+            "Ignored battle follow-up due to challenger/opponent mismatch "
+            f"in channel {message.channel.id} ({len(waits)} pending challenges)",
+        )
+
+
 def _build_battle_command(enemy_id: Optional[str]) -> str:
     if not enemy_id:
         return "Your </battle:1015311084422434819> command is ready!"
@@ -334,7 +338,7 @@ def _build_battle_command(enemy_id: Optional[str]) -> str:
     return f";b npc {enemy_id}"
 
 
-async def _send_battle_ready_notification(
+def _send_battle_ready_notification(
     message: discord.Message,
     challenger: discord.Member,
     setting: str,
@@ -342,7 +346,7 @@ async def _send_battle_ready_notification(
 ) -> None:
     if setting == "react":
         debug_log("Sending battle-ready notice via reaction")
-        await message.add_reaction(Emojis.gray_check)
+        queue_reaction(message, Emojis.gray_check)
         return
 
     battle_embed = discord.Embed(color=MINCCINO_COLOR)
@@ -350,27 +354,24 @@ async def _send_battle_ready_notification(
 
     if setting == "on":
         debug_log("Sending battle-ready notice with mention")
-        await message.channel.send(
-            content=f"{Emojis.battle_spawn} {challenger.mention}, your </battle:1015311084422434819> command is ready!",
+        queue_send(
+            message.channel,
+            f"{Emojis.battle_spawn} {challenger.mention}, your </battle:1015311084422434819> command is ready!",
             embed=battle_embed,
+            priority=PRIORITY,
         )
         return
 
     if setting in {"on w/o pings", "on_no_pings"}:
         debug_log("Sending battle-ready notice without mention")
-        await message.channel.send(
-            content=f"{Emojis.battle_spawn} **{challenger.name}**, your </battle:1015311084422434819> command is ready!",
+        queue_send(
+            message.channel,
+            f"{Emojis.battle_spawn} **{challenger.name}**, your </battle:1015311084422434819> command is ready!",
             embed=battle_embed,
+            priority=PRIORITY,
         )
 
 
-def _cancel_existing_timer_task(challenger_id: int) -> None:
-    existing_task = battle_ready_tasks.get(challenger_id)
-    if existing_task and not existing_task.done():
-        debug_log("Cancelling existing battle-ready timer task")
-        existing_task.cancel()
-
-
 async def detect_pokemeow_battle(bot: commands.Bot, message: discord.Message):
     try:
         debug_log("Entered detect_pokemeow_battle()", disabled=True)
@@ -456,28 +457,25 @@ async def detect_pokemeow_battle(bot: commands.Bot, message: discord.Message):
                 debug_log("Could not match challenger to guild member")
                 return
 
-        _cancel_existing_timer_task(challenger.id)
-
         enemy_id_holder = {"id": None}
-        timer_start = asyncio.get_running_loop().time()
 
-        async def notify_battle_ready(delay_seconds: float = 60.0) -> None:
-            try:
-                await asyncio.sleep(delay_seconds)
-                battle_command = _build_battle_command(enemy_id_holder["id"])
-                debug_log(f"Battle-ready command resolved: {battle_command}")
-                await _send_battle_ready_notification(
-                    message=message,
-                    challenger=challenger,
-                    setting=setting,
-                    battle_command=battle_command,
-                )
-            except asyncio.CancelledError:
-                debug_log("Battle-ready timer task cancelled")
-            except Exception as e:
-                debug_log(f"Battle-ready timer task error: {e}")
+        def notify_battle_ready() -> None:
+            battle_command = _build_battle_command(enemy_id_holder["id"])
+            debug_log(f"Battle-ready command resolved: {battle_command}")
+            _send_battle_ready_notification(
+                message=message,
+                challenger=challenger,
+                setting=setting,
+                battle_command=battle_command,
+            )
+
+        # 💠 The timer starts at the challenge and replaces any pending battle
+        # timer of this challenger; the follow-up only fills in the enemy ID
+        timer_handle = timer_wheel.schedule(
+            (challenger.id, BATTLE_READY), BATTLE_TIMER, notify_battle_ready
+        )
 
-        async def prepare_and_schedule_battle_ready() -> None:
+        async def resolve_enemy_id() -> None:
             try:
                 enemy_id, block_timer = await _wait_for_enemy_id(
                     bot,
@@ -486,29 +484,19 @@ async def detect_pokemeow_battle(bot: commands.Bot, message: discord.Message):
                     source_channel_id=message.channel.id,
                 )
                 if block_timer:
+                    timer_handle.cancel()
                     debug_log(
                         "Blocked battle-ready timer due to ignored follow-up footer"
                     )
                     return
-
                 enemy_id_holder["id"] = enemy_id
-                elapsed = asyncio.get_running_loop().time() - timer_start
-                remaining = max(0.0, 60 - elapsed)
-                debug_log(
-                    f"Scheduling battle-ready timer with remaining delay={remaining:.2f}s"
-                )
-                battle_ready_tasks[challenger.id] = bot.loop.create_task(
-                    notify_battle_ready(remaining)
-                )
-            except asyncio.CancelledError:
-                debug_log("Battle-ready precheck task cancelled")
             except Exception as e:
                 debug_log(f"Battle-ready precheck error: {e}")
 
-        battle_ready_tasks[challenger.id] = bot.loop.create_task(
-            prepare_and_schedule_battle_ready()
-        )
-        debug_log("Scheduled battle-ready precheck", highlight=True)
+        task = asyncio.create_task(resolve_enemy_id())
+        _followup_tasks.add(task)
+        task.add_done_callback(_followup_tasks.discard)
+        debug_log("Scheduled battle-ready timer", highlight=True)
 
     except Exception as e:
         debug_log(f"Exception in detect_pokemeow_battle: {e}")
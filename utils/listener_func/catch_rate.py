@@ -1,3 +1,5 @@
+from typing import NamedTuple
+
 rarity = ["common", "uncommon", "rare", "superrare", "legendary", "shiny", "golden"]
 
 
@@ -353,80 +355,6 @@ def compute_fishing_rate(
     return max(0, min(100, total_rate))
 
 
-def best_ball_fishing(
-    rarity,
-    state=None,
-    is_patreon=False,
-    channel_boost=False,
-    form=None,
-    display_all: bool = False,
-):
-    from utils.cache.water_state_cache import get_water_state
-
-    if state is None:
-        state = get_water_state()
-    state = state.lower()
-
-    key = rarity
-    if form == "shiny":
-        key = "shiny_0"
-    elif form == "golden":
-        key = "golden_0"
-    else:
-        rarity_map = {
-            "common": "common_45",
-            "uncommon": "uncommon_35",
-            "rare": "rare_25",
-            "superrare": "super_rare_15",
-            "legendary": "legendary_5",
-        }
-        key = rarity_map.get(rarity, rarity)
-
-    ball_priority = [
-        "pokeball",
-        "greatball",
-        "ultraball",
-        "premierball",
-        "beastball",
-        "diveball",
-        "masterball",
-    ]
-
-    actual_results = {}
-    for ball in ball_priority:
-        actual_results[ball] = compute_fishing_rate(
-            key, ball, state=state, is_patreon=is_patreon, channel_boost=channel_boost
-        )
-
-    superrare_and_below = {"common", "uncommon", "rare", "superrare"}
-    filtered_results = {
-        b: r
-        for b, r in actual_results.items()
-        if not (
-            rarity in superrare_and_below
-            and b in {"premierball", "diveball", "masterball"}
-        )
-    }
-
-    max_rate = max(filtered_results.values())
-    for ball in ball_priority:
-        if ball in filtered_results and filtered_results[ball] == max_rate:
-            best = ball
-            break
-
-    # Display string using unlocked emojis
-    all_balls_str = " | ".join(
-        f"{UNLOCKED_BALL_EMOJIS[b]} ({actual_results[b]}%)" for b in ball_priority
-    )
-
-    return (
-        best,
-        filtered_results[best],
-        actual_results,
-        all_balls_str if display_all else None,
-    )
-
-
 def compute_catch_rate(
     category,
     rarity,
@@ -463,27 +391,95 @@ def compute_catch_rate(
     return min(100, base_rate)
 
 
-def best_ball(
-    category,
-    rarity,
-    boost=0,
-    is_patreon=False,
-    channel_boost=False,
-    ultra_beast=False,
-    display_all: bool = False,
-):
-    ball_priority = [
-        "pokeball",
-        "greatball",
-        "ultraball",
-        "premierball",
-        "beastball",
-        "masterball",
+FISHING_BALL_PRIORITY = (
+    "pokeball",
+    "greatball",
+    "ultraball",
+    "premierball",
+    "beastball",
+    "diveball",
+    "masterball",
+)
+FISHING_RARITY_KEYS = {
+    "common": "common_45",
+    "uncommon": "uncommon_35",
+    "rare": "rare_25",
+    "superrare": "super_rare_15",
+    "legendary": "legendary_5",
+}
+FISHING_FORM_KEYS = {"shiny": "shiny_0", "golden": "golden_0"}
+SPAWN_BALL_PRIORITY = (
+    "pokeball",
+    "greatball",
+    "ultraball",
+    "premierball",
+    "beastball",
+    "masterball",
+)
+MAX_PRECOMPUTED_BOOST = 100  # any boost ≥ this caps every ball at 100%
+
+
+class BallReco(NamedTuple):
+    """One precomputed recommendation with its message fragments pre-rendered."""
+
+    ball: str
+    rate: int
+    rates: tuple[int, ...]  # in the matching *_BALL_PRIORITY order
+    best_str: str  # "<ball emoji> (rate%)"
+    all_balls_str: str  # "<emoji> (rate%) | <emoji> (rate%) | ..."
+
+    def fragment(self, display_all: bool) -> str:
+        return self.all_balls_str if display_all else self.best_str
+
+
+def _make_reco(ball_priority, allowed_balls, rates: tuple[int, ...]) -> BallReco:
+    """Picks the first allowed ball with the highest rate and renders the fragments."""
+    by_ball = dict(zip(ball_priority, rates))
+    max_rate = max(by_ball[ball] for ball in allowed_balls)
+    best = next(ball for ball in allowed_balls if by_ball[ball] == max_rate)
+    return BallReco(
+        ball=best,
+        rate=by_ball[best],
+        rates=rates,
+        best_str=f"{ball_emojis.get(best, '')} ({by_ball[best]}%)",
+        all_balls_str=" | ".join(
+            f"{UNLOCKED_BALL_EMOJIS[b]} ({r}%)" for b, r in zip(ball_priority, rates)
+        ),
+    )
+
+
+def _fishing_key(rarity, form=None):
+    return FISHING_FORM_KEYS.get(form) or FISHING_RARITY_KEYS.get(rarity, rarity)
+
+
+def _compute_best_ball_fishing(
+    rarity, state=None, is_patreon=False, channel_boost=False, form=None
+) -> BallReco:
+    key = _fishing_key(rarity, form)
+    rates = tuple(
+        compute_fishing_rate(
+            key, ball, state=state, is_patreon=is_patreon, channel_boost=channel_boost
+        )
+        for ball in FISHING_BALL_PRIORITY
+    )
+
+    superrare_and_below = {"common", "uncommon", "rare", "superrare"}
+    allowed_balls = [
+        ball
+        for ball in FISHING_BALL_PRIORITY
+        if not (
+            rarity in superrare_and_below
+            and ball in {"premierball", "diveball", "masterball"}
+        )
     ]
-    results = {}
+    return _make_reco(FISHING_BALL_PRIORITY, allowed_balls, rates)
+
 
-    for ball in ball_priority:
-        results[ball] = compute_catch_rate(
+def _compute_best_ball(
+    category, rarity, boost=0, is_patreon=False, channel_boost=False, ultra_beast=False
+) -> BallReco:
+    rates = tuple(
+        compute_catch_rate(
             category,
             rarity,
             ball,
@@ -492,9 +488,11 @@ def best_ball(
             channel_boost=channel_boost,
             ultra_beast=ultra_beast,
         )
+        for ball in SPAWN_BALL_PRIORITY
+    )
 
     # Determine allowed balls
-    allowed_balls = ball_priority.copy()
+    allowed_balls = list(SPAWN_BALL_PRIORITY)
     if rarity not in ["full_odds_shiny_64", "event_shiny_0"]:
         allowed_balls = [b for b in allowed_balls if b != "masterball"]
     if rarity not in [
@@ -505,15 +503,115 @@ def best_ball(
     ]:
         allowed_balls = [b for b in allowed_balls if b != "premierball"]
 
-    max_rate = max(results[ball] for ball in allowed_balls)
-    for ball in allowed_balls:
-        if results[ball] == max_rate:
-            best = ball
-            break
+    return _make_reco(SPAWN_BALL_PRIORITY, allowed_balls, rates)
+
+
+# 💠────────────────────────────────────────────
+#   Precomputed lookup tables (built once at import)
+# ─────────────────────────────────────────────
+# Every input of a recommendation comes from a small finite grid, so each
+# answer is computed here once and a recommendation is a single indexed read.
+# is_patreon is not a dimension of the spawn table: compute_catch_rate
+# does not apply the Patreon bonus to spawns.
+
+# (category, rarity_key, channel_boost) → [BallReco for boost 0..MAX_PRECOMPUTED_BOOST]
+SPAWN_RECO_TABLE: dict[tuple[str, str, bool], list[BallReco]] = {
+    (category, rarity_key, channel_boost): [
+        _compute_best_ball(category, rarity_key, boost, channel_boost=channel_boost)
+        for boost in range(MAX_PRECOMPUTED_BOOST + 1)
+    ]
+    for category, rarity_keys in catch_rates.items()
+    for rarity_key in rarity_keys
+    for channel_boost in (False, True)
+}
+
+# (rarity, form, state, is_patreon, channel_boost) → BallReco
+FISHING_RECO_TABLE: dict[tuple, BallReco] = {
+    (rarity, form, state, is_patreon, channel_boost): _compute_best_ball_fishing(
+        rarity, state, is_patreon, channel_boost, form
+    )
+    for rarity in FISHING_RARITY_KEYS
+    for form in (None, *FISHING_FORM_KEYS)
+    for state in (None, *fishing_catch_rates["states"])
+    for is_patreon in (False, True)
+    for channel_boost in (False, True)
+}
+
 
-    # Display string using unlocked emojis
-    all_balls_str = " | ".join(
-        f"{UNLOCKED_BALL_EMOJIS[b]} ({results[b]}%)" for b in ball_priority
+def lookup_best_ball(
+    category, rarity, boost=0, is_patreon=False, channel_boost=False
+) -> BallReco:
+    """Precomputed best_ball; falls back to computing for boosts outside the grid."""
+    row = SPAWN_RECO_TABLE.get((category, rarity, bool(channel_boost)))
+    if row is not None and 0 <= boost:
+        return row[min(boost, MAX_PRECOMPUTED_BOOST)]
+    return _compute_best_ball(
+        category, rarity, boost, is_patreon=is_patreon, channel_boost=channel_boost
     )
 
-    return best, results[best], results, all_balls_str if display_all else None
+
+def lookup_best_ball_fishing(
+    rarity, state=None, is_patreon=False, channel_boost=False, form=None
+) -> BallReco:
+    """Precomputed best_ball_fishing; `state=None` reads the cached water state."""
+    if state is None:
+        from utils.cache.water_state_cache import get_water_state
+
+        state = get_water_state()
+    state = state.lower() if state else None
+
+    reco = FISHING_RECO_TABLE.get(
+        (rarity, form, state, bool(is_patreon), bool(channel_boost))
+    )
+    if reco is not None:
+        return reco
+    return _compute_best_ball_fishing(rarity, state, is_patreon, channel_boost, form)
+
+
+def best_ball_fishing(
+    rarity,
+    state=None,
+    is_patreon=False,
+    channel_boost=False,
+    form=None,
+    display_all: bool = False,
+):
+    reco = lookup_best_ball_fishing(
+        rarity,
+        state=state,
+        is_patreon=is_patreon,
+        channel_boost=channel_boost,
+        form=form,
+    )
+    actual_results = dict(zip(FISHING_BALL_PRIORITY, reco.rates))
+    return (
+        reco.ball,
+        reco.rate,
+        actual_results,
+        reco.all_balls_str if display_all else None,
+    )
+
+
+def best_ball(
+    category,
+    rarity,
+    boost=0,
+    is_patreon=False,
+    channel_boost=False,
+    ultra_beast=False,
+    display_all: bool = False,
+):
+    if ultra_beast:
+        reco = _compute_best_ball(
+            category, rarity, boost, is_patreon, channel_boost, ultra_beast=True
+        )
+    else:
+        reco = lookup_best_ball(
+            category,
+            rarity,
+            boost=boost,
+            is_patreon=is_patreon,
+            channel_boost=channel_boost,
+        )
+    results = dict(zip(SPAWN_BALL_PRIORITY, reco.rates))
+    return reco.ball, reco.rate, results, reco.all_balls_str if display_all else None
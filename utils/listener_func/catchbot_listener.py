@@ -296,10 +296,15 @@ async def extract_and_save_catchbot_schedule(
 
         # 📝 Update reminders JSON in DB
         updates = {"catchbot.returns_on": timestamp}
+        removals = []
         if reminds_next_on:
             updates["catchbot.reminds_next_on"] = reminds_next_on
+        else:
+            removals.append("catchbot.reminds_next_on")
 
-        await update_user_reminders_fields(bot, user.id, user.name, updates=updates)
+        await update_user_reminders_fields(
+            bot, user.id, user.name, updates=updates, removals=removals
+        )
 
         pretty_log(
             "info",
@@ -5,6 +5,7 @@ import discord
 from config.aesthetic import *
 from config.current_setup import STRAYMONS_GUILD_ID
 from utils.database.weekly_goal_tracker_db_func import upsert_weekly_goal
+from utils.essentials.message_dedupe import MessageDedupe
 from utils.essentials.pokemeow_helpers import get_pokemeow_reply_member
 from utils.listener_func.pokemon_caught import weekly_goal_checker
 from utils.loggers.debug_log import debug_log, enable_debug
@@ -12,7 +13,9 @@ from utils.loggers.pretty_logs import pretty_log
 
 # Enable debug for this function
 # enable_debug(f"{__name__}.explore_caught_listener")
-processed_explore_caught_messages = set()
+processed_explore_caught_messages = MessageDedupe(
+    "processed_explore_caught_messages"
+)
 
 
 # 💠────────────────────────────────────────────
@@ -7,6 +7,7 @@ from utils.cache.daily_fa_ball_cache import daily_faction_ball_cache
 from utils.cache.faction_ball_alert_cache import faction_ball_alert_cache
 from utils.cache.straymon_member_cache import straymon_member_cache
 from utils.database.daily_fa_ball import update_faction_ball
+from utils.essentials.get_pg_pool import register_query
 from utils.essentials.pokemeow_helpers import get_pokemeow_reply_member
 from utils.loggers.debug_log import debug_log, enable_debug
 from utils.loggers.pretty_logs import pretty_log
@@ -14,6 +15,12 @@ from utils.loggers.pretty_logs import pretty_log
 #enable_debug(f"{__name__}.extract_faction_ball_from_daily")
 STRAYMONS_GUILD_ID = 1047856017121214555
 
+UPDATE_MEMBER_FACTION = register_query(
+    "straymons_members.update_faction",
+    "UPDATE straymons_members SET faction = $1 WHERE user_id = $2",
+    timeout=5.0,
+)
+
 
 async def update_faction(bot: discord.Client, user_id: int, faction: str | None):
     """
@@ -23,13 +30,11 @@ async def update_faction(bot: discord.Client, user_id: int, faction: str | None)
     guild = bot.get_guild(STRAYMONS_GUILD_ID)
     user = guild.get_member(user_id)
     user_display = user if user else "Unknown Member"
-    query = "UPDATE straymons_members SET faction = $1 WHERE user_id = $2"
-    async with bot.pg_pool.acquire() as conn:
-        await conn.execute(query, faction, user_id)
-        pretty_log(
-            "success",
-            f"Updated faction for user {user_id} ({user_display}) to '{faction}'",
-        )
+    await bot.pg_pool.run(UPDATE_MEMBER_FACTION, faction, user_id)
+    pretty_log(
+        "success",
+        f"Updated faction for user {user_id} ({user_display}) to '{faction}'",
+    )
 
 
 # 🛡️────────────────────────────────────────────
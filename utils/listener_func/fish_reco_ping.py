@@ -10,8 +10,10 @@ from utils.cache.daily_fa_ball_cache import daily_faction_ball_cache
 from utils.cache.faction_ball_alert_cache import faction_ball_alert_cache
 from utils.cache.straymon_member_cache import straymon_member_cache
 from utils.cache.water_state_cache import get_water_state, update_water_state
+from utils.essentials.message_dedupe import MessageDedupe
+from utils.essentials.send_queue import queue_send
 from utils.listener_func.catch_rate import *
-from utils.listener_func.catch_rate import ball_emojis, best_ball_fishing, rarity_emojis
+from utils.listener_func.catch_rate import lookup_best_ball_fishing, rarity_emojis
 from utils.loggers.debug_log import debug_log, enable_debug
 from utils.loggers.pretty_logs import pretty_log
 
@@ -21,7 +23,7 @@ from utils.loggers.pretty_logs import pretty_log
 
 DEBUG = False
 FISHING_COLOR = 0x87CEFA  # sky blue
-processed_fishing_messages = set()
+processed_fishing_messages = MessageDedupe("processed_fishing_messages")
 NAME_PATTERN = re.compile(r"\*\*(?:(Shiny|Golden)\s+)?([A-Za-z_]+)\*\*", re.IGNORECASE)
 
 WILD_SPAWN_PATTERN = re.compile(
@@ -207,14 +209,14 @@ async def recommend_fishing_ball(message: discord.Message, bot):
         display_mode = user_settings.get("fishing", {}).get("display_mode", "Best Ball")
         display_all = display_mode.strip().lower() == "all balls"
 
-        ball, rate, all_rates, all_balls_str = best_ball_fishing(
+        reco = lookup_best_ball_fishing(
             rarity=rarity,
             state=water_state,
             is_patreon=is_patreon,
             form=form.lower() if form else None,
             channel_boost=channel_boost,
-            display_all=display_all,
         )
+        ball, rate = reco.ball, reco.rate
 
         # --- Build display ---
         rarity_label = (
@@ -224,13 +226,9 @@ async def recommend_fishing_ball(message: discord.Message, bot):
         )
         rarity_emoji = rarity_emojis.get(rarity_label.lower(), "")
 
-        if display_all and all_balls_str:
-            msg = f"{Emojis.fish_spawn} **{user_settings['user_name']}** {rarity_emoji} → {all_balls_str}"
-        else:
-            ball_emoji = ball_emojis.get(ball, "")
-            msg = f"{Emojis.fish_spawn} **{user_settings['user_name']}** {rarity_emoji} → {ball_emoji} ({rate}%)"
+        msg = f"{Emojis.fish_spawn} **{user_settings['user_name']}** {rarity_emoji} → {reco.fragment(display_all)}"
 
-        await message.channel.send(msg)
+        queue_send(message.channel, msg)
         debug_log(f"Sent recommendation: {msg}")
 
         return {
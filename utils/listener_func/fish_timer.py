@@ -1,4 +1,3 @@
-import asyncio
 import re
 from datetime import datetime
 
@@ -7,14 +6,14 @@ from discord.ext import commands
 
 from config.aesthetic import Emojis
 from config.current_setup import POKEMEOW_APPLICATION_ID
+from utils.background_task.timer_wheel import timer_wheel
 from utils.essentials.pokemeow_helpers import get_pokemeow_reply_member
-from utils.essentials.retry_function import _retry_discord_call
+from utils.essentials.send_queue import PRIORITY, queue_send
 from utils.loggers.pretty_logs import pretty_log
 
 FISH_TIMER = 25
 
-# 🗂 Track scheduled "command ready" tasks to avoid duplicates
-fish_ready_tasks = {}
+FISH_READY = "fish_ready"  # timer wheel key: (member_id, FISH_READY)
 
 
 def extract_fishing_trainer_name(description: str) -> str | None:
@@ -76,45 +75,19 @@ async def fish_timer_handler(message: discord.Message):
         if setting == "off":
             return
 
-        # Cancel previous ready task if any
-        if member.id in fish_ready_tasks and not fish_ready_tasks[member.id].done():
-            fish_ready_tasks[member.id].cancel()
-
-        # Schedule behavior depending on setting
-        async def notify_ready():
-            # 💜────────────────────────────────────────────
-            #   Fish Timer Notification Task
-            # 💜────────────────────────────────────────────
-            try:
-                await asyncio.sleep(FISH_TIMER)
-
-                if setting == "on":
-                    content = f"{Emojis.fish_spawn} {member.mention}, your </fish spawn:1015311084812501026> command is ready! "
-                elif setting == "on_no_pings":
-                    content = f"{Emojis.fish_spawn} **{member.name}**, your </fish spawn:1015311084812501026> command is ready!"
-                else:
-                    return
-
-                await _retry_discord_call(message.channel.send, content)
-
-            except asyncio.CancelledError:
-                # 💙 [CANCELLED] Scheduled ready notification cancelled
-                pretty_log(
-                    tag="info",
-                    message=f"Cancelled scheduled ready notification for {member}",
-                )
-            except Exception as e:
-                # 💜 [MISSED] Timer ran correctly but message failed
-                # Trackable: include member ID and username
-                pretty_log(
-                    tag="error",
-                    message=(
-                        f"Missed Pokemon timer notification for {member} "
-                        f"(ID: {member.id}). Timer ran correctly but message failed: {e}"
-                    ),
-                )
-
-        fish_ready_tasks[member.id] = asyncio.create_task(notify_ready())
+        if setting == "on":
+            content = f"{Emojis.fish_spawn} {member.mention}, your </fish spawn:1015311084812501026> command is ready! "
+        elif setting == "on_no_pings":
+            content = f"{Emojis.fish_spawn} **{member.name}**, your </fish spawn:1015311084812501026> command is ready!"
+        else:
+            return
+
+        # 💠 Replaces any pending fish timer of this member
+        timer_wheel.schedule(
+            (member.id, FISH_READY),
+            FISH_TIMER,
+            lambda: queue_send(message.channel, content, priority=PRIORITY),
+        )
 
     except Exception as e:
         pretty_log(
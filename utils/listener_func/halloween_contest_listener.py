@@ -5,10 +5,13 @@ import discord
 from utils.cache.halloween_con_top_cache import halloween_con_top_cache
 from utils.cache.halloween_contest_cache import halloween_contests_alert_cache
 from utils.database.hallowen_contest_top_db import upsert_halloween_con_top
+from utils.essentials.message_dedupe import MessageDedupe
 from utils.essentials.pokemeow_helpers import get_pokemeow_reply_member
 from utils.loggers.pretty_logs import pretty_log
 
-processed_halloween_score_message_ids = set()
+processed_halloween_score_message_ids = MessageDedupe(
+    "processed_halloween_score_message_ids", ttl_seconds=24 * 3600
+)
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
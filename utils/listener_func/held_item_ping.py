@@ -4,29 +4,47 @@ import discord
 from discord.ext import commands
 
 from group_func.toggle.held_item.held_item_ping_helpers import held_item_message
-from utils.essentials.pokemeow_helpers import get_pokemeow_reply_member
+from utils.essentials.parsed_message import ParsedPokeMeowMessage
+from utils.essentials.send_queue import queue_send
 from utils.loggers.debug_log import debug_log, enable_debug
 
 #enable_debug(f"{__name__}.held_item_ping_handler")
-
-
-async def held_item_ping_handler(bot: commands.Bot, message: discord.Message):
+HELD_ITEM_SPAWN_PATTERN = re.compile(
+    r"(?:<:[^:]+:\d+>\s*)?"  # optional leading NPC emoji
+    r"\*\*.+?\*\*\s*found a wild\s*"
+    r"(?P<teamlogo><:team_logo:\d+>)?\s*"  # optional team logo emoji
+    r"(?P<held><:held_item:\d+>)?\s*"  # optional held item emoji
+    r"(?:<:[^:]+:\d+>\s*)+"  # Pokemon emoji (+ optional dexCaught)
+    r"\*\*(?P<pokemon>[A-Za-z_-]+)\*\*"  # pokemon name (allow hyphens)
+)
+
+
+async def held_item_ping_handler(
+    bot: commands.Bot,
+    message: discord.Message,
+    parsed: ParsedPokeMeowMessage | None = None,
+):
     """
     Scan message embeds for Pokemon spawns.
     Logs all Pokemon, but only pings if spawn has a held item AND user is subscribed.
     """
     from utils.cache.held_item_cache import held_item_cache
 
-    target_user = await get_pokemeow_reply_member(message)
+    if parsed is None:
+        parsed = ParsedPokeMeowMessage(message)
+    if not parsed.has_held_item:
+        debug_log("Skipped: spawn has no held item")
+        return
+
+    target_user = parsed.reply_member
     if not target_user:
         debug_log(
             "Message is not a reply to a PokéMeow message or failed to fetch user from reply."
         )
-        trainer_match = re.search(r"\*\*(.+?)\*\* found a wild", message.content)
-        if not trainer_match:
-            debug_log("No username match found in message content.")
+        trainer_name = parsed.trainer_name
+        if not trainer_name:
+            debug_log("No username match found in message.")
             return
-        trainer_name = trainer_match.group(1).strip()
 
         # If we got a trainer name from the embed, we can try to find the user ID from the name
         from utils.cache.straymon_member_cache import get_user_id_by_name
@@ -34,23 +52,25 @@ async def held_item_ping_handler(bot: commands.Bot, message: discord.Message):
         target_user_id = get_user_id_by_name(trainer_name)
         if not target_user_id:
             debug_log(
-                f"Skipped: could not find user ID for trainer name '{trainer_name}' extracted from embed author"
+                "Skipped: could not find user ID for trainer name '%s' extracted from embed author",
+                trainer_name,
             )
             return
         target_user = await bot.fetch_user(target_user_id)
         if not target_user:
             debug_log(
-                f"Skipped: could not fetch user with ID {target_user_id} extracted from embed author"
+                "Skipped: could not fetch user with ID %s extracted from embed author",
+                target_user_id,
             )
             return
 
     # ✅ Skip if user is not in held_item_cache
     if target_user.id not in held_item_cache:
-        debug_log(f"User {target_user.id} not in held_item_cache, skipping")
+        debug_log("User %s not in held_item_cache, skipping", target_user.id)
         return
 
     user_sub = held_item_cache[target_user.id]
-    debug_log(f"Target user: {target_user.id}")
+    debug_log("Target user: %s", target_user.id)
 
     user_sub = held_item_cache.get(target_user.id, {})
 
@@ -61,25 +81,21 @@ async def held_item_ping_handler(bot: commands.Bot, message: discord.Message):
     for embed in message.embeds:
         desc = embed.description or ""
 
-        debug_log(f"Embed description raw: {repr(desc)}")
+        debug_log("Embed description raw: %r", desc)
 
         # Regex: extract optional held item and Pokemon name
-        pattern = (
-            r"(?:<:[^:]+:\d+>\s*)?"  # optional leading NPC emoji
-            r"\*\*.+?\*\*\s*found a wild\s*"
-            r"(?P<teamlogo><:team_logo:\d+>)?\s*"  # optional team logo emoji
-            r"(?P<held><:held_item:\d+>)?\s*"  # optional held item emoji
-            r"(?:<:[^:]+:\d+>\s*)+"  # Pokemon emoji (+ optional dexCaught)
-            r"\*\*(?P<pokemon>[A-Za-z_-]+)\*\*"  # pokemon name (allow hyphens)
-        )
-        matches = re.finditer(pattern, desc)
+        matches = HELD_ITEM_SPAWN_PATTERN.finditer(desc)
 
         for match in matches:
             pokemon_name = match.group("pokemon").lower()
             has_held_item = bool(match.group("held"))
 
             # Log every Pokemon
-            debug_log(f"Detected Pokemon: {pokemon_name}, Held item? {has_held_item}")
+            debug_log(
+                "Detected Pokemon: %s, Held item? %s",
+                pokemon_name,
+                has_held_item,
+            )
 
             # Only ping if the spawn actually has a held item
             if not has_held_item:
@@ -88,12 +104,12 @@ async def held_item_ping_handler(bot: commands.Bot, message: discord.Message):
             msg = held_item_message(pokemon_name, user_sub)
             if not msg:
                 debug_log(
-                    f"User {target_user.id} not subscribed for {pokemon_name}'s items"
+                    "User %s not subscribed for %s's items",
+                    target_user.id,
+                    pokemon_name,
                 )
                 continue
 
-            try:
-                await message.channel.send(f"<@{target_user.id}> {msg}")
-                debug_log(f"Pinged {target_user.id} for {pokemon_name}")
-            except Exception as e:
-                debug_log(f"Failed to ping {target_user.id} for {pokemon_name}: {e}")
+            # 💠 Pings for the same spawn are merged into one message by the queue
+            queue_send(message.channel, f"<@{target_user.id}> {msg}")
+            debug_log("Queued ping for %s for %s", target_user.id, pokemon_name)
@@ -7,14 +7,16 @@ from config.faction_data import get_faction_by_emoji
 from utils.cache.daily_fa_ball_cache import daily_faction_ball_cache
 from utils.cache.faction_ball_alert_cache import faction_ball_alert_cache
 from utils.cache.straymon_member_cache import straymon_member_cache
+from utils.essentials.message_dedupe import MessageDedupe
 from utils.essentials.pokemeow_helpers import get_pokemeow_reply_member
+from utils.essentials.send_queue import queue_reaction, queue_send
 from utils.loggers.debug_log import debug_log, enable_debug
 from utils.loggers.pretty_logs import pretty_log
 from utils.listener_func.ball_reco_ping import extract_trainer_name_from_description
 
 # enable_debug(f"{__name__}.faction_ball_alert")
 FISHING_COLOR = 0x87CEFA
-processed_faction_ball_alerts = set()
+processed_faction_ball_alerts = MessageDedupe("processed_faction_ball_alerts")
 
 
 # 🛡️────────────────────────────────────────────
@@ -190,7 +192,7 @@ async def new_faction_ball_alert_message(member:discord.Member, after: discord.M
         debug_log(f"Faction daily ball: {faction_ball}")
         if not faction_ball:
             content = f"{user_mention} I don't know your faction's daily ball yet, can you do `;fa`? Thanks!."
-            await after.channel.send(content=content)
+            queue_send(after.channel, content)
             pretty_log(
                 "info",
                 f"Could not send faction ball alert to {user_name} ({user_id}) for {embed_faction} daily ball because their faction {user_faction} has no daily ball set.",
@@ -205,7 +207,7 @@ async def new_faction_ball_alert_message(member:discord.Member, after: discord.M
         if ball_emoji:
             if user_faction_ball_notify == "on":
                 content = f"<@{user_id}>, This Pokemon is a daily {display_embed_faction} hunt! Use {ball_emoji}!"
-                await after.channel.send(content)
+                queue_send(after.channel, content)
                 pretty_log(
                     "sent",
                     f"Sent faction ball alert to {user_name} ({user_id}) for {embed_faction} daily ball {faction_ball}",
@@ -213,19 +215,15 @@ async def new_faction_ball_alert_message(member:discord.Member, after: discord.M
                 debug_log("Sent faction ball alert with ping")
             elif user_faction_ball_notify == "on_no_pings":
                 content = f"{user_name}, This Pokemon is a daily {display_embed_faction} hunt! Use {ball_emoji}!"
-                await after.channel.send(content)
+                queue_send(after.channel, content)
                 pretty_log(
                     "sent",
                     f"Sent faction ball alert (no ping) to {user_name} ({user_id}) for {embed_faction} daily ball {faction_ball}",
                 )
                 debug_log("Sent faction ball alert without ping")
             elif user_faction_ball_notify == "react":
-                try:
-                    await after.add_reaction(ball_emoji)
-                    debug_log("Added ball emoji reaction")
-                except Exception as e:
-                    pretty_log("error", f"Failed to add reaction {ball_emoji}: {e}")
-                    debug_log(f"Failed to add reaction: {e}")
+                queue_reaction(after, ball_emoji)
+                debug_log("Queued ball emoji reaction")
         else:
             debug_log("No ball emoji found for daily ball, nothing sent")
 
@@ -14,12 +14,13 @@ from utils.database.probation_members_db import (
     upsert_probation_member,
 )
 from utils.database.weekly_goal_tracker_db_func import upsert_weekly_goal
-from utils.essentials.pokemeow_helpers import get_pokemeow_reply_member
+from utils.essentials.message_dedupe import MessageDedupe
+from utils.essentials.parsed_message import ParsedPokeMeowMessage
+from utils.essentials.send_queue import queue_send
 from utils.essentials.webhook import send_webhook
 from utils.loggers.pretty_logs import pretty_log
 
-FISHING_COLOR = 0x87CEFA
-processed_caught_messages = set()
+processed_caught_messages = MessageDedupe("processed_caught_messages")
 
 
 def is_saturday_1155pm_est():
@@ -136,7 +137,8 @@ async def weekly_goal_checker(
                 await member.add_roles(
                     weekly_angler_role, reason="Reached 500 fish caught in Weekly Goal"
                 )
-            await channel.send(
+            queue_send(
+                channel,
                 f"Congratulations {member.display_name}! You've reached the weekly angler goal of catching 500 fish! 🎉 We are also giving you the role of Weekly Angler"
             )
             pretty_log(
@@ -151,7 +153,8 @@ async def weekly_goal_checker(
             top_line_catches and top_line_catches >= 175
         ):
             update_weekly_requirement_mark(member.id, True)
-            await channel.send(
+            queue_send(
+                channel,
                 f"Congratulations {member.display_name}! You've reached the weekly requirement goal of catching 175 Pokémon! 🎉\nDouble-check your stats by running `;clan stats w` and finding your name."
             )
             if goal_tracker_channel:
@@ -180,7 +183,8 @@ async def weekly_goal_checker(
                     weekly_grinder_role,
                     reason="Reached 2000 Pokémon caught in Weekly Goal",
                 )
-            await channel.send(
+            queue_send(
+                channel,
                 f"🎉 Wow {member.display_name}! You've caught over 2000 Pokémon this week and earned the **Weekly Grinder** role!\n\nCheck /active-giveaways for any current Weekly Grinder giveaways."
             )
             pretty_log(
@@ -207,7 +211,8 @@ async def weekly_goal_checker(
     # Check if they have reached Weekly Guardian
     if battles_won >= 300 and not weekly_guardian_mark:
         update_weekly_guardian_mark(member.id, True)
-        await channel.send(
+        queue_send(
+            channel,
             f"🏆 **{member.display_name}** has reached **300 Battles Won** this week, You have earned the **Weekly Guardian** role!"
         )
         weekly_guardian_role = guild.get_role(STRAYMONS__ROLES.weekly_guardian)
@@ -247,7 +252,10 @@ def extract_member_username_from_embed(embed: discord.Embed) -> str | None:
 #           👂 Pokemon Caught Listener Event
 # 💠────────────────────────────────────────────
 async def pokemon_caught_listener(
-    bot: discord.Client, before_message: discord.Message, message: discord.Message
+    bot: discord.Client,
+    before_message: discord.Message,
+    message: discord.Message,
+    parsed: ParsedPokeMeowMessage | None = None,
 ):
     from utils.cache.res_fossil_cache import res_fossils_alert_cache
     from utils.cache.straymon_member_cache import (
@@ -266,8 +274,10 @@ async def pokemon_caught_listener(
         return
 
     embed = message.embeds[0]
+    if parsed is None:
+        parsed = ParsedPokeMeowMessage(message, before_message)
 
-    member = await get_pokemeow_reply_member(before_message)
+    member = parsed.reply_member
     if not member:
         # Fall back to username extraction from embed
         username = extract_member_username_from_embed(embed)
@@ -310,8 +320,7 @@ async def pokemon_caught_listener(
             bot=bot,
         )
 
-    embed_color = embed.color.value if embed.color else None
-    embed_description = embed.description or ""
+    embed_description = parsed.description
 
     # Prevent double processing
     if message.id in processed_caught_messages:
@@ -319,7 +328,7 @@ async def pokemon_caught_listener(
     processed_caught_messages.add(message.id)
 
     # Fish catch
-    if embed_color == FISHING_COLOR:
+    if parsed.is_fishing:
         increment_fish_caught(member)
         mark_weekly_goal_dirty(member.id)
 
@@ -349,7 +358,8 @@ async def pokemon_caught_listener(
 
         if notify == "on":
             embed_msg = discord.Embed(description=";res ex plume_fossil")
-            await message.channel.send(
+            queue_send(
+                message.channel,
                 f"{member.mention} Oh a plume fossil! Don't forget to do the command",
                 embed=embed_msg,
             )
@@ -9,12 +9,13 @@ from utils.cache.daily_fa_ball_cache import daily_faction_ball_cache
 from utils.cache.faction_ball_alert_cache import faction_ball_alert_cache
 from utils.cache.straymon_member_cache import straymon_member_cache
 from utils.cache.water_state_cache import get_water_state, update_water_state
+from utils.essentials.message_dedupe import MessageDedupe
 from utils.essentials.pokemeow_helpers import get_pokemeow_reply_member
 from utils.listener_func.catch_rate import *
 from utils.loggers.debug_log import debug_log, enable_debug
 from utils.loggers.pretty_logs import pretty_log
 
-processed_pokemon_spawns = set()
+processed_pokemon_spawns = MessageDedupe("processed_pokemon_spawns")
 FISHING_COLOR = 0x87CEFA  # sky blue
 HALLOWEEN_COLOR = 0xFFA500  # orange
 EVENT_EXCL_COLOR = 0xEA260B  # red
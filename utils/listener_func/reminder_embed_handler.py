@@ -8,6 +8,7 @@ from group_func.toggle.reminders.reminders_sched_db_func import (
     update_catchbot_reminds_next_on,
 )
 from utils.cache.reminders_cache import user_reminders_cache
+from utils.database.channel_db_func import get_registered_personal_channel
 from utils.loggers.pretty_logs import pretty_log
 
 CC_BOT_LOG_ID = 1413576563559239931
@@ -15,21 +16,6 @@ WOOPER_ID = 1388515441592504483
 TIMESTAMP_REGEX = re.compile(r"<t:(\d+):f>")
 
 
-# 🍭 Get a registered personal channel
-async def get_registered_personal_channel(
-    bot: discord.Client, user_id: int
-) -> int | None:
-    try:
-        async with bot.pg_pool.acquire() as conn:
-            row = await conn.fetchrow(
-                "SELECT channel_id FROM personal_channels WHERE user_id = $1", user_id
-            )
-            return row["channel_id"] if row else None
-    except Exception as e:
-        pretty_log("warn", f"Failed to fetch personal channel for user {user_id}: {e}")
-        return None
-
-
 async def handle_reminder_embed(bot: discord.Client, message: discord.Message):
     """
     Reads embeds sent by Wooper in CC_BOT_LOG_ID,
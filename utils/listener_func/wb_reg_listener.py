@@ -1,18 +1,14 @@
-import asyncio
 import re
 import time
 
 import discord
 
 from config.aesthetic import Emojis
-from config.current_setup import MINCCINO_COLOR
 from config.straymons_constants import STRAYMONS__TEXT_CHANNELS
+from utils.background_task.due_scheduler import WORLD_BOSS, schedule_due
 from utils.database.channel_db_func import get_registered_personal_channel
 from utils.database.wb_fight_db import (
-    fetch_due_wb_battle_reminders,
     fetch_wb_battle_reminder,
-    remove_user_wb_battle_alert,
-    remove_wb_reminder,
     upsert_wb_battle_reminder,
 )
 from utils.essentials.pokemeow_helpers import get_pokemeow_reply_member
@@ -21,10 +17,7 @@ from utils.loggers.pretty_logs import pretty_log
 
 # enable_debug(f"{__name__}.handle_wb_register_command")
 """enable_debug(f"{__name__}.register_wb_battle_reminder")
-enable_debug(f"{__name__}.world_boss_waiter")
 enable_debug(f"{__name__}.start_world_boss_task")"""
-# Structure: {boss_name: {"time": unix_seconds, "users": set(user_ids), "task": asyncio.Task, "channels": {user_id: channel}}}
-wb_tasks = {}
 
 
 def extract_wb_unix_seconds(description: str) -> int | None:
@@ -87,54 +80,6 @@ def extract_boss_and_timestamp(embed_description: str) -> tuple[str | None, int
     return boss_name, unix_timestamp
 
 
-async def world_boss_waiter(bot, unix_seconds, wb_name):
-    debug_log(f"world_boss_waiter: Started for boss {wb_name}")
-    now = int(time.time())
-    seconds_until_fight = unix_seconds - now
-    if seconds_until_fight <= 0:
-        debug_log(
-            f"world_boss_waiter: seconds_until_fight <= 0 (unix_seconds={unix_seconds}, now={now}). No wait or notification needed."
-        )
-        return
-    try:
-        await asyncio.sleep(seconds_until_fight)
-    except Exception as e:
-        debug_log(
-            f"world_boss_waiter: Failed during asyncio.sleep for boss {wb_name}: {e}"
-        )
-        return
-    # Notify all users registered for this boss
-    task_info = wb_tasks.get(wb_name)
-    if not task_info:
-        debug_log(
-            f"world_boss_waiter: No task info found for boss {wb_name} at notification time."
-        )
-        return
-    for user_id in list(task_info["users"]):
-        channel = task_info["channels"].get(user_id)
-        user = bot.get_user(user_id)
-        if not channel or not user:
-            debug_log(
-                f"world_boss_waiter: Channel or user not found for user_id {user_id} and boss {wb_name}"
-            )
-            continue
-
-        display_wb_name = format_display_boss_name(wb_name)
-        content = f"{user.mention}, You can now join the World Boss Battle for **{display_wb_name}**!"
-        embed = discord.Embed(description=";wb f", color=MINCCINO_COLOR)
-        try:
-            await channel.send(content=content, embed=embed)
-            debug_log(
-                f"world_boss_waiter: Notification sent to {user.name} in channel {channel.id} for boss {wb_name}"
-            )
-        except Exception as e:
-            debug_log(
-                f"world_boss_waiter: Failed to send notification to {user_id} in channel {getattr(channel, 'id', None)}: {e}"
-            )
-    # Clean up after notification
-    wb_tasks.pop(wb_name, None)
-
-
 async def start_world_boss_task(
     bot: discord.Client,
     unix_seconds,
@@ -143,56 +88,40 @@ async def start_world_boss_task(
     wb_name: str,
     message: discord.Message,
 ):
-    # Add user to the boss task, or create a new one if not present
+    """
+    Stores the user's reminder for this boss and queues the fight time with
+    the due scheduler. Every user of the same boss shares that one due time;
+    check_wb_battle_reminders pings them all when it comes, and the rows
+    re-arm the scheduler after a restart.
+    """
     user_id = user.id
-    if wb_name in wb_tasks:
-        task_info = wb_tasks[wb_name]
-        # If user_id is already registered for this boss, do nothing
-        if user_id in task_info["users"]:
-            debug_log(
-                f"start_world_boss_task: User ID {user_id} already registered for boss {wb_name}, skipping."
-            )
-            pretty_log(
-                "info",
-                f"User ID {user_id} already registered for world boss reminder for {wb_name}.",
-            )
-            return
-        # If the time is different, update if later, else ignore
-        if unix_seconds > task_info["time"]:
-            task_info["time"] = unix_seconds
-        task_info["users"].add(user_id)
-        task_info["channels"][user_id] = channel
+    existing = await fetch_wb_battle_reminder(bot, user_id, wb_name)
+    if existing and existing["remind_on"] == unix_seconds:
         debug_log(
-            f"start_world_boss_task: Added user ID {user_id} to existing boss task for {wb_name}"
+            f"start_world_boss_task: User ID {user_id} already registered for boss {wb_name}, skipping."
         )
         pretty_log(
             "info",
-            f"Added user ID {user_id} to existing world boss reminder for {wb_name}.",
-        )
-        try:
-            await message.add_reaction(Emojis.calendar)
-        except Exception as e:
-            debug_log(
-                f"start_world_boss_task: Failed to add reaction to message for user ID {user_id}: {e}"
-            )
-        return
-    # Otherwise, create a new task for this boss
-    # Register entry BEFORE any awaits to prevent race conditions causing duplicate tasks
-    try:
-        wb_tasks[wb_name] = {
-            "time": unix_seconds,
-            "users": set([user_id]),
-            "channels": {user_id: channel},
-            "task": asyncio.create_task(world_boss_waiter(bot, unix_seconds, wb_name)),
-        }
-        pretty_log("info", f"World boss reminder task started for {wb_name}.")
-        debug_log(
-            f"start_world_boss_task: Task started for boss {wb_name} with user {user.name}"
-        )
-    except Exception as e:
-        debug_log(
-            f"start_world_boss_task: Failed to create world boss waiter task for boss {wb_name} and user {user.name}: {e}"
+            f"User ID {user_id} already registered for world boss reminder for {wb_name}.",
         )
+        return
+
+    await upsert_wb_battle_reminder(
+        bot,
+        user_id=user_id,
+        user_name=user.name,
+        wb_name=wb_name,
+        channel_id=channel.id,
+        remind_on=unix_seconds,
+    )
+    schedule_due(WORLD_BOSS, unix_seconds)
+    pretty_log(
+        "info",
+        f"World boss reminder for {wb_name} stored for user ID {user_id}.",
+    )
+    debug_log(
+        f"start_world_boss_task: Reminder stored for boss {wb_name} with user {user.name}"
+    )
     try:
         await message.add_reaction(Emojis.calendar)
     except Exception as e:
@@ -4,14 +4,15 @@ import discord
 
 from config.current_setup import STRAYMONS_GUILD_ID
 from utils.database.weekly_goal_tracker_db_func import upsert_weekly_goal
-from utils.essentials.pokemeow_helpers import get_pokemeow_reply_member
+from utils.essentials.message_dedupe import MessageDedupe
+from utils.essentials.parsed_message import ParsedPokeMeowMessage
 from utils.listener_func.pokemon_caught import (
     is_saturday_1155pm_est,
     weekly_goal_checker,
 )
 from utils.loggers.pretty_logs import pretty_log
 
-processed_weekly_stats_messages = set()
+processed_weekly_stats_messages = MessageDedupe("processed_weekly_stats_messages")
 
 
 def extract_current_page_number(footer_text: str) -> int | None:
@@ -28,7 +29,12 @@ def extract_current_page_number(footer_text: str) -> int | None:
 # 🌸───────────────────────────────────────────────🌸
 # 🩷 ⏰ Weekly Stats Syncer Listener               🩷
 # 🌸───────────────────────────────────────────────🌸
-async def weekly_stats_syncer(bot, before: discord.Message, message: discord.Message):
+async def weekly_stats_syncer(
+    bot,
+    before: discord.Message,
+    message: discord.Message,
+    parsed: ParsedPokeMeowMessage | None = None,
+):
     from utils.cache.straymon_member_cache import (
         fetch_straymon_member_cache,
         fetch_straymon_member_cache_by_name,
@@ -47,9 +53,9 @@ async def weekly_stats_syncer(bot, before: discord.Message, message: discord.Mes
         bot=bot,
     )
 
-    embed = message.embeds[0]
-    embed_description = embed.description or ""
-    embed_footer = embed.footer.text or ""
+    if parsed is None:
+        parsed = ParsedPokeMeowMessage(message, before)
+    embed_description = parsed.description
 
     if is_saturday_1155pm_est():
         pretty_log(
@@ -61,7 +67,7 @@ async def weekly_stats_syncer(bot, before: discord.Message, message: discord.Mes
         return
 
     # Get replied member
-    replied_member = await get_pokemeow_reply_member(before)
+    replied_member = parsed.reply_member
 
     if not replied_member:
         return
@@ -103,8 +109,8 @@ async def weekly_stats_syncer(bot, before: discord.Message, message: discord.Mes
         return
     # Extract page number from footer
     current_page = None
-    if embed.footer and embed.footer.text:
-        current_page = extract_current_page_number(embed.footer.text)
+    if parsed.footer:
+        current_page = extract_current_page_number(parsed.footer)
     # Check if they are in the Weekly Goal Cache
     weekly_goal_info = weekly_goal_cache.get(user_id)
     if not weekly_goal_info:
@@ -1,6 +1,6 @@
 # utils/loggers/smart_debug.py
 import logging
-import inspect
+import sys
 from datetime import datetime
 
 # -----------------------------
@@ -21,38 +21,53 @@ if not logger.handlers:  # avoid duplicate handlers on reload
 # 🔹 Global Debug Toggles
 # -----------------------------
 DEBUG_TOGGLES: dict[str, bool] = {}
+# 🔹 Keys currently switched on; empty means every debug_log returns at once
+_ENABLED_KEYS: set[str] = set()
 
 
 def enable_debug(func_path: str):
     DEBUG_TOGGLES[func_path] = True
+    _ENABLED_KEYS.add(func_path)
 
 
 def disable_debug(func_path: str):
     DEBUG_TOGGLES[func_path] = False
+    _ENABLED_KEYS.discard(func_path)
 
 
 def debug_enabled(func_path: str) -> bool:
-    return DEBUG_TOGGLES.get(func_path, False)
+    return func_path in _ENABLED_KEYS
 
 
-def debug_log(message: str, highlight: bool = False, disabled: bool = False):
+def debug_log(
+    message, *args, highlight: bool = False, disabled: bool = False
+):
     """
     Logs a debug message if enabled for the calling function/module.
     Optional `highlight=True` will make the entire line stand out.
     Optional `disabled=True` will skip logging even if debug is enabled.
+
+    Formatting is lazy: pass `%`-style args (`debug_log("Got %s", name)`)
+    or a zero-arg callable returning the text, and nothing is formatted
+    unless the caller's toggle is on. With no toggles on at all the call
+    returns before the caller is even looked up.
     """
-    if disabled:
+    if disabled or not _ENABLED_KEYS:
         return
 
-    stack = inspect.stack()
-    caller_frame = stack[1]
-    func_name = caller_frame.function
-    module_name = caller_frame.frame.f_globals.get("__name__", "__main__")
-    key = f"{module_name}.{func_name}"
+    # 🔹 One frame hop instead of inspect.stack(), which reads source files
+    caller = sys._getframe(1)
+    func_name = caller.f_code.co_name
+    key = f"{caller.f_globals.get('__name__', '__main__')}.{func_name}"
 
-    if not debug_enabled(key):
+    if key not in _ENABLED_KEYS:
         return
 
+    if callable(message):
+        message = message()
+    elif args:
+        message = message % args
+
     now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     log_line = f"[{now}] [🧪 {func_name}] {message}"
 
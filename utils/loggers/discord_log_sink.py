@@ -0,0 +1,233 @@
+# 🪵 utils.loggers.pretty_logs import discord_log_sink
+#
+# Bounded, batched shipper for the warn/error/critical lines pretty_log
+# mirrors to the Discord log channel. pretty_log only queues; one worker
+# task drains every few seconds, merges duplicates, packs lines into as
+# few 2000-character messages as possible and sends them one at a time.
+# When the queue is full new lines are dropped and counted, and the count
+# is reported in the next batch. flush() ships whatever is left on shutdown.
+
+import asyncio
+import time
+import traceback
+from collections import deque
+
+import discord
+
+MESSAGE_LIMIT = 2000
+EMBEDS_PER_MESSAGE = 10
+EMBED_CHARS_PER_MESSAGE = 6000  # Discord's cap on all embeds of one message
+
+
+# -------------------- 🧺 Queue Entry --------------------
+class _LogEntry:
+    __slots__ = ("key", "text", "embed", "count")
+
+    def __init__(self, key, text: str = "", embed: discord.Embed | None = None):
+        self.key = key
+        self.text = text
+        self.embed = embed
+        self.count = 1
+
+    def render(self) -> str:
+        text = self.text
+        if self.count > 1:
+            text = f"🔁 ×{self.count} {text}"
+        if len(text) > MESSAGE_LIMIT:
+            text = text[: MESSAGE_LIMIT - 3] + "..."
+        return text
+
+
+# -------------------- 🚚 Log Sink --------------------
+class DiscordLogSink:
+    """
+    Queue-backed Discord log channel writer.
+
+    - max_queue: lines held before new ones are dropped
+    - flush_interval: seconds between drains (lines in that window share messages)
+    - dedupe_window: seconds a sent line is remembered; repeats inside it are
+      only counted and reported once as a summary line when the window ends
+    - send_interval: pause between consecutive sends of one drain
+    """
+
+    def __init__(
+        self,
+        channel_id: int,
+        *,
+        max_queue: int = 200,
+        flush_interval: float = 3.0,
+        dedupe_window: float = 60.0,
+        send_interval: float = 1.0,
+    ):
+        self.channel_id = channel_id
+        self.max_queue = max_queue
+        self.flush_interval = flush_interval
+        self.dedupe_window = dedupe_window
+        self.send_interval = send_interval
+
+        self.bot = None
+        self.dropped = 0
+        self.sent_messages = 0
+        self._queue: deque[_LogEntry] = deque()
+        self._pending: dict = {}  # key → queued entry
+        self._recent: dict = {}  # key → [sent_at, repeats, text]
+        self._task: asyncio.Task | None = None
+        self._send_lock = asyncio.Lock()
+
+    # 🔹 Producer side (sync, never blocks)
+    def submit(self, bot, key, text: str = "", trace=None):
+        """
+        Queues one line. `trace` is an optional callable returning a traceback
+        string; it is only called when the line is actually queued.
+        """
+        self.bot = self.bot or bot
+        if self._coalesce(key):
+            return
+        if trace:
+            text = f"{text}\n```py\n{trace()}```"
+        self._enqueue(_LogEntry(key, text=text))
+
+    def submit_embed(self, bot, key, embed: discord.Embed):
+        self.bot = self.bot or bot
+        if self._coalesce(key):
+            return
+        self._enqueue(_LogEntry(key, embed=embed))
+
+    def _coalesce(self, key) -> bool:
+        """Returns True if the line was merged into a queued or recently sent one."""
+        pending = self._pending.get(key)
+        if pending:
+            pending.count += 1
+            return True
+        recent = self._recent.get(key)
+        if recent and time.monotonic() - recent[0] < self.dedupe_window:
+            recent[1] += 1
+            return True
+        return False
+
+    def _enqueue(self, entry: _LogEntry):
+        if len(self._queue) >= self.max_queue:
+            self.dropped += 1
+            return
+        self._queue.append(entry)
+        self._pending[entry.key] = entry
+
+    # 🔹 Consumer side
+    def start(self, bot):
+        """Starts the drain worker once; safe to call repeatedly."""
+        self.bot = bot
+        if self._task and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._worker())
+
+    async def _worker(self):
+        await self.bot.wait_until_ready()
+        while not self.bot.is_closed():
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception:
+                print("[❌ ERROR] Discord log sink flush failed:")
+                traceback.print_exc()
+
+    def _drain(self) -> tuple[list[str], list[discord.Embed]]:
+        now = time.monotonic()
+        lines: list[str] = []
+        embeds: list[discord.Embed] = []
+
+        if self.dropped:
+            lines.append(f"⚠️ Log queue full — dropped {self.dropped} line(s)")
+            self.dropped = 0
+
+        # 🔹 Report repeats of lines whose dedupe window has ended
+        for key, (sent_at, repeats, text) in list(self._recent.items()):
+            if now - sent_at < self.dedupe_window:
+                continue
+            del self._recent[key]
+            if repeats:
+                summary = text.split("\n", 1)[0][:300]
+                lines.append(
+                    f"🔁 ×{repeats} more in the last {int(self.dedupe_window)}s: {summary}"
+                )
+
+        while self._queue:
+            entry = self._queue.popleft()
+            self._pending.pop(entry.key, None)
+            self._recent[entry.key] = [now, 0, entry.text or entry.key[-1]]
+            if entry.embed is not None:
+                embeds.append(entry.embed)
+            else:
+                lines.append(entry.render())
+        return lines, embeds
+
+    @staticmethod
+    def _pack(lines: list[str]) -> list[str]:
+        """Joins lines into as few messages under the Discord limit as possible."""
+        messages: list[str] = []
+        current = ""
+        for line in lines:
+            candidate = f"{current}\n{line}" if current else line
+            if len(candidate) <= MESSAGE_LIMIT:
+                current = candidate
+                continue
+            if current:
+                messages.append(current)
+            current = line
+        if current:
+            messages.append(current)
+        return messages
+
+    @staticmethod
+    def _pack_embeds(embeds: list[discord.Embed]) -> list[list[discord.Embed]]:
+        """Groups embeds, in order, under both the count and the total size cap."""
+        groups: list[list[discord.Embed]] = []
+        current: list[discord.Embed] = []
+        current_chars = 0
+        for embed in embeds:
+            chars = len(embed)
+            if current and (
+                len(current) >= EMBEDS_PER_MESSAGE
+                or current_chars + chars > EMBED_CHARS_PER_MESSAGE
+            ):
+                groups.append(current)
+                current, current_chars = [], 0
+            current.append(embed)
+            current_chars += chars
+        if current:
+            groups.append(current)
+        return groups
+
+    async def flush(self):
+        """Sends everything queued right now."""
+        async with self._send_lock:
+            lines, embeds = self._drain()
+            if not lines and not embeds:
+                return
+            channel = self.bot.get_channel(self.channel_id) if self.bot else None
+            if not channel:
+                return
+
+            payloads = [{"content": text} for text in self._pack(lines)]
+            for group in self._pack_embeds(embeds):
+                payloads.append({"embeds": group})
+
+            for index, payload in enumerate(payloads):
+                if index:
+                    await asyncio.sleep(self.send_interval)
+                try:
+                    await channel.send(**payload)
+                    self.sent_messages += 1
+                except Exception:
+                    print("[❌ ERROR] Failed to send log to bot channel:")
+                    traceback.print_exc()
+
+    async def close(self):
+        """Stops the worker and ships the remaining lines."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+        self._task = None
+        # 🔹 Flush twice so repeat summaries still inside their window are sent too
+        await self.flush()
+        for recent in self._recent.values():
+            recent[0] = float("-inf")
+        await self.flush()
@@ -6,6 +6,8 @@ from datetime import datetime
 import discord
 from discord.ext import commands
 
+from utils.loggers.discord_log_sink import DiscordLogSink
+
 # -------------------- 🐭 Global Bot Reference --------------------
 BOT_INSTANCE: commands.Bot | None = None
 
@@ -51,6 +53,9 @@ CRITICAL_LOG_CHANNEL_ID = (
     1410202143570530375  # TODO: replace with your Minccino error log channel
 )
 
+# 🔹 Batched, bounded writer for that channel (started by cogs/events/log_sink.py)
+discord_log_sink = DiscordLogSink(CRITICAL_LOG_CHANNEL_ID)
+
 
 # -------------------- 🌸 Main Pretty Log --------------------
 def main_pretty_log(message: str, level: str = "info", emoji: str = "💙"):
@@ -107,19 +112,20 @@ def pretty_log(
 
     bot_to_use = bot or BOT_INSTANCE
 
-    # Send to Discord channel if needed
+    # Queue for the Discord log channel if needed
     if bot_to_use and tag in ("critical", "error", "warn"):
         try:
-            channel = bot_to_use.get_channel(CRITICAL_LOG_CHANNEL_ID)
-            if channel:
-                full_message = f"{prefix_part}{label_str}{message}"
-                if include_trace and tag in ("error", "critical"):
-                    full_message += f"\n```py\n{traceback.format_exc()}```"
-                if len(full_message) > 2000:
-                    full_message = full_message[:1997] + "..."
-                bot_to_use.loop.create_task(channel.send(full_message))
+            trace = None
+            if include_trace and tag in ("error", "critical"):
+                trace = traceback.format_exc
+            discord_log_sink.submit(
+                bot_to_use,
+                (tag, label, message),
+                f"{prefix_part}{label_str}{message}",
+                trace=trace,
+            )
         except Exception:
-            print("[❌ ERROR] Failed to send log to bot channel:")
+            print("[❌ ERROR] Failed to queue log for bot channel:")
             traceback.print_exc()
 
 
@@ -160,25 +166,23 @@ def log_ui_error(
 
     if bot_to_use:
         try:
-            channel = bot_to_use.get_channel(CRITICAL_LOG_CHANNEL_ID)
-            if channel:
-                embed = discord.Embed(
-                    title=f"⚠️ UI Error Logged [{label}]",
-                    description=f"{location_info or '*No interaction data*'}",
-                    color=0xFF5555,
+            embed = discord.Embed(
+                title=f"⚠️ UI Error Logged [{label}]",
+                description=f"{location_info or '*No interaction data*'}",
+                color=0xFF5555,
+            )
+            if include_trace:
+                trace_text = "".join(
+                    traceback.format_exception(type(error), error, error.__traceback__)
+                )
+                if len(trace_text) > 1000:
+                    trace_text = trace_text[:1000] + "..."
+                embed.add_field(
+                    name="Traceback", value=f"```py\n{trace_text}```", inline=False
                 )
-                if include_trace:
-                    trace_text = "".join(
-                        traceback.format_exception(
-                            type(error), error, error.__traceback__
-                        )
-                    )
-                    if len(trace_text) > 1000:
-                        trace_text = trace_text[:1000] + "..."
-                    embed.add_field(
-                        name="Traceback", value=f"```py\n{trace_text}```", inline=False
-                    )
-                bot_to_use.loop.create_task(channel.send(embed=embed))
+            discord_log_sink.submit_embed(
+                bot_to_use, ("ui", label, location_info, repr(error)), embed
+            )
         except Exception:
-            print("[❌ ERROR] Failed to send UI error to bot log channel:")
+            print("[❌ ERROR] Failed to queue UI error for bot log channel:")
             traceback.print_exc()